@@ -0,0 +1,101 @@
+"""
+Throughput and event loop latency of parsing an instrument feed.
+
+Starts a fake instrument in-process that streams "VOLT 3.300V" style lines
+over a local TCP connection, and consumes it with iter_stream() and with
+parsing each line on the event loop. While the feed is parsed, a heartbeat
+task measures how late the loop wakes it up; parsing on the loop delays it
+by whole batches, the executor keeps it near the timer resolution.
+
+Run with ``python benchmarks/bench_aio.py [lines]``.
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from engineering_notation import EngUnit
+from engineering_notation.aio import BATCH_SIZE, iter_stream
+
+HEARTBEAT = 0.001
+CHUNK = 1 << 16
+
+
+def feed(count, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        kind, unit = rng.choice([("VOLT", "V"), ("CURR", "mA"), ("FREQ", "kHz")])
+        lines.append(f"{kind} {rng.uniform(1, 999):.3f}{unit}\n")
+    return "".join(lines).encode()
+
+
+async def inline(reader):
+    rows = 0
+    batch = []
+    while line := await reader.readline():
+        batch.append(EngUnit(line.split()[-1].decode()))
+        if len(batch) == BATCH_SIZE:
+            rows += len(batch)
+            batch = []
+    return rows + len(batch)
+
+
+async def executor(reader):
+    rows = 0
+    async for batch in iter_stream(reader):
+        rows += len(batch)
+    return rows
+
+
+async def heartbeat(lags, done):
+    loop = asyncio.get_running_loop()
+    while not done.is_set():
+        expected = loop.time() + HEARTBEAT
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(loop.time() - expected)
+
+
+async def run(consume, data):
+    async def instrument(reader, writer):
+        for start in range(0, len(data), CHUNK):
+            writer.write(data[start : start + CHUNK])
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(instrument, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        lags = []
+        done = asyncio.Event()
+        beat = asyncio.create_task(heartbeat(lags, done))
+
+        start = time.perf_counter()
+        rows = await consume(reader)
+        elapsed = time.perf_counter() - start
+
+        done.set()
+        await beat
+        writer.close()
+    return rows, elapsed, lags
+
+
+def main(count=200_000):
+    data = feed(count)
+    print(f"{count} lines; heartbeat lag in ms")
+    print(f"{'':<10}{'rows/s':>12}{'p50':>9}{'p99':>9}{'max':>9}")
+    for name, consume in (("inline", inline), ("executor", executor)):
+        rows, elapsed, lags = asyncio.run(run(consume, data))
+        assert rows == count
+        lags.sort()
+        p50 = statistics.median(lags) * 1e3
+        p99 = lags[int(len(lags) * 0.99)] * 1e3 if lags else 0.0
+        worst = lags[-1] * 1e3 if lags else 0.0
+        print(f"{name:<10}{rows / elapsed:>12.0f}{p50:>9.2f}{p99:>9.2f}{worst:>9.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
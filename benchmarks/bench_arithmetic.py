@@ -0,0 +1,75 @@
+"""
+Per-operation cost of EngNumber/EngUnit arithmetic.
+
+Compares the operators against the previous implementation, which rebuilt
+every result by formatting the Decimal to a string and parsing it again.
+
+Run with ``python benchmarks/bench_arithmetic.py``.
+"""
+
+import operator
+import timeit
+
+from engineering_notation import EngNumber, EngUnit
+
+OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+}
+
+
+def legacy_eng_number(op, a, b):
+    return EngNumber(str(op(a.number, b.number)))
+
+
+def legacy_eng_unit(op, a, b):
+    unit = a.unit if a.unit else ""
+    return EngUnit(str(op(a.eng_num.number, b.eng_num.number)) + unit)
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+
+
+def main(number=20000):
+    a, b = EngNumber("4.7k"), EngNumber("220")
+    ua, ub = EngUnit("4.7kohm"), EngUnit("220ohm")
+
+    print(f"{'operation':<22}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for name, op in OPERATORS.items():
+        rows = (
+            (
+                f"EngNumber.{name}",
+                bench(lambda: legacy_eng_number(op, a, b), number),
+                bench(lambda: op(a, b), number),
+            ),
+            (
+                f"EngUnit.{name}",
+                bench(lambda: legacy_eng_unit(op, ua, ub), number),
+                bench(lambda: op(ua, ub), number),
+            ),
+        )
+        for label, legacy, current in rows:
+            print(
+                f"{label:<22}{legacy:>12.0f}{current:>12.0f}{legacy / current:>9.1f}x"
+            )
+
+    values = [EngUnit(f"{i}mA") for i in range(1000)]
+    legacy = bench(lambda: _legacy_sum(values), 20)
+    current = bench(lambda: sum(values[1:], values[0]), 20)
+    print(
+        f"{'sum(1000 EngUnit)':<22}{legacy:>12.0f}{current:>12.0f}{legacy / current:>9.1f}x"
+    )
+
+
+def _legacy_sum(values):
+    total = values[0]
+    for value in values[1:]:
+        total = legacy_eng_unit(operator.add, total, value)
+    return total
+
+
+if __name__ == "__main__":
+    main()
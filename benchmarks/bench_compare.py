@@ -0,0 +1,67 @@
+"""
+Cost of sorting EngNumber values mixed with plain numbers.
+
+Compares sorted() over a mix of EngNumber, int, float and Decimal values
+against the previous comparison operators, which built a temporary
+EngNumber for every non-EngNumber operand.
+
+Run with ``python benchmarks/bench_compare.py [count]``.
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+
+from engineering_notation import EngNumber
+
+
+class LegacyEngNumber(EngNumber):
+    def __lt__(self, other):
+        if not isinstance(other, EngNumber):
+            other = EngNumber(other)
+        return self.number < other.number
+
+    def __gt__(self, other):
+        if not isinstance(other, EngNumber):
+            other = EngNumber(other)
+        return self.number > other.number
+
+
+def mixed_values(cls, count, seed=0):
+    rng = random.Random(seed)
+    values = []
+    for i in range(count):
+        value = rng.randrange(1, 10**9)
+        kind = i % 4
+        if kind == 0:
+            values.append(cls(value))
+        elif kind == 1:
+            values.append(value)
+        elif kind == 2:
+            values.append(value / 1000)
+        else:
+            values.append(Decimal(value) / 1000)
+    return values
+
+
+def bench(cls, count):
+    values = mixed_values(cls, count)
+    start = time.perf_counter()
+    result = sorted(values)
+    elapsed = time.perf_counter() - start
+    return elapsed, result
+
+
+def main(count=1_000_000):
+    legacy, legacy_sorted = bench(LegacyEngNumber, count)
+    current, current_sorted = bench(EngNumber, count)
+    assert [float(v) for v in legacy_sorted] == [float(v) for v in current_sorted]
+
+    print(f"sorted() over {count} mixed values")
+    print(f"{'legacy':<10}{legacy:>10.2f} s")
+    print(f"{'current':<10}{current:>10.2f} s{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""
+Streaming CSV and memory-mapped parse rates.
+
+Writes a synthetic measurement log and reports rows per second for
+iter_parse() producing EngUnit objects and floats, then compares
+parse_mmap() with parsing a newline-delimited file line by line.
+
+Run with ``python benchmarks/bench_io.py [rows]``.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from engineering_notation import EngNumber
+from engineering_notation.io import ParseStats, iter_parse, parse_mmap
+
+
+def write_log(path, rows):
+    rng = random.Random(0)
+    with open(path, "w") as handle:
+        handle.write("time,voltage,current\n")
+        for i in range(rows):
+            volts = rng.choice(["3.3V", "3.31V", "3.29V", "5V", "4.98V"])
+            amps = f"{rng.uniform(1, 999):.1f}mA"
+            handle.write(f"{i}m,{volts},{amps}\n")
+
+
+def main(rows=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "log.csv"
+        write_log(path, rows)
+        for as_float in (False, True):
+            stats = ParseStats()
+            for _ in iter_parse(
+                path, ["voltage", "current"], as_float=as_float, stats=stats
+            ):
+                pass
+            label = "floats" if as_float else "EngUnit"
+            print(
+                f"{label:<8}{stats.rows:>10} rows {stats.rows_per_second:>12.0f} rows/s"
+            )
+
+        lines = Path(tmp) / "values.txt"
+        rng = random.Random(1)
+        with open(lines, "w") as handle:
+            for _ in range(rows):
+                handle.write(f"{rng.uniform(1, 999):.2f}{rng.choice('pnumkMG')}\n")
+
+        start = time.perf_counter()
+        with open(lines) as handle:
+            values = [float(EngNumber(line.rstrip("\n"))) for line in handle]
+        per_line = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mapped = parse_mmap(lines)
+        single_pass = time.perf_counter() - start
+
+        assert mapped.tolist() == values
+        print(f"{'lines':<8}{rows:>10} rows {rows / per_line:>12.0f} rows/s")
+        print(f"{'mmap':<8}{rows:>10} rows {rows / single_pass:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Scaling of format_many() and parse_many() with the number of workers.
+
+Run with ``python benchmarks/bench_parallel.py [values]``. Worker counts
+double from 1 up to the number of CPUs (at least 8).
+"""
+
+import os
+import random
+import sys
+import time
+
+from engineering_notation.parallel import format_many, parse_many
+
+
+def worker_counts():
+    counts, workers = [], 1
+    while workers <= max(8, os.cpu_count() or 1):
+        counts.append(workers)
+        workers *= 2
+    return counts
+
+
+def main(count=1_000_000):
+    rng = random.Random(0)
+    values = [rng.uniform(-1, 1) * 10 ** rng.randint(-12, 12) for _ in range(count)]
+
+    expected = None
+    serial = {}
+    print(f"{'workers':>8}{'format s':>10}{'speedup':>9}{'parse s':>10}{'speedup':>9}")
+    for workers in worker_counts():
+        start = time.perf_counter()
+        strings = format_many(values, workers=workers)
+        format_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parse_many(strings, workers=workers, as_float=True)
+        parse_time = time.perf_counter() - start
+
+        if expected is None:
+            expected = strings
+            serial = {"format": format_time, "parse": parse_time}
+        assert strings == expected
+
+        print(
+            f"{workers:>8}{format_time:>10.2f}{serial['format'] / format_time:>8.1f}x"
+            f"{parse_time:>10.2f}{serial['parse'] / parse_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
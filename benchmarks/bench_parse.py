@@ -0,0 +1,70 @@
+"""
+Cost of parsing engineering strings.
+
+Compares the single-pass tokenizer against the previous parser, which
+matched the number with a regex, sliced off the unit and then scanned every
+SI prefix. The parse cache is bypassed so each call does the full work.
+
+Run with ``python benchmarks/bench_parse.py``.
+"""
+
+import timeit
+from decimal import Decimal
+
+from engineering_notation.eng_notation import (
+    _NUM_RE,
+    _parse_uncached,
+    _prefix_scale,
+    _suffix_keys,
+)
+
+INPUTS = {
+    "short": "10k",
+    "short unit": "4.7kohm",
+    "exponent": "-1.5e-12",
+    "long": "-123456.78901234567890123456789MHz",
+    "long unit": "2.2uF_ceramic_0603_x7r_50V_10pct",
+    "malformed": "1e3k",
+    "no number": "ohm",
+}
+
+
+def legacy_parse(value):
+    match = _NUM_RE.match(value)
+    if match is None:
+        numeric_part, unit = "", value or None
+    else:
+        numeric = match.group(0)
+        rest = value[len(numeric) :]
+        suffix = ""
+        if rest and rest[0] in _suffix_keys:
+            suffix = rest[0]
+            rest = rest[1:]
+        numeric_part, unit = numeric + suffix, rest if rest else None
+    for suffix in _suffix_keys:
+        if suffix == numeric_part[-1]:
+            numeric_part = numeric_part[:-1] + f"e{_prefix_scale[suffix]}"
+            break
+    return Decimal(numeric_part), unit
+
+
+def bench(func, value, number):
+    def call():
+        try:
+            func(value)
+        except (ArithmeticError, IndexError):
+            pass
+
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9
+
+
+def main(number=50000):
+    print(f"{'input':<14}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for label, value in INPUTS.items():
+        legacy = bench(legacy_parse, value, number)
+        current = bench(_parse_uncached, value, number)
+        print(f"{label:<14}{legacy:>12.0f}{current:>12.0f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Cost of reducing a list of EngUnit values.
+
+Compares the builtin sum(), which builds a new EngUnit for every element,
+with engineering_notation.stats, which checks units and accumulates in a
+single number before wrapping the result.
+
+Run with ``python benchmarks/bench_stats.py [count]``.
+"""
+
+import random
+import sys
+import time
+
+from engineering_notation import EngUnit
+from engineering_notation.stats import RunningStats, mean, total
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(count=200_000):
+    rng = random.Random(0)
+    values = [EngUnit(f"{rng.uniform(1, 999):.2f}mV") for _ in range(count)]
+
+    builtin, expected = timed(lambda: sum(values[1:], values[0]))
+    reduced, result = timed(total, values)
+    assert result == expected
+
+    mean_time, _ = timed(mean, values)
+    running, _ = timed(lambda: RunningStats(values).stddev)
+
+    print(f"reductions over {count} EngUnit values")
+    print(f"{'sum()':<14}{builtin:>10.3f} s")
+    print(f"{'total()':<14}{reduced:>10.3f} s{builtin / reduced:>9.1f}x")
+    print(f"{'mean()':<14}{mean_time:>10.3f} s")
+    print(f"{'RunningStats':<14}{running:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,171 @@
+"""
+Performance suite for the core EngNumber/EngUnit operations.
+
+Times parsing, formatting, arithmetic and comparisons, prints the cost of
+each case in nanoseconds and compares it against a stored baseline. Cases
+that are slower than the baseline by more than the threshold are reported
+as regressions and make the script exit with status 1.
+
+Run with ``python benchmarks/suite.py``; add ``--save-baseline`` to record
+the current results as the new baseline, or ``--save results.json`` to keep
+a copy of a run.
+"""
+
+import argparse
+import json
+import operator
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+from engineering_notation import EngNumber, EngUnit, set_parse_cache_size
+from engineering_notation.eng_notation import PARSE_CACHE_SIZE
+
+BASELINE = Path(__file__).with_name("baseline.json")
+THRESHOLD = 0.10
+
+UNIT_OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "le": operator.le,
+    "ge": operator.ge,
+    "eq": operator.eq,
+}
+
+
+def _uncached_repr(value):
+    # __repr__ caches its result on the instance; drop it so the
+    # formatting itself is measured
+    value._repr = None
+    return repr(value)
+
+
+def _uncached_parse(string, number):
+    set_parse_cache_size(0)
+    try:
+        best = min(timeit.repeat(lambda: EngNumber(string), number=number, repeat=5))
+        return best / number * 1e9
+    finally:
+        set_parse_cache_size(PARSE_CACHE_SIZE)
+
+
+def cases():
+    """
+    Return the benchmark cases.
+
+    Returns:
+        Dict mapping case names to zero-argument callables.
+    """
+    number = EngNumber("4.7k")
+    precise = EngNumber("4.7123k", precision=3)
+    significant = EngNumber("4.7123k", significant=4)
+    pn = EngNumber("4.7k")
+    ua, ub = EngUnit("4.7kohm"), EngUnit("220ohm")
+
+    result = {
+        "EngNumber(str)": lambda: EngNumber("4.7k"),
+        "EngNumber(float)": lambda: EngNumber(4700.0),
+        "EngNumber(int)": lambda: EngNumber(4700),
+        "EngUnit(str)": lambda: EngUnit("4.7kohm"),
+        "repr(default)": lambda: _uncached_repr(number),
+        "repr(precision=3)": lambda: _uncached_repr(precise),
+        "repr(significant=4)": lambda: _uncached_repr(significant),
+        "to_pn": lambda: pn.to_pn(),
+        "EngNumber < int": lambda: number < 5000,
+        "EngNumber < str": lambda: number < "5k",
+        "EngNumber == int": lambda: number == 4700,
+        "EngNumber == str": lambda: number == "4.7k",
+        "EngUnit < str": lambda: ua < "5kohm",
+        "EngUnit == str": lambda: ua == "4.7kohm",
+    }
+    for name, op in UNIT_OPERATORS.items():
+        result[f"EngUnit.{name}"] = lambda op=op: op(ua, ub)
+    return result
+
+
+def run(number):
+    """
+    Time every case.
+
+    Args:
+        number: Calls per timing repeat.
+
+    Returns:
+        Dict mapping case names to the best time per call in nanoseconds.
+    """
+    results = {}
+    for name, func in cases().items():
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        results[name] = best / number * 1e9
+    results["EngNumber(str) uncached"] = _uncached_parse("4.7k", number)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the results next to the baseline.
+
+    Args:
+        results: Current timings in nanoseconds.
+        baseline: Baseline timings in nanoseconds.
+        threshold: Relative slowdown treated as a regression.
+
+    Returns:
+        Names of the cases that regressed.
+    """
+    regressions = []
+    print(f"{'case':<28}{'baseline ns':>13}{'current ns':>12}{'change':>9}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<28}{'-':>13}{current:>12.0f}{'new':>9}")
+            continue
+        change = current / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<28}{before:>13.0f}{current:>12.0f}{change:>+9.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--save", type=Path, help="write this run to a JSON file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="replace the stored baseline"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.number)
+    document = {"python": platform.python_version(), "results": results}
+
+    if args.save:
+        args.save.write_text(json.dumps(document, indent=2) + "\n")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than baseline by >{args.threshold:.0%}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
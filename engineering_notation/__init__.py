@@ -1,4 +1,41 @@
-from engineering_notation.eng_notation import EngNumber, EngUnit
-from engineering_notation.version import __version__
+from engineering_notation.eng_notation import (
+    EngNumber,
+    EngUnit,
+    clear_parse_cache,
+    get_default_backend,
+    parse_cache_info,
+    set_default_backend,
+    set_parse_cache_size,
+)
+from engineering_notation.index import EngIndex
+from engineering_notation.table import format_table
+from engineering_notation.units import conversion_factor, register_unit
+from engineering_notation.vectorized import EngArray, format_array, parse_array
 
-__all__ = ["EngNumber", "EngUnit", "__version__"]
+__all__ = [
+    "EngArray",
+    "EngIndex",
+    "EngNumber",
+    "EngUnit",
+    "__version__",
+    "clear_parse_cache",
+    "conversion_factor",
+    "format_array",
+    "format_table",
+    "get_default_backend",
+    "parse_array",
+    "parse_cache_info",
+    "register_unit",
+    "set_default_backend",
+    "set_parse_cache_size",
+]
+
+
+def __getattr__(name: str) -> str:
+    # importlib.metadata is slow to import, so the version is only looked
+    # up when it is asked for
+    if name == "__version__":
+        from engineering_notation.version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
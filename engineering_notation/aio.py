@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+from concurrent.futures import Executor
+from typing import Any
+
+from engineering_notation.eng_notation import EngUnit, _parse
+from engineering_notation.io import ParseStats
+
+BATCH_SIZE = 256
+
+
+def _parse_lines(
+    lines: Sequence[bytes], as_float: bool, first_line: int
+) -> list[EngUnit] | list[float]:
+    """
+    Parse the last token of each line; runs in the executor.
+
+    Args:
+        lines: Raw lines read from the stream.
+        as_float: Return floats instead of EngUnit objects.
+        first_line: One-based line number of the first line, for errors.
+
+    Returns:
+        Parsed values in stream order; blank lines are skipped.
+
+    Raises:
+        ValueError: If a value cannot be parsed.
+    """
+    values: list[Any] = []
+    for number, line in enumerate(lines, first_line):
+        tokens = line.split()
+        if not tokens:
+            continue
+        token = tokens[-1].decode()
+        try:
+            if as_float:
+                values.append(float(_parse(token)[0]))
+            else:
+                values.append(EngUnit(token))
+        except (ArithmeticError, ValueError) as exc:
+            raise ValueError(f"line {number}: cannot parse {token!r}") from exc
+    return values
+
+
+async def _read_batch(
+    reader: asyncio.StreamReader, batch_size: int, max_delay: float | None
+) -> list[bytes]:
+    """
+    Read up to batch_size lines from a stream.
+
+    Args:
+        reader: Stream to read from.
+        batch_size: Maximum number of lines.
+        max_delay: Seconds to wait for another line once the batch holds at
+            least one, or None to wait for a full batch.
+
+    Returns:
+        Lines read; fewer than batch_size at end of stream or after a pause
+        longer than max_delay, and empty at end of stream.
+    """
+    lines: list[bytes] = []
+    while len(lines) < batch_size:
+        if lines and max_delay is not None:
+            try:
+                line = await asyncio.wait_for(reader.readline(), max_delay)
+            except TimeoutError:
+                break
+        else:
+            line = await reader.readline()
+        if not line:
+            break
+        lines.append(line)
+    return lines
+
+
+async def iter_stream(
+    reader: asyncio.StreamReader,
+    *,
+    as_float: bool = False,
+    batch_size: int = BATCH_SIZE,
+    max_delay: float | None = None,
+    executor: Executor | None = None,
+    stats: ParseStats | None = None,
+) -> AsyncIterator[list[EngUnit] | list[float]]:
+    """
+    Parse engineering values out of a line-oriented stream in batches.
+
+    Each line holds a value as its last whitespace-separated token, such as
+    "VOLT 3.300V", parsed with the same rules as EngUnit strings. Batches
+    are parsed in an executor so the event loop keeps running, while the
+    next batch is read; at most one batch is read ahead of the consumer,
+    so a slow consumer stops reading and the stream's flow control pushes
+    back on the sender.
+
+    Args:
+        reader: Stream to read lines from.
+        as_float: Yield floats instead of EngUnit objects.
+        batch_size: Maximum number of lines per batch.
+        max_delay: Seconds to wait for more lines before yielding a partial
+            batch, for feeds that pause; None waits for full batches.
+        executor: Executor to parse in; None uses the loop's default
+            executor. A ProcessPoolExecutor also works.
+        stats: Optional ParseStats updated with rows parsed and elapsed time.
+
+    Yields:
+        Lists of parsed values, in stream order.
+
+    Raises:
+        ValueError: If a value cannot be parsed.
+    """
+    loop = asyncio.get_running_loop()
+    if stats is None:
+        stats = ParseStats()
+    start = time.perf_counter() - stats.seconds
+    line_number = 1
+
+    lines = await _read_batch(reader, batch_size, max_delay)
+    read = None
+    try:
+        while lines:
+            pending = loop.run_in_executor(
+                executor, _parse_lines, lines, as_float, line_number
+            )
+            line_number += len(lines)
+            # the next batch is read while this one is parsed and consumed
+            read = asyncio.ensure_future(_read_batch(reader, batch_size, max_delay))
+            values = await pending
+
+            if values:
+                stats.rows += len(values)
+                stats.seconds = time.perf_counter() - start
+                yield values
+                start = time.perf_counter() - stats.seconds
+            lines = await read
+    finally:
+        if read is not None:
+            read.cancel()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from typing import Any
+
+from engineering_notation.eng_notation import EngNumber, EngUnit, _parse
+from engineering_notation.vectorized import _require_numpy
+
+Value = str | int | float | Decimal | EngNumber | EngUnit
+
+
+class EngColumn:
+    """
+    Column of engineering values in contiguous, shareable buffers.
+
+    Values are stored in a float64 array and units are dictionary encoded:
+    each row holds an int32 code into a small table of unit strings. Both
+    buffers can be read without copying, through the buffer protocol
+    (Python 3.12+), memoryviews, numpy or the Arrow C data interface.
+    """
+
+    __slots__ = ("_codes", "_lookup", "_units", "_values")
+
+    def __init__(self, values: Iterable[Value] = ()) -> None:
+        """
+        Initialize the column.
+
+        Args:
+            values: EngUnit, EngNumber, engineering strings or numbers.
+        """
+        self._values = array("d")
+        self._codes = array("i")
+        self._units: list[str] = []
+        self._lookup: dict[str, int] = {}
+        self.extend(values)
+
+    def append(self, value: Value) -> None:
+        """
+        Append a value.
+
+        Args:
+            value: EngUnit, EngNumber, engineering string or number.
+
+        Raises:
+            BufferError: If the buffers are currently exported.
+        """
+        if isinstance(value, EngUnit):
+            number, unit = value.eng_num.number, value.unit
+        elif isinstance(value, EngNumber):
+            number, unit = value.number, None
+        elif isinstance(value, str):
+            number, unit = _parse(value)
+        else:
+            number, unit = value, None
+
+        unit = unit or ""
+        code = self._lookup.get(unit)
+        if code is None:
+            code = self._lookup[unit] = len(self._units)
+            self._units.append(unit)
+
+        self._values.append(float(number))
+        self._codes.append(code)
+
+    def extend(self, values: Iterable[Value]) -> None:
+        """
+        Append several values.
+
+        Args:
+            values: EngUnit, EngNumber, engineering strings or numbers.
+
+        Raises:
+            BufferError: If the buffers are currently exported.
+        """
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        """
+        Return the number of values.
+
+        Returns:
+            Number of rows in the column.
+        """
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> EngNumber | EngUnit:
+        """
+        Return a single value.
+
+        Args:
+            index: Row index.
+
+        Returns:
+            EngUnit for values with a unit, otherwise EngNumber.
+        """
+        unit = self._units[self._codes[index]]
+        if unit:
+            return EngUnit(self._values[index], unit=unit)
+        return EngNumber(self._values[index])
+
+    def __iter__(self) -> Iterator[EngNumber | EngUnit]:
+        """
+        Iterate over the values.
+
+        Returns:
+            Iterator of EngUnit or EngNumber values.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def values(self) -> memoryview:
+        """
+        Read-only float64 view of the values, without units.
+        """
+        return memoryview(self._values).toreadonly()
+
+    @property
+    def codes(self) -> memoryview:
+        """
+        Read-only int32 view of each row's index into units.
+        """
+        return memoryview(self._codes).toreadonly()
+
+    @property
+    def units(self) -> tuple[str | None, ...]:
+        """
+        Unit dictionary; None stands for unitless rows.
+        """
+        return tuple(unit or None for unit in self._units)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Export the values through the buffer protocol (Python 3.12+).
+
+        Args:
+            flags: Buffer request flags.
+
+        Returns:
+            Read-only float64 memoryview of the values.
+        """
+        return self.values
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        """
+        Release a buffer obtained from __buffer__.
+
+        Args:
+            view: The memoryview being released.
+        """
+        view.release()
+
+    def to_numpy(self) -> Any:
+        """
+        Return the values as a numpy array sharing the column's memory.
+
+        Returns:
+            Read-only numpy.ndarray of float64.
+
+        Raises:
+            ImportError: If numpy is not available.
+        """
+        return _require_numpy().frombuffer(self.values, dtype="float64")
+
+    def to_arrow(self) -> Any:
+        """
+        Return the column as a pyarrow struct array.
+
+        The "value" field is a float64 array over the column's memory and
+        the "unit" field is a dictionary array whose indices share the
+        column's codes; unitless rows have an empty unit.
+
+        Returns:
+            pyarrow.StructArray with "value" and "unit" fields.
+
+        Raises:
+            ImportError: If pyarrow is not available.
+        """
+        try:
+            import pyarrow  # type: ignore[import-untyped]
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required to export engineering columns to Arrow"
+            ) from None
+
+        count = len(self)
+        values = pyarrow.Array.from_buffers(
+            pyarrow.float64(), count, [None, pyarrow.py_buffer(self._values)]
+        )
+        codes = pyarrow.Array.from_buffers(
+            pyarrow.int32(), count, [None, pyarrow.py_buffer(self._codes)]
+        )
+        units = pyarrow.DictionaryArray.from_arrays(
+            codes, pyarrow.array(self._units, pyarrow.string())
+        )
+        return pyarrow.StructArray.from_arrays([values, units], ["value", "unit"])
+
+    def __arrow_c_array__(self, requested_schema: object | None = None) -> Any:
+        """
+        Export the column through the Arrow PyCapsule interface.
+
+        Lets Arrow-aware libraries (pyarrow, polars, ...) import the column
+        directly, for example with ``pyarrow.array(column)``.
+
+        Args:
+            requested_schema: Schema capsule requested by the consumer.
+
+        Returns:
+            Tuple of the ArrowSchema and ArrowArray capsules.
+
+        Raises:
+            ImportError: If pyarrow is not available.
+        """
+        return self.to_arrow().__arrow_c_array__(requested_schema)
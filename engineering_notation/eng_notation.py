@@ -1,66 +1,146 @@
 from __future__ import annotations
 
-from decimal import Decimal
+import math
+import operator
 import re
-from string import digits
 import sys
+from collections.abc import Callable
+from decimal import Decimal, InvalidOperation
+from functools import _CacheInfo, lru_cache
 from types import NotImplementedType
-
-from typing import Self
-
-try:
-    import numpy
-except ImportError:
-    numpy = None
-
-_suffix_lookup = {
-    "q": "e-30",
-    "r": "e-27",
-    "y": "e-24",
-    "z": "e-21",
-    "a": "e-18",
-    "f": "e-15",
-    "p": "e-12",
-    "n": "e-9",
-    "u": "e-6",
-    "m": "e-3",
-    "": "e0",
-    "k": "e3",
-    "M": "e6",
-    "G": "e9",
-    "T": "e12",
-    "P": "e15",
-    "E": "e18",
-    "Z": "e21",
-    "R": "e27",
-    "Q": "e30",
-}
-
-_suffix_keys = tuple(key for key in _suffix_lookup.keys() if key != "")
+from typing import Any, NamedTuple, Self
+
+from engineering_notation.units import (
+    _PREFIX_OFFSET,
+    _prefix_scale,
+    _prefixes,
+    compose,
+    conversion_factor,
+)
+from engineering_notation.units import (
+    unit as _unit_of,
+)
+
+_suffix_keys = tuple(prefix for prefix in _prefix_scale if prefix)
 _NUM_RE = re.compile(r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
 
-_exponent_lookup_scaled = {
-    "-60": "q",
-    "-57": "r",
-    "-54": "y",
-    "-51": "z",
-    "-48": "a",
-    "-45": "f",
-    "-42": "p",
-    "-39": "n",
-    "-36": "u",
-    "-33": "m",
-    "-30": "",
-    "-27": "k",
-    "-24": "M",
-    "-21": "G",
-    "-18": "T",
-    "-15": "P",
-    "-12": "E",
-    "-9": "Z",
-    "-3": "R",
-    "0": "Q",
-}
+
+def _prefix(exp: int) -> str:
+    """
+    Return the SI prefix for a power of ten that is a multiple of three.
+
+    Args:
+        exp: Exponent of the value, a multiple of three.
+
+    Returns:
+        SI prefix string ("" for exponent 0).
+
+    Raises:
+        KeyError: If no prefix exists for the exponent.
+    """
+    index = exp // 3 + _PREFIX_OFFSET
+    if 0 <= index < len(_prefixes):
+        prefix = _prefixes[index]
+        if prefix is not None:
+            return prefix
+    raise KeyError(exp)
+
+
+class _FormatOptions(NamedTuple):
+    """
+    Formatting and mutability options shared by every EngNumber using the
+    same settings.
+    """
+
+    precision: int
+    precision_explicit: bool
+    significant: int
+    separator: str
+    frozen: bool
+
+
+_options_cache: dict[tuple[int, bool, int, str, bool], _FormatOptions] = {}
+
+
+def _format_options(
+    precision: int,
+    precision_explicit: bool,
+    significant: int,
+    separator: str,
+    frozen: bool = False,
+) -> _FormatOptions:
+    """
+    Return the interned formatting options for the given settings.
+
+    Args:
+        precision: Decimal places used when significant is 0.
+        precision_explicit: True when the precision was given by the caller.
+        significant: Significant digits; takes precedence over precision.
+        separator: String inserted between the numeric value and suffix.
+        frozen: True for immutable, hashable instances.
+
+    Returns:
+        Shared _FormatOptions instance.
+    """
+    key = (precision, precision_explicit, significant, separator, frozen)
+    options = _options_cache.get(key)
+    if options is None:
+        options = _options_cache.setdefault(key, _FormatOptions(*key))
+    return options
+
+
+_DEFAULT_OPTIONS = _format_options(2, False, 0, "")
+
+
+_token_re_cache: re.Pattern[str] | None = None
+
+
+def _token_re() -> re.Pattern[str]:
+    """
+    Return the pattern matching sign and mantissa, exponent, SI prefix and
+    unit in one match, compiled on first use to keep the import cheap.
+
+    Returns:
+        Compiled pattern.
+    """
+    global _token_re_cache
+    if _token_re_cache is None:
+        _token_re_cache = re.compile(
+            r"([+-]?(?:\d+\.?\d*|\.\d+))(?:[eE]([+-]?\d+))?(["
+            + "".join(_suffix_keys)
+            + r"]?)(.*)",
+            re.DOTALL,
+        )
+    return _token_re_cache
+
+
+def _tokenize(value: str) -> tuple[str, int, str | None]:
+    """
+    Split a string into its mantissa, scale exponent and unit in one pass.
+
+    Args:
+        value: Raw input string (for example, "220kHz", "1.2M", "1e-27").
+
+    Returns:
+        Tuple of (mantissa string, power of ten applied by the exponent or
+        SI prefix, unit suffix or None).
+
+    Raises:
+        InvalidOperation: If the string does not start with a number, or
+            has both an exponent and an SI prefix (for example, "1e3k").
+    """
+    match = _token_re().match(value)
+    if match is None:
+        raise InvalidOperation(f"cannot parse {value!r}: no numeric value")
+
+    mantissa, exponent, prefix, unit = match.groups()
+    if exponent is None:
+        scale = _prefix_scale[prefix]
+    elif prefix:
+        raise InvalidOperation(f"cannot parse {value!r}: exponent and SI prefix")
+    else:
+        scale = int(exponent)
+    return mantissa, scale, unit or None
 
 
 def _split_value_and_unit(value: str) -> tuple[str, str | None]:
@@ -73,18 +153,404 @@ def _split_value_and_unit(value: str) -> tuple[str, str | None]:
     Returns:
         Tuple of (numeric portion, unit suffix or None).
     """
-    match = _NUM_RE.match(value)
+    match = _token_re().match(value)
     if match is None:
         return "", value or None
+    return value[: match.start(4)], match[4] or None
+
+
+def _parse_uncached(value: str) -> tuple[Decimal, str | None]:
+    """
+    Parse a string into its numeric value and unit suffix.
+
+    Args:
+        value: Raw input string (for example, "220kHz", "1.2M", "-0.22ohm").
+
+    Returns:
+        Tuple of (Decimal value, unit suffix or None).
+
+    Raises:
+        InvalidOperation: If the string is not a valid engineering value.
+    """
+    mantissa, scale, unit = _tokenize(value)
+    if scale:
+        return Decimal(f"{mantissa}E{scale}"), unit
+    return Decimal(mantissa), unit
+
+
+PARSE_CACHE_SIZE = 4096
+
+_parse_cache = lru_cache(maxsize=PARSE_CACHE_SIZE)(_parse_uncached)
+
+
+def _parse(value: str) -> tuple[Decimal, str | None]:
+    """
+    Parse a string through the current parse cache.
+
+    Other modules import this function once, so it looks the cache up on
+    every call and keeps working after set_parse_cache_size() replaces it.
+
+    Args:
+        value: Raw input string (for example, "220kHz").
+
+    Returns:
+        Tuple of (Decimal value, unit suffix or None).
+
+    Raises:
+        InvalidOperation: If the string is not a valid engineering value.
+    """
+    return _parse_cache(value)
+
+
+def set_parse_cache_size(size: int | None) -> None:
+    """
+    Resize the string parse cache, discarding its contents and statistics.
+
+    Repeated literals (for example, "10k" or "100nF" in a BOM) are parsed
+    once and then served from a least-recently-used cache.
+
+    Args:
+        size: Maximum number of cached strings. 0 disables caching and
+            None removes the bound.
+    """
+    global _parse_cache
+    _parse_cache = lru_cache(maxsize=size)(_parse_uncached)
+
+
+def parse_cache_info() -> _CacheInfo:
+    """
+    Return statistics for the string parse cache.
+
+    Returns:
+        Named tuple of (hits, misses, maxsize, currsize).
+    """
+    return _parse_cache.cache_info()
 
-    numeric = match.group(0)
-    rest = value[len(numeric) :]
-    suffix = ""
-    if rest and rest[0] in _suffix_keys:
-        suffix = rest[0]
-        rest = rest[1:]
-    unit = rest if rest else None
-    return numeric + suffix, unit
+
+def clear_parse_cache() -> None:
+    """
+    Empty the string parse cache and reset its statistics.
+    """
+    _parse_cache.cache_clear()
+
+
+BACKENDS = ("decimal", "float")
+
+_default_backend = "decimal"
+
+
+def set_default_backend(backend: str) -> None:
+    """
+    Select the numeric backend used when a value does not specify one.
+
+    Args:
+        backend: "decimal" (exact, the default) or "float" (native floats,
+            faster but subject to binary rounding).
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    global _default_backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+    _default_backend = backend
+
+
+def get_default_backend() -> str:
+    """
+    Return the numeric backend used when a value does not specify one.
+
+    Returns:
+        "decimal" or "float".
+    """
+    return _default_backend
+
+
+def _apply(
+    op: Callable[[Decimal | float, Decimal | float], Decimal | float],
+    left: Decimal | float,
+    right: Decimal | float,
+) -> Decimal | float:
+    """
+    Apply an arithmetic operator to two stored values.
+
+    Mixing backends produces a float, just as mixing Decimal and float
+    values would if Python allowed it.
+
+    Args:
+        op: Binary operator from the operator module.
+        left: Left operand.
+        right: Right operand.
+
+    Returns:
+        Result of the operation.
+    """
+    if type(left) is not type(right):
+        return op(float(left), float(right))
+    return op(left, right)
+
+
+def _convert(
+    number: Decimal | float,
+    source: str | None,
+    target: str | None,
+    exact: bool = False,
+) -> Decimal | float:
+    """
+    Express a value given in one unit in another, compatible unit.
+
+    Floats are rescaled as the Decimal of their shortest repr, the value
+    comparisons give them, so converting either operand of a comparison
+    gives the same answer.
+
+    Args:
+        number: Value in the source unit.
+        source: Unit string of the value, or None.
+        target: Unit string to express the value in, or None.
+        exact: Return a rescaled float as the exact Decimal rather than
+            rounding it back to a float; used by comparisons.
+
+    Returns:
+        The value in the target unit; unchanged when the units are spelled
+        the same or are the same size.
+
+    Raises:
+        AttributeError: If units do not match.
+    """
+    if (source or "") == (target or ""):
+        return number
+    factor = conversion_factor(source, target)
+    if factor == 1:
+        return number
+    if isinstance(number, float):
+        scaled = Decimal(repr(number)) * factor
+        return scaled if exact else float(scaled)
+    return number * factor
+
+
+def _comparable(
+    number: Decimal | float, other: object
+) -> tuple[Decimal | float, Decimal | float | int]:
+    """
+    Resolve a stored value and a comparison operand to plain numbers.
+
+    EngNumber operands contribute their stored value and strings are taken
+    from the parse cache, so comparing against ints, floats, Decimals and
+    repeated literals builds no temporary objects. A float compared with a
+    Decimal is taken as the Decimal of its shortest repr, as EngNumber(x)
+    would store it, so no digits of the Decimal are rounded away.
+
+    Args:
+        number: Stored value of the left operand.
+        other: EngNumber, string, int, float or Decimal operand.
+
+    Returns:
+        Tuple of the two values to compare.
+
+    Raises:
+        TypeError: If the operand type is unsupported.
+    """
+    if isinstance(other, EngNumber):
+        other = other._number
+    elif isinstance(other, str):
+        other = _parse(other)[0]
+    elif not isinstance(other, (int, float, Decimal)):
+        # numpy scalars, which EngNumber accepts at runtime
+        other = EngNumber(other)._number  # type: ignore[arg-type]
+
+    if type(other) is float:
+        if type(number) is Decimal:
+            other = Decimal(repr(other))
+    elif type(number) is float and type(other) is Decimal:
+        number = Decimal(repr(number))
+    return number, other
+
+
+def _hash_number(number: Decimal | float) -> int:
+    """
+    Hash a stored value consistently with _comparable().
+
+    Floats hash as themselves. Integral Decimals hash like the int, so
+    EngNumber(10**23) and 10**23 share a hash. Other Decimals that equal the
+    shortest repr of a float hash like that float; "0.1" stored as a Decimal
+    and 0.1 stored as a float, or given as a plain float, share a hash. The
+    rest hash as themselves. Integral floats of 2**53 and above are the one
+    gap: 1e23 is 99999999999999991611392 exactly, so it cannot hash like
+    both the plain float and EngNumber(10**23), which it compares equal to.
+
+    Args:
+        number: Stored Decimal or float value.
+
+    Returns:
+        Hash of the value.
+    """
+    if isinstance(number, float):
+        return hash(number)
+    if number == number.to_integral_value():
+        return hash(number)
+    as_float = float(number)
+    if Decimal(repr(as_float)) == number:
+        return hash(as_float)
+    return hash(number)
+
+
+# distance from a rounding tie (relative to the scaled mantissa) below which
+# binary and decimal rounding could disagree
+_TIE_TOLERANCE = 1e-12
+
+_pow10_cache: tuple[float, ...] | None = None
+
+
+def _pow10() -> tuple[float, ...]:
+    """
+    Return the doubles nearest to each power of ten, built on first use.
+
+    Entry ``k + 330`` holds the double nearest to ``10**k``; a float whose
+    shortest repr starts at exponent k is never below it.
+
+    Returns:
+        Tuple covering exponents -330 through 310.
+    """
+    global _pow10_cache
+    if _pow10_cache is None:
+        _pow10_cache = tuple(float(f"1e{exp}") for exp in range(-330, 311))
+    return _pow10_cache
+
+
+def _format_float(
+    number: float, options: _FormatOptions, exp: int | None = None
+) -> str:
+    """
+    Format a float in engineering notation with an SI prefix.
+
+    Mirrors _format_number() using float arithmetic. Values within
+    _TIE_TOLERANCE of a rounding tie, such as 2.675 (2.67499999... in
+    binary), are handed to _format_number() as the Decimal of their shortest
+    repr, so they round half-even on the decimal value as the Decimal
+    backend does.
+
+    Args:
+        number: Value to format.
+        options: Formatting options to apply.
+        exp: Exponent of the SI prefix to use, a multiple of three; chosen
+            from the value when None.
+
+    Returns:
+        Engineering notation string.
+    """
+    forced = exp is not None
+    if number == 0:
+        if exp is None:
+            exp = 0
+        adjusted = exp
+        base = 0.0
+    elif not math.isfinite(number):
+        # as in the Decimal backend: NaN formats as is, infinities cannot
+        # be rounded to a precision
+        if math.isnan(number):
+            return "NaN" + options.separator + _prefix(exp or 0)
+        raise InvalidOperation(f"cannot format {number!r}: value is infinite")
+    else:
+        pow10 = _pow10()
+        magnitude = abs(number)
+        adjusted = math.floor(math.log10(magnitude))
+        if magnitude >= pow10[adjusted + 331]:
+            adjusted += 1
+        elif magnitude < pow10[adjusted + 330]:
+            adjusted -= 1
+        if exp is None:
+            exp = adjusted - (adjusted % 3)
+        base = number / pow10[exp + 330] if exp >= 0 else number * pow10[330 - exp]
+
+    if options.significant > 0:
+        digits = options.significant - 1 - (adjusted - exp)
+    else:
+        digits = options.precision
+
+    if number != 0 and -330 <= digits <= 310:
+        scaled = abs(base) * pow10[digits + 330]
+        if abs(scaled - math.floor(scaled) - 0.5) <= scaled * _TIE_TOLERANCE:
+            return _format_number(
+                Decimal(repr(number)), options, exp if forced else None
+            )
+
+    if digits <= 0 or (number == 0 and digits > 6 and not forced):
+        text = str(int(round(base, digits)))
+    else:
+        text = f"{base:.{digits}f}"
+
+    # remove trailing .00 in precision 2
+    if (
+        options.precision == 2
+        and options.significant == 0
+        and not options.precision_explicit
+        and text.endswith(".00")
+    ):
+        text = text[:-3]
+
+    return text + options.separator + _prefix(exp)
+
+
+def _format_number(
+    number: Decimal | float, options: _FormatOptions, exp: int | None = None
+) -> str:
+    """
+    Format a value in engineering notation with an SI prefix.
+
+    Args:
+        number: Value to format.
+        options: Formatting options to apply.
+        exp: Exponent of the SI prefix to use, a multiple of three; chosen
+            from the value when None.
+
+    Returns:
+        Engineering notation string.
+    """
+    if isinstance(number, float):
+        return _format_float(number, options, exp)
+
+    forced = exp is not None
+    if number == 0:
+        scaled = Decimal(0)
+        if exp is None:
+            exp = 0
+        adjusted = exp
+    else:
+        adjusted = number.adjusted()
+        if exp is None:
+            exp = adjusted - (adjusted % 3)
+        scaled = number.scaleb(-exp)
+
+    if options.significant > 0:
+        # scaled has adjusted - exp digits before the decimal point
+        base = str(round(scaled, options.significant - 1 - (adjusted - exp)))
+    else:
+        base = str(round(scaled, options.precision))
+
+    if "E" in base:
+        # a forced prefix may leave small values with many decimal places
+        base = format(Decimal(base), "f") if forced else str(int(Decimal(base)))
+
+    # remove trailing decimals:
+    # print(base)
+    # https://stackoverflow.com/questions/3410976/how-to-round-a-number-to-significant-figures-in-python
+    # https://stackoverflow.com/questions/11227620/drop-trailing-zeros-from-decimal
+    # base = '%s' % float("%#.2G"%Decimal(base))
+    # print(base)
+    # remove trailing decimal
+    if "." in base:
+        base = base.rstrip(".")
+
+    # remove trailing .00 in precision 2
+    if (
+        options.precision == 2
+        and options.significant == 0
+        and not options.precision_explicit
+    ):
+        if ".00" in base:
+            base = base[:-3]
+
+    return base + options.separator + _prefix(exp)
 
 
 class EngUnit:
@@ -94,38 +560,100 @@ class EngUnit:
     Provides arithmetic and comparison with unit checking.
     """
 
+    __slots__ = ("_eng_num", "_unit")
+
     def __init__(
         self,
-        value: str | int | float | EngNumber | EngUnit,
+        value: str | int | float | Decimal | EngNumber | EngUnit,
         precision: int | None = None,
         significant: int = 0,
         unit: str | None = None,
         separator: str = "",
+        frozen: bool = False,
+        backend: str | None = None,
     ) -> None:
         """
         Initialize an engineering number with an optional unit suffix.
 
         Args:
-            value: String, int, float, or EngNumber value to parse.
+            value: String, int, float, Decimal, or EngNumber value to parse.
             precision: Decimal places used when significant is 0.
                 Defaults to 2 when None.
             significant: Significant digits; takes precedence over precision.
             unit: Explicit unit suffix. If None, a unit suffix is parsed from
                 the end of a string value when present.
             separator: String inserted between the numeric value and suffix.
+            frozen: Make the instance immutable and hashable.
+            backend: "decimal" or "float" storage; None uses the default
+                set with set_default_backend().
         """
-        self.unit = unit
+        self._unit = unit
 
         if isinstance(value, str):
             # parse the string into unit and engineering number
-            new_value, parsed_unit = _split_value_and_unit(value)
-            if self.unit is None and parsed_unit is not None:
-                self.unit = parsed_unit
+            number, parsed_unit = _parse(value)
+            if self._unit is None and parsed_unit is not None:
+                self._unit = parsed_unit
 
-            self.eng_num = EngNumber(new_value, precision, significant, separator)
+            self._eng_num = EngNumber(
+                number, precision, significant, separator, frozen, backend
+            )
 
         else:
-            self.eng_num = EngNumber(value, precision, significant, separator)
+            self._eng_num = EngNumber(
+                value, precision, significant, separator, frozen, backend
+            )
+
+    @classmethod
+    def _from_parts(cls, number: Decimal | float, unit: str | None) -> EngUnit:
+        """
+        Build an EngUnit directly from a computed value and unit suffix.
+
+        Used by the arithmetic operators to skip re-parsing the result from
+        a string. The result uses default formatting options.
+
+        Args:
+            number: Numeric value of the result.
+            unit: Unit suffix; an empty string is stored as None.
+
+        Returns:
+            New EngUnit instance.
+        """
+        eng_unit = object.__new__(EngUnit)
+        eng_unit._unit = unit if unit else None
+        eng_unit._eng_num = EngNumber._from_number(number)
+        return eng_unit
+
+    @property
+    def unit(self) -> str | None:
+        """
+        Unit suffix, or None when unitless.
+        """
+        return self._unit
+
+    @unit.setter
+    def unit(self, value: str | None) -> None:
+        self._eng_num._check_mutable()
+        self._unit = value
+
+    @property
+    def eng_num(self) -> EngNumber:
+        """
+        Numeric portion of the value.
+        """
+        return self._eng_num
+
+    @eng_num.setter
+    def eng_num(self, value: EngNumber) -> None:
+        self._eng_num._check_mutable()
+        self._eng_num = value
+
+    @property
+    def frozen(self) -> bool:
+        """
+        True when the instance is immutable and hashable.
+        """
+        return self._eng_num.frozen
 
     def __repr__(self) -> str:
         """
@@ -151,6 +679,34 @@ class EngUnit:
             return other
         return EngUnit(str(other))
 
+    def _comparable(
+        self, other: str | float | Decimal | EngNumber | EngUnit
+    ) -> tuple[Decimal | float, Decimal | float | int]:
+        """
+        Resolve a comparison operand to a plain number with a matching unit.
+
+        Args:
+            other: EngUnit, EngNumber, string or numeric value.
+
+        Returns:
+            Tuple of the two values to compare.
+
+        Raises:
+            AttributeError: If units do not match.
+        """
+        if isinstance(other, EngUnit):
+            number, unit = other._eng_num._number, other._unit
+        elif isinstance(other, str):
+            number, unit = _parse(other)
+        elif isinstance(other, EngNumber):
+            number, unit = other._number, None
+        else:
+            number, unit = other, None
+
+        return _comparable(
+            self._eng_num._number, _convert(number, unit, self._unit, exact=True)
+        )
+
     def _unit_str(self) -> str:
         """
         Return the unit suffix as a string.
@@ -171,13 +727,7 @@ class EngUnit:
         Returns:
             Composed unit suffix string.
         """
-        left = self._unit_str()
-        right = other._unit_str()
-        if op == "mul":
-            return left + right
-        if op == "div":
-            return left + (f"/{right}" if right else "")
-        raise ValueError(f"Unsupported unit operation: {op}")
+        return compose(self._unit_str(), other._unit_str(), op)
 
     def __str__(self) -> str:
         """
@@ -206,6 +756,22 @@ class EngUnit:
         """
         return float(self.eng_num)
 
+    def __array__(self, dtype: object = None, copy: bool | None = None) -> Any:
+        """
+        Convert the numeric portion to a zero-dimensional numpy array.
+
+        The unit is dropped; use EngArray to keep it.
+
+        Args:
+            dtype: Requested numpy dtype; float64 when None.
+            copy: Accepted for numpy compatibility; a new array is always
+                returned.
+
+        Returns:
+            numpy.ndarray holding the value.
+        """
+        return self._eng_num.__array__(dtype, copy)
+
     def __add__(self, other: str | int | float | EngNumber | EngUnit) -> Self:
         """
         Add two engineering numbers with matching units.
@@ -219,12 +785,14 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
         other = self._coerce_other(other)
 
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return EngUnit(str(self.eng_num + other.eng_num) + self._unit_str())
+        other_number = _convert(other.eng_num.number, other._unit, self._unit)
+        return EngUnit._from_parts(
+            _apply(operator.add, self.eng_num.number, other_number), self.unit
+        )
 
     def __radd__(self, other: str | int | float | EngNumber | EngUnit) -> Self:
         """
@@ -251,12 +819,14 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
         other = self._coerce_other(other)
 
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return EngUnit(str(self.eng_num - other.eng_num) + self._unit_str())
+        other_number = _convert(other.eng_num.number, other._unit, self._unit)
+        return EngUnit._from_parts(
+            _apply(operator.sub, self.eng_num.number, other_number), self.unit
+        )
 
     def __rsub__(self, other: str | int | float | EngNumber | EngUnit) -> Self:
         """
@@ -271,12 +841,14 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
         other = self._coerce_other(other)
 
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return EngUnit(str(other.eng_num - self.eng_num) + self._unit_str())
+        other_number = _convert(other.eng_num.number, other._unit, self._unit)
+        return EngUnit._from_parts(
+            _apply(operator.sub, other_number, self.eng_num.number), self.unit
+        )
 
     def __mul__(self, other: str | int | float | EngNumber | EngUnit) -> Self:
         """
@@ -288,10 +860,13 @@ class EngUnit:
         Returns:
             EngUnit product with combined unit suffix.
         """
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
         other = self._coerce_other(other)
 
-        return EngUnit(
-            str(self.eng_num * other.eng_num) + self._compose_unit(other, "mul")
+        return EngUnit._from_parts(
+            _apply(operator.mul, self.eng_num.number, other.eng_num.number),
+            self._compose_unit(other, "mul"),
         )
 
     def __rmul__(self, other: str | int | float | EngNumber | EngUnit) -> Self:
@@ -316,10 +891,13 @@ class EngUnit:
         Returns:
             EngUnit quotient with "a/b" unit suffix when needed.
         """
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
         other = self._coerce_other(other)
 
-        return EngUnit(
-            str(self.eng_num / other.eng_num) + self._compose_unit(other, "div")
+        return EngUnit._from_parts(
+            _apply(operator.truediv, self.eng_num.number, other.eng_num.number),
+            self._compose_unit(other, "div"),
         )
 
     def __rtruediv__(self, other: str | int | float | EngNumber | EngUnit) -> Self:
@@ -332,10 +910,13 @@ class EngUnit:
         Returns:
             EngUnit quotient with "a/b" unit suffix when needed.
         """
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
         other = self._coerce_other(other)
 
-        return EngUnit(
-            str(other.eng_num / self.eng_num) + other._compose_unit(self, "div")
+        return EngUnit._from_parts(
+            _apply(operator.truediv, other.eng_num.number, self.eng_num.number),
+            other._compose_unit(self, "div"),
         )
 
     def __lt__(self, other: str | int | float | EngNumber | EngUnit) -> bool:
@@ -351,12 +932,10 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
-        other = self._coerce_other(other)
-
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return self.eng_num < other.eng_num
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = self._comparable(other)
+        return left < right
 
     def __gt__(self, other: str | int | float | EngNumber | EngUnit) -> bool:
         """
@@ -371,12 +950,10 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
-        other = self._coerce_other(other)
-
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return self.eng_num > other.eng_num
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = self._comparable(other)
+        return left > right
 
     def __le__(self, other: str | int | float | EngNumber | EngUnit) -> bool:
         """
@@ -391,12 +968,10 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
-        other = self._coerce_other(other)
-
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return self.eng_num <= other.eng_num
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = self._comparable(other)
+        return left <= right
 
     def __ge__(self, other: str | int | float | EngNumber | EngUnit) -> bool:
         """
@@ -411,12 +986,10 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
-        other = self._coerce_other(other)
-
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
-
-        return self.eng_num >= other.eng_num
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = self._comparable(other)
+        return left >= right
 
     def __eq__(self, other: object) -> bool | NotImplementedType:
         """
@@ -431,71 +1004,242 @@ class EngUnit:
         Raises:
             AttributeError: If units do not match.
         """
-        if not isinstance(other, (EngNumber, EngUnit, str, int, float)):
+        if not isinstance(other, (EngNumber, EngUnit, str, int, float, Decimal)):
             return NotImplemented
-        other = self._coerce_other(other)
+        left, right = self._comparable(other)
+        return left == right
+
+    def __hash__(self) -> int:
+        """
+        Hash a frozen EngUnit consistently with its numeric equality.
+
+        Unitless and dimensionless values (such as "V/V") hash like the
+        equivalent EngNumber, int or float; otherwise the value is hashed in
+        the coherent SI unit together with the unit's dimensions, so "1kohm"
+        and EngUnit(1, unit="kohm") match. Floats are scaled as Decimals, so
+        both backends agree.
 
-        if self._unit_str() != other._unit_str():
-            raise AttributeError("units do not match")
+        Returns:
+            Hash of the value and unit.
 
-        return self.eng_num == other.eng_num
+        Raises:
+            TypeError: If the instance is not frozen.
+        """
+        if not self._eng_num.frozen:
+            raise TypeError("unhashable type: 'EngUnit' (construct with frozen=True)")
+        if self._unit:
+            unit = _unit_of(self._unit)
+            number = self._eng_num._number
+            if unit.scale != 1:
+                number = (
+                    Decimal(repr(number)) if isinstance(number, float) else number
+                ) * unit.scale
+            if not unit.dimensions:
+                return _hash_number(number)
+            return hash((_hash_number(number), unit.dimensions))
+        return _hash_number(self._eng_num._number)
 
 
 class EngNumber:
     """
-    Engineering notation number backed by Decimal.
+    Engineering notation number backed by Decimal, or by float when the
+    "float" backend is selected.
+
+    Formatting options are held in a shared, interned options object, so
+    instances only store the number, a reference to their options and the
+    formatted string once it has been computed.
     """
 
+    __slots__ = ("_number", "_options", "_repr")
+
+    _number: Decimal | float
+    _options: _FormatOptions
+    _repr: str | None
+
     def __init__(
         self,
-        value: str | int | float | EngNumber,
+        value: str | int | float | Decimal | EngNumber,
         precision: int | None = None,
         significant: int = 0,
         separator: str = "",
+        frozen: bool = False,
+        backend: str | None = None,
     ) -> None:
         """
         Initialize an engineering notation value.
 
         Args:
-            value: String, int, float, or EngNumber value to parse.
+            value: String, int, float, Decimal, or EngNumber value to parse.
             precision: Decimal places used when significant is 0.
                 Defaults to 2 when None.
             significant: Significant digits; takes precedence over precision.
             separator: String inserted between the numeric value and suffix.
+            frozen: Make the instance immutable and hashable.
+            backend: "decimal" or "float" storage; None uses the default
+                set with set_default_backend().
 
         Raises:
             TypeError: If the value type is unsupported.
-            ValueError: If a string value cannot be parsed by Decimal.
-        """
-        self.precision = 2 if precision is None else precision
-        self._precision_explicit = precision is not None
-        self.significant = significant
-        self.separator = separator
+            InvalidOperation: If a string value cannot be parsed.
+            ValueError: If the backend is unknown.
+        """
+        self._options = _format_options(
+            2 if precision is None else precision,
+            precision is not None,
+            significant,
+            separator,
+            frozen,
+        )
+        self._repr = None
+
+        if backend is None:
+            backend = _default_backend
+        elif backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+
+        if backend == "float" and type(value) in (int, float):
+            self._number = float(value)
+            return
 
         if isinstance(value, str):
-            numeric_part, _ = _split_value_and_unit(value)
-            for suffix in _suffix_keys:
-                if suffix == numeric_part[-1]:
-                    numeric_part = numeric_part[:-1] + _suffix_lookup[suffix]
-                    break
+            self._number = _parse(value)[0]
 
-            self.number = Decimal(numeric_part)
+        elif isinstance(value, Decimal):
+            self._number = value
 
         elif (
             isinstance(value, int)
             or isinstance(value, float)
             or isinstance(value, EngNumber)
         ):
-            self.number = Decimal(str(value))
+            self._number = Decimal(str(value))
         else:
-            # finally, check for numpy import
+            # finally, check for numpy types; numpy is never imported here,
+            # as a numpy value can only exist once numpy has been imported
+            numpy = sys.modules.get("numpy")
             if numpy is not None and isinstance(value, numpy.integer):
-                self.number = Decimal(str(value))
+                self._number = Decimal(str(value))
+            elif numpy is not None and isinstance(value, numpy.floating):
+                # str() gives the shortest repr at the scalar's own
+                # precision, so float32(0.1) becomes 0.1 as well
+                self._number = Decimal(str(value))
             else:
                 raise TypeError(
                     f"Unsupported type for EngNumber: {type(value).__name__}"
                 )
 
+        if backend == "float":
+            self._number = float(self._number)
+
+    @classmethod
+    def _from_number(cls, number: Decimal | float) -> EngNumber:
+        """
+        Build an EngNumber directly from a computed Decimal or float.
+
+        Used by the arithmetic operators to skip the string round trip
+        through the public constructor. The result uses default formatting
+        options.
+
+        Args:
+            number: Numeric value of the result.
+
+        Returns:
+            New EngNumber instance.
+        """
+        eng_num = object.__new__(EngNumber)
+        eng_num._number = number
+        eng_num._options = _DEFAULT_OPTIONS
+        eng_num._repr = None
+        return eng_num
+
+    @property
+    def number(self) -> Decimal | float:
+        """
+        Numeric value; a float when using the "float" backend.
+        """
+        return self._number
+
+    @number.setter
+    def number(self, value: Decimal | float) -> None:
+        self._check_mutable()
+        self._number = value
+        self._repr = None
+
+    @property
+    def precision(self) -> int:
+        """
+        Decimal places used when significant is 0.
+        """
+        return self._options.precision
+
+    @precision.setter
+    def precision(self, value: int) -> None:
+        self._replace_options(precision=value)
+
+    @property
+    def _precision_explicit(self) -> bool:
+        """
+        True when the precision was given explicitly at construction.
+        """
+        return self._options.precision_explicit
+
+    @_precision_explicit.setter
+    def _precision_explicit(self, value: bool) -> None:
+        self._replace_options(precision_explicit=value)
+
+    @property
+    def significant(self) -> int:
+        """
+        Significant digits; takes precedence over precision.
+        """
+        return self._options.significant
+
+    @significant.setter
+    def significant(self, value: int) -> None:
+        self._replace_options(significant=value)
+
+    @property
+    def separator(self) -> str:
+        """
+        String inserted between the numeric value and suffix.
+        """
+        return self._options.separator
+
+    @separator.setter
+    def separator(self, value: str) -> None:
+        self._replace_options(separator=value)
+
+    @property
+    def frozen(self) -> bool:
+        """
+        True when the instance is immutable and hashable.
+        """
+        return self._options.frozen
+
+    def _check_mutable(self) -> None:
+        """
+        Raise if the instance is frozen.
+
+        Raises:
+            AttributeError: If the instance was constructed with frozen=True.
+        """
+        if self._options.frozen:
+            raise AttributeError(f"cannot modify frozen {type(self).__name__}")
+
+    def _replace_options(self, **changes: Any) -> None:
+        """
+        Swap in the interned options with the given fields changed.
+
+        Args:
+            **changes: _FormatOptions fields to change.
+
+        Raises:
+            AttributeError: If the instance is frozen.
+        """
+        self._check_mutable()
+        self._options = _format_options(*self._options._replace(**changes))
+        self._repr = None
+
     def to_pn(self, sub_letter: str | None = None) -> str:
         """
         Return a part-number style string for the value.
@@ -530,48 +1274,10 @@ class EngNumber:
         Returns:
             String representation using SI prefixes.
         """
-        if self.number == 0:
-            base = Decimal(0)
-            exponent = "-30"
-        else:
-            adjusted = self.number.adjusted()
-            exp = adjusted - (adjusted % 3)
-            base = self.number.scaleb(-exp)
-            exponent = str(exp - 30)
-
-        if self.significant > 0:
-            if abs(Decimal(base)) >= 100.0:
-                base = str(round(Decimal(base), self.significant - 3))
-            elif abs(Decimal(base)) >= 10.0:
-                base = str(round(Decimal(base), self.significant - 2))
-            else:
-                base = str(round(Decimal(base), self.significant - 1))
-        else:
-            base = str(round(Decimal(base), self.precision))
-
-        if "e" in base.lower():
-            base = str(int(Decimal(base)))
-
-        # remove trailing decimals:
-        # print(base)
-        # https://stackoverflow.com/questions/3410976/how-to-round-a-number-to-significant-figures-in-python
-        # https://stackoverflow.com/questions/11227620/drop-trailing-zeros-from-decimal
-        # base = '%s' % float("%#.2G"%Decimal(base))
-        # print(base)
-        # remove trailing decimal
-        if "." in base:
-            base = base.rstrip(".")
-
-        # remove trailing .00 in precision 2
-        if (
-            self.precision == 2
-            and self.significant == 0
-            and not self._precision_explicit
-        ):
-            if ".00" in base:
-                base = base[:-3]
-
-        return base + self.separator + _exponent_lookup_scaled[exponent]
+        text = self._repr
+        if text is None:
+            text = self._repr = _format_number(self.number, self._options)
+        return text
 
     def __str__(self, eng: bool = True, context: object | None = None) -> str:
         """
@@ -604,6 +1310,23 @@ class EngNumber:
         """
         return float(self.number)
 
+    def __array__(self, dtype: object = None, copy: bool | None = None) -> Any:
+        """
+        Convert to a zero-dimensional numpy array.
+
+        Lets numpy build float64 arrays from EngNumber values instead of
+        object arrays.
+
+        Args:
+            dtype: Requested numpy dtype; float64 when None.
+            copy: Accepted for numpy compatibility; a new array is always
+                returned.
+
+        Returns:
+            numpy.ndarray holding the value.
+        """
+        return sys.modules["numpy"].array(float(self._number), dtype=dtype)
+
     def __add__(self, other: str | int | float | EngNumber) -> Self:
         """
         Add two engineering numbers.
@@ -615,10 +1338,12 @@ class EngNumber:
             EngNumber sum.
         """
         if not isinstance(other, EngNumber):
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             other = EngNumber(other)
 
-        num = self.number + other.number
-        return EngNumber(str(num))
+        num = _apply(operator.add, self.number, other.number)
+        return EngNumber._from_number(num)
 
     def __radd__(self, other: str | int | float | EngNumber) -> Self:
         """
@@ -643,10 +1368,12 @@ class EngNumber:
             EngNumber difference.
         """
         if not isinstance(other, EngNumber):
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             other = EngNumber(other)
 
-        num = self.number - other.number
-        return EngNumber(str(num))
+        num = _apply(operator.sub, self.number, other.number)
+        return EngNumber._from_number(num)
 
     def __rsub__(self, other: str | int | float | EngNumber) -> Self:
         """
@@ -659,10 +1386,12 @@ class EngNumber:
             EngNumber difference.
         """
         if not isinstance(other, EngNumber):
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             other = EngNumber(other)
 
-        num = other.number - self.number
-        return EngNumber(str(num))
+        num = _apply(operator.sub, other.number, self.number)
+        return EngNumber._from_number(num)
 
     def __mul__(self, other: str | int | float | EngNumber) -> Self:
         """
@@ -675,10 +1404,12 @@ class EngNumber:
             EngNumber product.
         """
         if not isinstance(other, EngNumber):
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             other = EngNumber(other)
 
-        num = self.number * other.number
-        return EngNumber(str(num))
+        num = _apply(operator.mul, self.number, other.number)
+        return EngNumber._from_number(num)
 
     def __rmul__(self, other: str | int | float | EngNumber) -> Self:
         """
@@ -703,10 +1434,12 @@ class EngNumber:
             EngNumber quotient.
         """
         if not isinstance(other, EngNumber):
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             other = EngNumber(other)
 
-        num = self.number / other.number
-        return EngNumber(str(num))
+        num = _apply(operator.truediv, self.number, other.number)
+        return EngNumber._from_number(num)
 
     def __rtruediv__(self, other: str | int | float | EngNumber) -> Self:
         """
@@ -719,10 +1452,12 @@ class EngNumber:
             EngNumber quotient.
         """
         if not isinstance(other, EngNumber):
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             other = EngNumber(other)
 
-        num = other.number / self.number
-        return EngNumber(str(num))
+        num = _apply(operator.truediv, other.number, self.number)
+        return EngNumber._from_number(num)
 
     def __lt__(self, other: str | int | float | EngNumber) -> bool:
         """
@@ -734,10 +1469,10 @@ class EngNumber:
         Returns:
             True if self < other.
         """
-        if not isinstance(other, EngNumber):
-            other = EngNumber(other)
-
-        return self.number < other.number
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = _comparable(self._number, other)
+        return left < right
 
     def __gt__(self, other: str | int | float | EngNumber) -> bool:
         """
@@ -749,10 +1484,10 @@ class EngNumber:
         Returns:
             True if self > other.
         """
-        if not isinstance(other, EngNumber):
-            other = EngNumber(other)
-
-        return self.number > other.number
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = _comparable(self._number, other)
+        return left > right
 
     def __le__(self, other: str | int | float | EngNumber) -> bool:
         """
@@ -764,10 +1499,10 @@ class EngNumber:
         Returns:
             True if self <= other.
         """
-        if not isinstance(other, EngNumber):
-            other = EngNumber(other)
-
-        return self.number <= other.number
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = _comparable(self._number, other)
+        return left <= right
 
     def __ge__(self, other: str | int | float | EngNumber) -> bool:
         """
@@ -779,10 +1514,10 @@ class EngNumber:
         Returns:
             True if self >= other.
         """
-        if not isinstance(other, EngNumber):
-            other = EngNumber(other)
-
-        return self.number >= other.number
+        if hasattr(other, "__array_ufunc__"):
+            return NotImplemented
+        left, right = _comparable(self._number, other)
+        return left >= right
 
     def __eq__(self, other: object) -> bool | NotImplementedType:
         """
@@ -794,9 +1529,27 @@ class EngNumber:
         Returns:
             True if values are numerically equal.
         """
-        if not isinstance(other, (EngNumber, str, int, float)):
+        if not isinstance(other, (EngNumber, str, int, float, Decimal)):
             return NotImplemented
-        if not isinstance(other, EngNumber):
-            other = EngNumber(other)
+        left, right = _comparable(self._number, other)
+        return left == right
+
+    def __hash__(self) -> int:
+        """
+        Hash a frozen EngNumber consistently with its numeric equality.
 
-        return self.number == other.number
+        EngNumber("1k"), EngNumber(1000) and the int 1000 share a hash, as
+        do EngNumber("0.1"), EngNumber(0.1, backend="float") and the float
+        0.1. A Decimal operand that is not an integer may compare equal
+        without sharing the hash, as 0.1 and Decimal("0.1") cannot both
+        match it.
+
+        Returns:
+            Hash of the numeric value.
+
+        Raises:
+            TypeError: If the instance is not frozen.
+        """
+        if not self._options.frozen:
+            raise TypeError("unhashable type: 'EngNumber' (construct with frozen=True)")
+        return _hash_number(self._number)
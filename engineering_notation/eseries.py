@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from decimal import Decimal
+from functools import cache
+from typing import Any
+
+from engineering_notation.eng_notation import (
+    EngNumber,
+    EngUnit,
+    _parse,
+    _prefix_scale,
+)
+from engineering_notation.vectorized import _require_numpy
+
+# IEC 60063 values for E24 and below are not the rounded geometric series,
+# so they are listed; E48 through E192 follow the series except for 9.20
+# fmt: off
+_E24 = (
+    "1.0", "1.1", "1.2", "1.3", "1.5", "1.6", "1.8", "2.0", "2.2", "2.4", "2.7", "3.0",
+    "3.3", "3.6", "3.9", "4.3", "4.7", "5.1", "5.6", "6.2", "6.8", "7.5", "8.2", "9.1",
+)
+# fmt: on
+_E192 = [f"{10 ** (i / 192):.2f}" for i in range(192)]
+_E192[185] = "9.20"
+
+SERIES: dict[str, tuple[Decimal, ...]] = {
+    "E3": tuple(Decimal(v) for v in _E24[::8]),
+    "E6": tuple(Decimal(v) for v in _E24[::4]),
+    "E12": tuple(Decimal(v) for v in _E24[::2]),
+    "E24": tuple(Decimal(v) for v in _E24),
+    "E48": tuple(Decimal(v) for v in _E192[::4]),
+    "E96": tuple(Decimal(v) for v in _E192[::2]),
+    "E192": tuple(Decimal(v) for v in _E192),
+}
+
+# decades covered by the SI prefixes, up to 999 of the largest one
+_DECADES = range(min(_prefix_scale.values()), max(_prefix_scale.values()) + 3)
+
+
+@cache
+def _table(series: str) -> tuple[array, tuple[Decimal, ...]]:
+    """
+    Return every preferred value of a series across the SI prefix range.
+
+    Args:
+        series: Series name, "E3" through "E192".
+
+    Returns:
+        Tuple of the values as a sorted float64 array and as Decimals.
+
+    Raises:
+        ValueError: If the series is unknown.
+    """
+    try:
+        mantissas = SERIES[series]
+    except KeyError:
+        raise ValueError(
+            f"Unknown series {series!r}; expected one of {tuple(SERIES)}"
+        ) from None
+    numbers = tuple(m.scaleb(exp) for exp in _DECADES for m in mantissas)
+    return array("d", [float(n) for n in numbers]), numbers
+
+
+def _nearest_index(keys: array, magnitude: float) -> int:
+    """
+    Find the preferred value closest to a positive number.
+
+    Distance is geometric, so the boundary between two neighbouring values
+    is their geometric mean, as tolerance bands are relative.
+
+    Args:
+        keys: Sorted preferred values.
+        magnitude: Positive number to snap.
+
+    Returns:
+        Index of the closest preferred value.
+    """
+    i = bisect_left(keys, magnitude)
+    if i == 0:
+        return 0
+    if i == len(keys):
+        return i - 1
+    if magnitude * magnitude <= keys[i - 1] * keys[i]:
+        return i - 1
+    return i
+
+
+def nearest_preferred(
+    value: str | float | Decimal | EngNumber | EngUnit, series: str = "E96"
+) -> EngNumber | EngUnit:
+    """
+    Snap a value to the nearest standard preferred value.
+
+    Args:
+        value: Value to snap (for example, "4.8k" or EngUnit("4.8kohm")).
+        series: Series name, "E3", "E6", "E12", "E24", "E48", "E96" or
+            "E192".
+
+    Returns:
+        EngUnit with the same unit when the value carries one, otherwise
+        EngNumber. The sign is kept and zero is returned unchanged.
+
+    Raises:
+        ValueError: If the series is unknown.
+    """
+    if isinstance(value, EngUnit):
+        number, unit = value.eng_num.number, value.unit
+    elif isinstance(value, EngNumber):
+        number, unit = value.number, None
+    elif isinstance(value, str):
+        number, unit = _parse(value)
+    else:
+        number, unit = value, None
+
+    keys, numbers = _table(series)
+    if number:
+        preferred = numbers[_nearest_index(keys, abs(float(number)))]
+        if number < 0:
+            preferred = -preferred
+    else:
+        preferred = Decimal(0)
+
+    if unit:
+        return EngUnit(preferred, unit=unit)
+    return EngNumber(preferred)
+
+
+def nearest_preferred_array(values: Iterable[float] | Any, series: str = "E96") -> Any:
+    """
+    Snap every element of an array to the nearest standard preferred value.
+
+    Produces the same values as ``float(nearest_preferred(v, series))`` for
+    each element, using numpy.searchsorted over the whole array.
+
+    Args:
+        values: Iterable or array of numbers.
+        series: Series name, "E3" through "E192".
+
+    Returns:
+        numpy.ndarray of float64 with the same shape as the input.
+
+    Raises:
+        ImportError: If numpy is not available.
+        ValueError: If the series is unknown.
+    """
+    table = _table(series)[0]
+    np = _require_numpy()
+    keys = np.frombuffer(table, dtype=np.float64)
+    arr = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(arr)
+
+    upper = np.clip(np.searchsorted(keys, magnitude), 1, len(keys) - 1)
+    lower = upper - 1
+    index = np.where(magnitude * magnitude <= keys[lower] * keys[upper], lower, upper)
+    index = np.where(magnitude <= keys[0], 0, index)
+
+    return np.where(arr == 0, 0.0, np.copysign(keys[index], arr))
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from typing import Any
+
+from engineering_notation.eng_notation import EngNumber, EngUnit, _parse
+
+Value = str | int | float | Decimal | EngNumber | EngUnit
+
+
+def _number(value: Value) -> tuple[Decimal, str | None]:
+    """
+    Split a value into its exact decimal number and unit.
+
+    Args:
+        value: EngUnit, EngNumber, engineering string or plain number.
+
+    Returns:
+        Tuple of the number and its unit, None when unitless.
+    """
+    if isinstance(value, EngUnit):
+        number, unit = value.eng_num.number, value.unit
+    elif isinstance(value, EngNumber):
+        number, unit = value.number, None
+    elif isinstance(value, str):
+        number, unit = _parse(value)
+    else:
+        number, unit = value, None
+    if not isinstance(number, Decimal):
+        number = Decimal(str(number))
+    return number, unit
+
+
+def _key(value: Value) -> tuple[float, str | None]:
+    """
+    Split a value into its numeric key and unit.
+
+    Args:
+        value: EngUnit, EngNumber, engineering string or plain number.
+
+    Returns:
+        Tuple of the value as a float and its unit string as written, None
+        when unitless; units are not normalized, so "Hz" and "1/s" or "ohm"
+        and "kohm" are told apart.
+    """
+    if isinstance(value, EngUnit):
+        return float(value.eng_num.number), value.unit
+    if isinstance(value, EngNumber):
+        return float(value.number), None
+    if isinstance(value, str):
+        number, unit = _parse(value)
+        return float(number), unit
+    return float(value), None
+
+
+class EngIndex:
+    """
+    Sorted index over engineering values for range and nearest queries.
+
+    Values are grouped by their literal unit string and each group keeps
+    its numeric keys in a sorted float64 array, so every query is a binary
+    search. Values in equivalent but differently written units, such as
+    "Hz" and "1/s" or "ohm" and "kohm", fall in separate groups. Query
+    bounds may be EngNumber/EngUnit values, plain numbers or engineering
+    strings such as "90n" or "90nF".
+    """
+
+    __slots__ = ("_groups",)
+
+    def __init__(self, values: Iterable[Value]) -> None:
+        """
+        Build the index.
+
+        Args:
+            values: EngUnit, EngNumber, engineering strings or numbers. The
+                values themselves are returned by queries.
+        """
+        grouped: dict[str | None, tuple[list[float], list[Any]]] = {}
+        for value in values:
+            key, unit = _key(value)
+            keys, items = grouped.setdefault(unit, ([], []))
+            keys.append(key)
+            items.append(value)
+
+        self._groups: dict[str | None, tuple[array, list[Any]]] = {}
+        for unit, (keys, items) in grouped.items():
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._groups[unit] = (
+                array("d", [keys[i] for i in order]),
+                [items[i] for i in order],
+            )
+
+    def __len__(self) -> int:
+        """
+        Return the number of indexed values.
+
+        Returns:
+            Number of values across all units.
+        """
+        return sum(len(items) for _, items in self._groups.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the values, sorted within each unit.
+
+        Returns:
+            Iterator over the indexed values.
+        """
+        for _, items in self._groups.values():
+            yield from items
+
+    @property
+    def units(self) -> tuple[str | None, ...]:
+        """
+        Units present in the index; None stands for unitless values.
+        """
+        return tuple(self._groups)
+
+    def _group(
+        self, units: Iterable[str | None], unit: str | None
+    ) -> tuple[array, list[Any]]:
+        """
+        Select the group a query applies to.
+
+        The unit is taken from the query bounds, then from the unit
+        argument, and finally from the index itself when it holds a single
+        unit.
+
+        Args:
+            units: Units carried by the query bounds.
+            unit: Unit given to the query.
+
+        Returns:
+            Sorted keys and values of the group, empty when the unit is not
+            indexed.
+
+        Raises:
+            AttributeError: If the bounds carry different units.
+        """
+        found = {u for u in units if u is not None}
+        if unit is not None:
+            found.add(unit)
+        if len(found) > 1:
+            raise AttributeError("units do not match")
+        if found:
+            unit = found.pop()
+        elif len(self._groups) == 1:
+            unit = next(iter(self._groups))
+        return self._groups.get(unit, (array("d"), []))
+
+    def range(self, lo: Value, hi: Value, unit: str | None = None) -> list[Any]:
+        """
+        Return the values between two bounds, inclusive.
+
+        Args:
+            lo: Lower bound (for example, "90n").
+            hi: Upper bound (for example, "110n").
+            unit: Unit to search when the bounds do not carry one.
+
+        Returns:
+            Matching values in ascending order.
+
+        Raises:
+            AttributeError: If the bounds and unit disagree.
+        """
+        lo_key, lo_unit = _key(lo)
+        hi_key, hi_unit = _key(hi)
+        keys, items = self._group((lo_unit, hi_unit), unit)
+        return items[bisect_left(keys, lo_key) : bisect_right(keys, hi_key)]
+
+    def within(
+        self, value: Value, tolerance: Value, unit: str | None = None
+    ) -> list[Any]:
+        """
+        Return the values within a tolerance of a nominal value.
+
+        Args:
+            value: Nominal value (for example, "10k").
+            tolerance: Percentage string such as "5%", or an absolute
+                deviation such as "500" or EngNumber("500").
+            unit: Unit to search when the value does not carry one.
+
+        Returns:
+            Matching values in ascending order.
+
+        Raises:
+            AttributeError: If the value, tolerance and unit disagree.
+        """
+        number, value_unit = _number(value)
+        if isinstance(tolerance, str) and tolerance.endswith("%"):
+            deviation = abs(number) * _parse(tolerance[:-1])[0] / 100
+            tolerance_unit = None
+        else:
+            deviation, tolerance_unit = _number(tolerance)
+        keys, items = self._group((value_unit, tolerance_unit), unit)
+
+        # bounds are computed exactly, so values on the edge of the band
+        # are found even when they are not representable as floats
+        lo = float(number - abs(deviation))
+        hi = float(number + abs(deviation))
+        return items[bisect_left(keys, lo) : bisect_right(keys, hi)]
+
+    def nearest(self, value: Value, k: int = 1, unit: str | None = None) -> list[Any]:
+        """
+        Return the k values closest to a target.
+
+        Args:
+            value: Target value (for example, "4.7k").
+            k: Number of values to return.
+            unit: Unit to search when the value does not carry one.
+
+        Returns:
+            Up to k values, closest first; ties prefer the smaller value.
+
+        Raises:
+            AttributeError: If the value and unit disagree.
+        """
+        key, value_unit = _key(value)
+        keys, items = self._group((value_unit,), unit)
+
+        below = bisect_left(keys, key) - 1
+        above = below + 1
+        result: list[Any] = []
+        while len(result) < k and (below >= 0 or above < len(keys)):
+            if above >= len(keys) or (
+                below >= 0 and key - keys[below] <= keys[above] - key
+            ):
+                result.append(items[below])
+                below -= 1
+            else:
+                result.append(items[above])
+                above += 1
+        return result
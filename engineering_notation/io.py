@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import csv
+import mmap
+import os
+import re
+import time
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any, TextIO
+
+from engineering_notation.eng_notation import (
+    _NUM_RE,
+    EngUnit,
+    _parse,
+    _prefix_scale,
+    _suffix_keys,
+)
+
+CHUNK_SIZE = 1 << 20
+BATCH_SIZE = 10_000
+
+# one match per line: the number, its SI prefix and any unit, or the whole
+# line when it does not start with a number
+_LINE_RE = re.compile(
+    rb"^[ \t]*(?:("
+    + _NUM_RE.pattern.lstrip("^").encode()
+    + rb")(["
+    + "".join(_suffix_keys).encode()
+    + rb"]?)[^\n]*|([^\n]+))?$",
+    re.MULTILINE,
+)
+_EXPONENT_BYTES = {
+    suffix.encode(): f"e{_prefix_scale[suffix]}".encode() for suffix in _suffix_keys
+}
+
+
+class ParseStats:
+    """
+    Running totals for a streaming parse.
+
+    Pass an instance to iter_parse() to follow its progress; the totals are
+    updated each time a batch is yielded.
+    """
+
+    __slots__ = ("rows", "seconds")
+
+    def __init__(self) -> None:
+        """
+        Initialize empty totals.
+        """
+        self.rows = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Average parse rate so far.
+
+        Returns:
+            Rows per second, or 0.0 before any time has elapsed.
+        """
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a summary of the totals.
+
+        Returns:
+            String with rows, seconds and rows per second.
+        """
+        return (
+            f"ParseStats(rows={self.rows}, seconds={self.seconds:.3f}, "
+            f"rows_per_second={self.rows_per_second:.0f})"
+        )
+
+
+def _iter_lines(file: TextIO, chunk_size: int) -> Iterator[str]:
+    """
+    Yield lines from a text file, reading it in fixed-size chunks.
+
+    Args:
+        file: Open text file.
+        chunk_size: Number of characters read at a time.
+
+    Yields:
+        Lines including their trailing newline.
+    """
+    tail = ""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if tail:
+        yield tail
+
+
+def iter_parse(
+    file: str | os.PathLike[str] | TextIO,
+    columns: Sequence[str | int],
+    *,
+    delimiter: str = ",",
+    as_float: bool = False,
+    batch_size: int = BATCH_SIZE,
+    chunk_size: int = CHUNK_SIZE,
+    stats: ParseStats | None = None,
+) -> Iterator[dict[str | int, list]]:
+    """
+    Stream engineering values out of a delimited text file.
+
+    The file is read in fixed-size chunks and parsed in batches, so memory
+    use is bounded by the batch size rather than the file size. Cells are
+    parsed with the same rules as EngUnit strings; empty cells become None.
+
+    Args:
+        file: Path or open text file. The first row must be a header.
+        columns: Header names or zero-based indices of the columns to parse.
+        delimiter: Field delimiter ("," for CSV, "\\t" for TSV).
+        as_float: Emit floats instead of EngUnit objects.
+        batch_size: Maximum number of rows per yielded batch.
+        chunk_size: Number of characters read from the file at a time.
+        stats: Optional ParseStats updated with rows parsed and elapsed time.
+
+    Yields:
+        Dict mapping each requested column to a list of parsed values.
+
+    Raises:
+        KeyError: If a named column is not in the header.
+        ValueError: If a cell cannot be parsed.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, newline="") as handle:
+            yield from iter_parse(
+                handle,
+                columns,
+                delimiter=delimiter,
+                as_float=as_float,
+                batch_size=batch_size,
+                chunk_size=chunk_size,
+                stats=stats,
+            )
+        return
+
+    reader = csv.reader(_iter_lines(file, chunk_size), delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    positions = []
+    for column in columns:
+        if isinstance(column, int):
+            positions.append(column)
+        elif column in header:
+            positions.append(header.index(column))
+        else:
+            raise KeyError(f"column {column!r} not found in header")
+
+    if stats is None:
+        stats = ParseStats()
+    start = time.perf_counter() - stats.seconds
+    batch: dict[str | int, list] = {column: [] for column in columns}
+    count = 0
+
+    for row in reader:
+        if not row:
+            continue
+        for column, position in zip(columns, positions):
+            cell = row[position].strip() if position < len(row) else ""
+            if not cell:
+                batch[column].append(None)
+                continue
+            try:
+                if as_float:
+                    batch[column].append(float(_parse(cell)[0]))
+                else:
+                    batch[column].append(EngUnit(cell))
+            except (ArithmeticError, ValueError) as exc:
+                raise ValueError(
+                    f"line {reader.line_num}, column {column!r}: cannot parse {cell!r}"
+                ) from exc
+
+        count += 1
+        if count == batch_size:
+            stats.rows += count
+            stats.seconds = time.perf_counter() - start
+            yield batch
+            start = time.perf_counter() - stats.seconds
+            batch = {column: [] for column in columns}
+            count = 0
+
+    if count:
+        stats.rows += count
+        stats.seconds = time.perf_counter() - start
+        yield batch
+
+
+def _count_newlines(data: mmap.mmap, end: int) -> int:
+    """
+    Count newlines in the first ``end`` bytes of a mapped file.
+
+    Args:
+        data: Memory-mapped file.
+        end: Number of bytes to scan.
+
+    Returns:
+        Number of newline bytes found.
+    """
+    return sum(
+        data[start : min(start + CHUNK_SIZE, end)].count(b"\n")
+        for start in range(0, end, CHUNK_SIZE)
+    )
+
+
+def _scan_values(data: mmap.mmap) -> Iterator[float]:
+    """
+    Yield the value of each non-blank line of a mapped file.
+
+    Args:
+        data: Memory-mapped file.
+
+    Yields:
+        Values as floats, in file order.
+
+    Raises:
+        ValueError: If a line cannot be parsed.
+    """
+    for match in _LINE_RE.finditer(data):
+        number, prefix, invalid = match.groups()
+        if number is None:
+            if invalid is None or invalid.isspace():
+                continue
+            line = _count_newlines(data, match.start()) + 1
+            raise ValueError(f"line {line}: cannot parse {invalid!r}")
+
+        if prefix:
+            if b"e" in number or b"E" in number:
+                line = _count_newlines(data, match.start()) + 1
+                raise ValueError(f"line {line}: cannot parse {match[0]!r}")
+            yield float(number + _EXPONENT_BYTES[prefix])
+        else:
+            yield float(number)
+
+
+def parse_mmap(path: str | os.PathLike[str], out: Any | None = None) -> Any:
+    """
+    Parse a file of newline-separated engineering values in a single pass.
+
+    The file is memory-mapped and scanned once with a bytes regex built
+    from the _NUM_RE grammar and _prefix_scale prefixes, and each value is
+    written straight into a float64 buffer. Each line still creates a
+    short-lived match object, the bytes of its number and a float; none of
+    them outlive the line, so memory stays at the mapping plus the result.
+    Units after the prefix are ignored and blank lines are skipped.
+
+    Args:
+        path: Path of the file to parse.
+        out: Optional writable float64 buffer (for example, a numpy array or
+            array("d")) with room for one value per line.
+
+    Returns:
+        A new array("d") holding the values, or ``out[:count]`` when a
+        buffer is given.
+
+    Raises:
+        TypeError: If out is not a float64 buffer.
+        ValueError: If out is too small or a line cannot be parsed.
+    """
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return array("d") if out is None else out[:0]
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if out is None:
+                # the array grows in place as values are appended
+                return array("d", _scan_values(data))
+
+            with memoryview(out) as view:
+                if view.format != "d":
+                    raise TypeError("out must be a float64 buffer")
+                count = 0
+                for value in _scan_values(data):
+                    if count == len(view):
+                        raise ValueError("out is too small for the values in the file")
+                    # typeshed types memoryview items as int whatever the format
+                    view[count] = value  # type: ignore[call-overload]
+                    count += 1
+
+    return out[:count]
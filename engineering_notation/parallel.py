@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from itertools import chain
+from multiprocessing.context import BaseContext
+
+from engineering_notation.eng_notation import (
+    EngNumber,
+    EngUnit,
+    _parse,
+    get_default_backend,
+)
+
+# chunks smaller than this spend more time in IPC than in formatting
+MIN_CHUNKSIZE = 2_000
+
+# number of chunks handed to each worker, to even out uneven workers
+CHUNKS_PER_WORKER = 4
+
+
+def _format_chunk(
+    values: Sequence[str | int | float | Decimal],
+    precision: int | None,
+    significant: int,
+    separator: str,
+    backend: str,
+) -> list[str]:
+    """
+    Format one chunk of values in a worker process.
+
+    Args:
+        values: Values to format.
+        precision: Decimal places used when significant is 0.
+        significant: Significant digits; takes precedence over precision.
+        separator: String inserted between the numeric value and suffix.
+        backend: Backend of the calling process; workers started with spawn
+            or forkserver do not inherit set_default_backend().
+
+    Returns:
+        Engineering notation strings in input order.
+    """
+    return [
+        str(EngNumber(value, precision, significant, separator, backend=backend))
+        for value in values
+    ]
+
+
+def _parse_chunk(
+    strings: Sequence[str], as_float: bool, backend: str
+) -> list[EngUnit] | list[float]:
+    """
+    Parse one chunk of strings in a worker process.
+
+    Args:
+        strings: Engineering notation strings.
+        as_float: Return floats instead of EngUnit objects.
+        backend: Backend of the calling process, for EngUnit objects.
+
+    Returns:
+        Parsed values in input order.
+    """
+    if as_float:
+        return [float(_parse(string)[0]) for string in strings]
+    return [EngUnit(string, backend=backend) for string in strings]
+
+
+def _chunks(items: Sequence, workers: int, chunksize: int | None) -> list[Sequence]:
+    """
+    Split items into contiguous chunks.
+
+    Args:
+        items: Items to split.
+        workers: Number of worker processes.
+        chunksize: Items per chunk, or None to size chunks automatically.
+
+    Returns:
+        List of chunks in input order.
+    """
+    if chunksize is None:
+        chunksize = max(MIN_CHUNKSIZE, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    return [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def _run(
+    func: Callable[..., list],
+    items: Sequence,
+    workers: int | None,
+    chunksize: int | None,
+    mp_context: BaseContext | None,
+    *args: object,
+) -> list:
+    """
+    Apply a chunk function across a process pool, preserving input order.
+
+    Args:
+        func: Module-level function taking (chunk, *args) and returning a list.
+        items: Items to process.
+        workers: Number of worker processes; None uses every CPU.
+        chunksize: Items per chunk, or None to size chunks automatically.
+        mp_context: Multiprocessing context to start workers with, or None
+            for the platform default.
+        *args: Extra arguments passed to func with every chunk.
+
+    Returns:
+        Concatenated results in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(items, workers, chunksize)
+    if workers == 1 or len(chunks) <= 1:
+        return list(chain.from_iterable(func(chunk, *args) for chunk in chunks))
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)), mp_context=mp_context
+    ) as executor:
+        results = executor.map(func, chunks, *([arg] * len(chunks) for arg in args))
+        return list(chain.from_iterable(results))
+
+
+def format_many(
+    values: Iterable[str | int | float | Decimal],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    precision: int | None = None,
+    significant: int = 0,
+    separator: str = "",
+    mp_context: BaseContext | None = None,
+) -> list[str]:
+    """
+    Format many values across a pool of worker processes.
+
+    Each result is identical to ``str(EngNumber(value, ...))`` in the
+    calling process, including its default backend, and results are
+    returned in input order.
+
+    Args:
+        values: Values to format.
+        workers: Number of worker processes; None uses every CPU and 1 runs
+            in the calling process.
+        chunksize: Values sent to a worker at a time; None picks a size
+            that keeps IPC overhead low.
+        precision: Decimal places used when significant is 0.
+            Defaults to 2 when None.
+        significant: Significant digits; takes precedence over precision.
+        separator: String inserted between the numeric value and suffix.
+        mp_context: Multiprocessing context to start workers with, or None
+            for the platform default.
+
+    Returns:
+        Engineering notation strings.
+    """
+    items = values if isinstance(values, Sequence) else list(values)
+    return _run(
+        _format_chunk,
+        items,
+        workers,
+        chunksize,
+        mp_context,
+        precision,
+        significant,
+        separator,
+        get_default_backend(),
+    )
+
+
+def parse_many(
+    strings: Iterable[str],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    as_float: bool = False,
+    mp_context: BaseContext | None = None,
+) -> list[EngUnit] | list[float]:
+    """
+    Parse many strings across a pool of worker processes.
+
+    Each result matches ``EngUnit(string)`` (or its float value), and
+    results are returned in input order.
+
+    Args:
+        strings: Engineering notation strings.
+        workers: Number of worker processes; None uses every CPU and 1 runs
+            in the calling process.
+        chunksize: Strings sent to a worker at a time; None picks a size
+            that keeps IPC overhead low.
+        as_float: Return floats, which are much cheaper to send back from
+            the workers, instead of EngUnit objects.
+        mp_context: Multiprocessing context to start workers with, or None
+            for the platform default.
+
+    Returns:
+        Parsed values.
+    """
+    items = strings if isinstance(strings, Sequence) else list(strings)
+    return _run(
+        _parse_chunk,
+        items,
+        workers,
+        chunksize,
+        mp_context,
+        as_float,
+        get_default_backend(),
+    )
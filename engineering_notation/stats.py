@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from itertools import chain
+
+from engineering_notation.eng_notation import (
+    EngNumber,
+    EngUnit,
+    _convert,
+    _parse,
+    get_default_backend,
+)
+
+Value = str | int | float | Decimal | EngNumber | EngUnit
+
+
+def _split(value: Value, backend: str) -> tuple[Decimal | float, str | None]:
+    """
+    Split a value into the number EngNumber would store and its unit.
+
+    Args:
+        value: EngUnit, EngNumber, engineering string or plain number.
+        backend: "decimal" or "float", for strings and plain numbers.
+
+    Returns:
+        Tuple of the number and its unit, None when unitless.
+    """
+    if isinstance(value, EngUnit):
+        return value.eng_num.number, value.unit
+    if isinstance(value, EngNumber):
+        return value.number, None
+    number: Decimal | float
+    unit: str | None = None
+    if isinstance(value, str):
+        number, unit = _parse(value)
+    elif backend == "float" and type(value) in (int, float):
+        return float(value), None
+    elif isinstance(value, Decimal):
+        number = value
+    elif isinstance(value, int):
+        number = Decimal(value)
+    else:
+        # as EngNumber stores them: floats at their shortest repr, numpy
+        # scalars through str()
+        number = Decimal(str(value))
+    if backend == "float":
+        number = float(number)
+    return number, unit
+
+
+def _in_unit(value: Value, target: str | None, backend: str) -> Decimal | float:
+    """
+    Return the number of a value expressed in the target unit.
+
+    Values already in the target unit are passed through; values in a
+    compatible unit (for example, "mV" for "V") are converted with one
+    multiply.
+
+    Args:
+        value: EngUnit, EngNumber, engineering string or plain number.
+        target: Unit of the reduction, or None.
+        backend: "decimal" or "float", for strings and ints.
+
+    Returns:
+        The number in the target unit.
+
+    Raises:
+        AttributeError: If units do not match.
+    """
+    number, unit = _split(value, backend)
+    if unit == target:
+        return number
+    return _convert(number, unit, target)
+
+
+def _numbers(
+    values: Iterable[Value],
+) -> tuple[str | None, Iterator[Decimal | float]]:
+    """
+    Take the unit from the first value and iterate over every number in it.
+
+    Args:
+        values: EngUnit, EngNumber, engineering strings or plain numbers.
+
+    Returns:
+        Tuple of the unit (None when unitless or empty) and an iterator of
+        the numbers; units are checked as it is consumed.
+    """
+    backend = get_default_backend()
+    iterator = iter(values)
+    for first in iterator:
+        number, unit = _split(first, backend)
+        # EngUnit values already in the unit skip the general path
+        rest = (
+            value._eng_num._number
+            if type(value) is EngUnit and value._unit == unit
+            else _in_unit(value, unit, backend)
+            for value in iterator
+        )
+        return unit, chain((number,), rest)
+    return None, iter(())
+
+
+def _wrap(number: Decimal | float, unit: str | None) -> EngNumber | EngUnit:
+    """
+    Wrap a result in the type matching its unit.
+
+    Args:
+        number: Result value.
+        unit: Unit of the result, or None.
+
+    Returns:
+        EngUnit when there is a unit, otherwise EngNumber.
+    """
+    if unit:
+        return EngUnit._from_parts(number, unit)
+    return EngNumber._from_number(number)
+
+
+def _sqrt(number: Decimal | float) -> Decimal | float:
+    """
+    Square root in the number's own backend.
+
+    Args:
+        number: Non-negative Decimal or float.
+
+    Returns:
+        Square root of the same type.
+    """
+    if isinstance(number, Decimal):
+        return number.sqrt()
+    return math.sqrt(number)
+
+
+def _total(numbers: Iterable[Decimal | float]) -> tuple[Decimal | float, int]:
+    """
+    Add numbers in one exact accumulator per backend.
+
+    Decimals are summed as Decimals; once a float is seen the result is a
+    float. Floats are kept as Shewchuk's non-overlapping partial sums, the
+    running state math.fsum uses, so the result is correctly rounded while
+    memory stays constant however many values are added.
+
+    Args:
+        numbers: Decimal or float values.
+
+    Returns:
+        Tuple of the sum and the number of values.
+
+    Raises:
+        OverflowError: If a partial sum of finite floats overflows.
+    """
+    exact = Decimal(0)
+    partials: list[float] = []
+    special = 0.0
+    count = 0
+    for number in numbers:
+        count += 1
+        if isinstance(number, Decimal):
+            exact += number
+        elif math.isfinite(number):
+            i = 0
+            for partial in partials:
+                if abs(number) < abs(partial):
+                    number, partial = partial, number
+                high = number + partial
+                low = partial - (high - number)
+                if low:
+                    partials[i] = low
+                    i += 1
+                number = high
+            partials[i:] = [number]
+        else:
+            # infinities and NaN would poison the partials
+            special += number
+    if partials or special:
+        if not all(map(math.isfinite, partials)):
+            raise OverflowError("intermediate overflow in total")
+        partials.append(float(exact))
+        return special + math.fsum(partials), count
+    return exact, count
+
+
+def total(values: Iterable[Value]) -> EngNumber | EngUnit:
+    """
+    Add values sharing a unit, without intermediate objects.
+
+    Args:
+        values: EngUnit, EngNumber, engineering strings or plain numbers.
+
+    Returns:
+        Sum in the unit of the first value; EngNumber zero when empty.
+
+    Raises:
+        AttributeError: If units do not match.
+    """
+    unit, numbers = _numbers(values)
+    return _wrap(_total(numbers)[0], unit)
+
+
+def mean(values: Iterable[Value]) -> EngNumber | EngUnit:
+    """
+    Return the arithmetic mean of values sharing a unit.
+
+    Args:
+        values: EngUnit, EngNumber, engineering strings or plain numbers.
+
+    Returns:
+        Mean in the unit of the first value.
+
+    Raises:
+        AttributeError: If units do not match.
+        ValueError: If there are no values.
+    """
+    unit, numbers = _numbers(values)
+    result, count = _total(numbers)
+    if not count:
+        raise ValueError("mean requires at least one value")
+    return _wrap(result / count, unit)
+
+
+def minimum(values: Iterable[Value]) -> EngNumber | EngUnit:
+    """
+    Return the smallest of values sharing a unit.
+
+    Args:
+        values: EngUnit, EngNumber, engineering strings or plain numbers.
+
+    Returns:
+        Smallest value, in the unit of the first value.
+
+    Raises:
+        AttributeError: If units do not match.
+        ValueError: If there are no values.
+    """
+    unit, numbers = _numbers(values)
+    return _wrap(min(numbers), unit)
+
+
+def maximum(values: Iterable[Value]) -> EngNumber | EngUnit:
+    """
+    Return the largest of values sharing a unit.
+
+    Args:
+        values: EngUnit, EngNumber, engineering strings or plain numbers.
+
+    Returns:
+        Largest value, in the unit of the first value.
+
+    Raises:
+        AttributeError: If units do not match.
+        ValueError: If there are no values.
+    """
+    unit, numbers = _numbers(values)
+    return _wrap(max(numbers), unit)
+
+
+def stddev(values: Iterable[Value], sample: bool = True) -> EngNumber | EngUnit:
+    """
+    Return the standard deviation of values sharing a unit.
+
+    Computed in one pass with RunningStats, so iterators are not stored.
+
+    Args:
+        values: EngUnit, EngNumber, engineering strings or plain numbers.
+        sample: Sample standard deviation (divide by n - 1); False gives
+            the population standard deviation.
+
+    Returns:
+        Standard deviation in the unit of the first value.
+
+    Raises:
+        AttributeError: If units do not match.
+        ValueError: If there are too few values.
+    """
+    stats = RunningStats(values)
+    return stats.stddev if sample else stats.pstddev
+
+
+class RunningStats:
+    """
+    Online count, mean, spread and range of values sharing a unit.
+
+    Uses Welford's algorithm, so values can be added one at a time from a
+    stream without keeping them. The state stays in Decimal until a float
+    value arrives, then continues in float.
+    """
+
+    __slots__ = ("_backend", "_count", "_m2", "_max", "_mean", "_min", "_unit")
+
+    def __init__(self, values: Iterable[Value] = ()) -> None:
+        """
+        Initialize the statistics.
+
+        Args:
+            values: Values to add right away.
+        """
+        self._backend = get_default_backend()
+        self._count = 0
+        self._mean: Decimal | float = Decimal(0)
+        self._m2: Decimal | float = Decimal(0)
+        self._min: Decimal | float = Decimal(0)
+        self._max: Decimal | float = Decimal(0)
+        self._unit: str | None = None
+        self.update(values)
+
+    def add(self, value: Value) -> None:
+        """
+        Add a value.
+
+        Args:
+            value: EngUnit, EngNumber, engineering string or plain number.
+
+        Raises:
+            AttributeError: If the unit does not match earlier values.
+        """
+        if self._count:
+            number = _in_unit(value, self._unit, self._backend)
+        else:
+            number, self._unit = _split(value, self._backend)
+
+        self._count += 1
+        if (
+            isinstance(number, Decimal)
+            and isinstance(self._mean, Decimal)
+            and isinstance(self._m2, Decimal)
+        ):
+            delta = number - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (number - self._mean)
+        else:
+            # the first float switches the state to float for good
+            number = float(number)
+            mean = float(self._mean)
+            offset = number - mean
+            mean += offset / self._count
+            self._m2 = float(self._m2) + offset * (number - mean)
+            self._mean = mean
+        if self._count == 1 or number < self._min:
+            self._min = number
+        if self._count == 1 or number > self._max:
+            self._max = number
+
+    def update(self, values: Iterable[Value]) -> None:
+        """
+        Add several values.
+
+        Args:
+            values: EngUnit, EngNumber, engineering strings or numbers.
+
+        Raises:
+            AttributeError: If a unit does not match earlier values.
+        """
+        for value in values:
+            self.add(value)
+
+    @property
+    def count(self) -> int:
+        """
+        Number of values added.
+        """
+        return self._count
+
+    @property
+    def unit(self) -> str | None:
+        """
+        Unit of the values, or None when unitless.
+        """
+        return self._unit
+
+    def _require(self, count: int) -> None:
+        """
+        Raise if fewer than count values were added.
+
+        Args:
+            count: Minimum number of values.
+
+        Raises:
+            ValueError: If fewer values were added.
+        """
+        if self._count < count:
+            raise ValueError(f"requires at least {count} values, got {self._count}")
+
+    @property
+    def mean(self) -> EngNumber | EngUnit:
+        """
+        Arithmetic mean; raises ValueError when empty.
+        """
+        self._require(1)
+        return _wrap(self._mean, self._unit)
+
+    @property
+    def minimum(self) -> EngNumber | EngUnit:
+        """
+        Smallest value; raises ValueError when empty.
+        """
+        self._require(1)
+        return _wrap(self._min, self._unit)
+
+    @property
+    def maximum(self) -> EngNumber | EngUnit:
+        """
+        Largest value; raises ValueError when empty.
+        """
+        self._require(1)
+        return _wrap(self._max, self._unit)
+
+    @property
+    def variance(self) -> Decimal | float:
+        """
+        Sample variance, in the unit squared; needs at least two values.
+        """
+        self._require(2)
+        return self._m2 / (self._count - 1)
+
+    @property
+    def stddev(self) -> EngNumber | EngUnit:
+        """
+        Sample standard deviation; needs at least two values.
+        """
+        return _wrap(_sqrt(self.variance), self._unit)
+
+    @property
+    def pstddev(self) -> EngNumber | EngUnit:
+        """
+        Population standard deviation; raises ValueError when empty.
+        """
+        self._require(1)
+        return _wrap(_sqrt(self._m2 / self._count), self._unit)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from decimal import Decimal
+from typing import TextIO
+
+from engineering_notation.eng_notation import (
+    EngNumber,
+    EngUnit,
+    _format_number,
+    _format_options,
+    _parse,
+    get_default_backend,
+)
+
+ALIGNMENTS = ("decimal", "prefix")
+
+Cell = str | int | float | Decimal | EngNumber | EngUnit | None
+
+
+def _cell(value: Cell, backend: str) -> tuple[Decimal | float | None, str]:
+    """
+    Split a table cell into the number EngNumber would store and its unit.
+
+    Args:
+        value: Cell value; None for an empty cell.
+        backend: "decimal" or "float".
+
+    Returns:
+        Tuple of the number (None for an empty cell) and the unit suffix.
+    """
+    if value is None:
+        return None, ""
+    number: Decimal | float
+    if isinstance(value, EngUnit):
+        return value.eng_num.number, value.unit or ""
+    if isinstance(value, EngNumber):
+        return value.number, ""
+    if isinstance(value, str):
+        number, unit = _parse(value)
+    elif backend == "float" and type(value) in (int, float):
+        return float(value), ""
+    elif isinstance(value, Decimal):
+        number, unit = value, None
+    else:
+        number, unit = Decimal(str(value)), None
+    if backend == "float":
+        number = float(number)
+    return number, unit or ""
+
+
+def _common_exponent(numbers: Iterable[Decimal | float | None]) -> int:
+    """
+    Pick the SI prefix exponent that suits the largest value of a column.
+
+    Args:
+        numbers: Column values; None entries are ignored.
+
+    Returns:
+        Exponent, a multiple of three (0 when the column has no nonzero
+        values).
+    """
+    # a float's shortest repr gives its decimal exponent, as when formatted
+    magnitudes = [
+        abs(Decimal(repr(n)) if isinstance(n, float) else n) for n in numbers if n
+    ]
+    if not magnitudes:
+        return 0
+    adjusted = max(magnitudes).adjusted()
+    return adjusted - adjusted % 3
+
+
+def _split(text: str) -> tuple[str, str, str]:
+    """
+    Split formatted text into integer part, fraction and SI prefix.
+
+    Args:
+        text: Output of _format_number() without a separator.
+
+    Returns:
+        Tuple of (integer part with sign, "." and decimals or "", prefix).
+    """
+    prefix = text[-1] if text[-1].isalpha() else ""
+    number = text[: len(text) - len(prefix)]
+    whole, point, fraction = number.partition(".")
+    return whole, point + fraction, prefix
+
+
+def format_table(
+    rows: Iterable[Sequence[Cell]],
+    precision: int | None = None,
+    significant: int = 0,
+    separator: str = "",
+    align: str = "decimal",
+    common_prefix: bool = False,
+    header: Sequence[str] | None = None,
+    column_separator: str = "  ",
+    file: TextIO | None = None,
+) -> str | None:
+    """
+    Format rows of numbers into an aligned engineering notation table.
+
+    Cells are formatted with the same rules as str(EngNumber(value)) (or
+    EngUnit for strings and values with a unit), without constructing an
+    object per cell.
+
+    Args:
+        rows: Rows of numbers, engineering strings, EngNumber/EngUnit values
+            or None for empty cells.
+        precision: Decimal places used when significant is 0.
+            Defaults to 2 when None.
+        significant: Significant digits; takes precedence over precision.
+        separator: String inserted between the numeric value and suffix.
+        align: "decimal" lines up the decimal points of a column; "prefix"
+            right-aligns the numbers so the SI prefixes line up.
+        common_prefix: Format every value of a column with the SI prefix of
+            its largest value.
+        header: Optional column titles.
+        column_separator: String placed between columns.
+        file: Optional text file to write the table to, line by line.
+
+    Returns:
+        The table, one line per row, or None when written to file.
+
+    Raises:
+        ValueError: If align is unknown.
+        KeyError: If a value has no SI prefix (for example, 1e24).
+    """
+    if align not in ALIGNMENTS:
+        raise ValueError(f"Unknown alignment {align!r}; expected one of {ALIGNMENTS}")
+
+    options = _format_options(
+        2 if precision is None else precision, precision is not None, significant, ""
+    )
+    backend = get_default_backend()
+    cells = [[_cell(value, backend) for value in row] for row in rows]
+    width = max((len(row) for row in cells), default=0)
+    if header is not None:
+        width = max(width, len(header))
+
+    columns = []
+    for index in range(width):
+        column = [row[index] if index < len(row) else (None, "") for row in cells]
+        exp = _common_exponent(n for n, _ in column) if common_prefix else None
+        parts = [
+            None
+            if number is None
+            else (*_split(_format_number(number, options, exp)), unit)
+            for number, unit in column
+        ]
+
+        # "decimal" splits each value at its decimal point, "prefix" before
+        # its suffix; heads are right-aligned and tails left-aligned
+        pairs: list[tuple[str, str] | None] = []
+        for part in parts:
+            if part is None:
+                pairs.append(None)
+                continue
+            whole, fraction, prefix, unit = part
+            suffix = separator + prefix + unit
+            if align == "decimal":
+                pairs.append((whole, fraction + suffix))
+            else:
+                pairs.append((whole + fraction, suffix))
+
+        present = [pair for pair in pairs if pair is not None]
+        head_width = max((len(head) for head, _ in present), default=0)
+        tail_width = max((len(tail) for _, tail in present), default=0)
+        texts = [
+            ""
+            if pair is None
+            else pair[0].rjust(head_width) + pair[1].ljust(tail_width)
+            for pair in pairs
+        ]
+
+        title = header[index] if header is not None and index < len(header) else ""
+        column_width = max([len(title), *(len(text) for text in texts)])
+        columns.append(
+            (
+                title.rjust(column_width),
+                [text.rjust(column_width) for text in texts],
+            )
+        )
+
+    lines = []
+    if header is not None:
+        lines.append(column_separator.join(title for title, _ in columns).rstrip())
+    for row in range(len(cells)):
+        lines.append(column_separator.join(texts[row] for _, texts in columns).rstrip())
+
+    if file is None:
+        return "".join(line + "\n" for line in lines)
+    for line in lines:
+        file.write(line + "\n")
+    return None
@@ -0,0 +1,538 @@
+from __future__ import annotations
+
+import re
+import threading
+from decimal import Decimal
+from functools import lru_cache
+
+# SI prefix of every power of a thousand from 1e-30 to 1e30, indexed by
+# exponent // 3 + _PREFIX_OFFSET and shared by parsing and formatting; None
+# marks a power without a prefix here
+_prefixes = (
+    "q",
+    "r",
+    "y",
+    "z",
+    "a",
+    "f",
+    "p",
+    "n",
+    "u",
+    "m",
+    "",
+    "k",
+    "M",
+    "G",
+    "T",
+    "P",
+    "E",
+    "Z",
+    None,
+    "R",
+    "Q",
+)
+_PREFIX_OFFSET = 10
+
+# power of ten applied by each prefix
+_prefix_scale = {
+    prefix: 3 * (index - _PREFIX_OFFSET)
+    for index, prefix in enumerate(_prefixes)
+    if prefix is not None
+}
+
+# dimensions of the built-in units over the SI base units (m, kg, s, A, K,
+# mol, cd) and their scale to the coherent unit; any other name is treated
+# as a base of its own, so unknown units still cancel and compare
+_SI_UNITS: dict[str, tuple[dict[str, int], Decimal]] = {
+    "m": ({"m": 1}, Decimal(1)),
+    "kg": ({"kg": 1}, Decimal(1)),
+    "s": ({"s": 1}, Decimal(1)),
+    "A": ({"A": 1}, Decimal(1)),
+    "K": ({"K": 1}, Decimal(1)),
+    "mol": ({"mol": 1}, Decimal(1)),
+    "cd": ({"cd": 1}, Decimal(1)),
+    "g": ({"kg": 1}, Decimal("0.001")),
+    "Hz": ({"s": -1}, Decimal(1)),
+    "N": ({"kg": 1, "m": 1, "s": -2}, Decimal(1)),
+    "Pa": ({"kg": 1, "m": -1, "s": -2}, Decimal(1)),
+    "J": ({"kg": 1, "m": 2, "s": -2}, Decimal(1)),
+    "W": ({"kg": 1, "m": 2, "s": -3}, Decimal(1)),
+    "C": ({"A": 1, "s": 1}, Decimal(1)),
+    "V": ({"kg": 1, "m": 2, "s": -3, "A": -1}, Decimal(1)),
+    "F": ({"kg": -1, "m": -2, "s": 4, "A": 2}, Decimal(1)),
+    "ohm": ({"kg": 1, "m": 2, "s": -3, "A": -2}, Decimal(1)),
+    "Ω": ({"kg": 1, "m": 2, "s": -3, "A": -2}, Decimal(1)),
+    "S": ({"kg": -1, "m": -2, "s": 3, "A": 2}, Decimal(1)),
+    "Wb": ({"kg": 1, "m": 2, "s": -2, "A": -1}, Decimal(1)),
+    "T": ({"kg": 1, "s": -2, "A": -1}, Decimal(1)),
+    "H": ({"kg": 1, "m": 2, "s": -2, "A": -2}, Decimal(1)),
+}
+
+_term_re_cache: re.Pattern[str] | None = None
+
+
+def _term_re() -> re.Pattern[str]:
+    """
+    Return the pattern matching one term of a unit string: operator, name
+    and optional integer power; compiled on first use.
+
+    Returns:
+        Compiled pattern.
+    """
+    global _term_re_cache
+    if _term_re_cache is None:
+        _term_re_cache = re.compile(r"([*/]?)([^*/^]+)(?:\^([+-]?\d+))?")
+    return _term_re_cache
+
+
+class Unit:
+    """
+    Unit of measure as a canonical dimension vector and scale.
+
+    Units are interned: parsing the same string, or composing the same
+    pair of units, returns the same instance, so composition is a cache
+    lookup and compatible units compare by their dimension key.
+    """
+
+    __slots__ = ("_dimensions", "_name", "_scale", "_terms")
+
+    def __init__(
+        self,
+        name: str,
+        terms: tuple[tuple[str, int], ...],
+        dimensions: tuple[tuple[str, int], ...],
+        scale: Decimal,
+    ) -> None:
+        """
+        Initialize the unit; use unit() to obtain interned instances.
+
+        Args:
+            name: Rendered unit string.
+            terms: Named terms and their powers, in written order.
+            dimensions: Powers of each base, sorted by base name.
+            scale: Factor to the coherent SI unit of the same dimensions.
+        """
+        self._name = name
+        self._terms = terms
+        self._dimensions = dimensions
+        self._scale = scale
+
+    @property
+    def name(self) -> str:
+        """
+        Unit string, empty for dimensionless values.
+        """
+        return self._name
+
+    @property
+    def terms(self) -> tuple[tuple[str, int], ...]:
+        """
+        Named terms and their powers (for example, (("m", 1), ("s", -2))).
+        """
+        return self._terms
+
+    @property
+    def dimensions(self) -> tuple[tuple[str, int], ...]:
+        """
+        Powers of each base unit, sorted by base name.
+        """
+        return self._dimensions
+
+    @property
+    def scale(self) -> Decimal:
+        """
+        Factor to the coherent SI unit with the same dimensions.
+        """
+        return self._scale
+
+    @property
+    def key(self) -> tuple[tuple[tuple[str, int], ...], Decimal]:
+        """
+        Dimensions and scale; units with equal keys are interchangeable.
+        """
+        return self._dimensions, self._scale
+
+    def __repr__(self) -> str:
+        """
+        Return a debugging representation.
+
+        Returns:
+            String such as "Unit('m/s^2')".
+        """
+        return f"Unit({self._name!r})"
+
+
+def _render(terms: tuple[tuple[str, int], ...]) -> str:
+    """
+    Render terms as a unit string.
+
+    Positive powers are joined with "*" and each negative power follows a
+    "/", so "m/s^2" and "/s" round-trip through unit().
+
+    Args:
+        terms: Named terms and their powers.
+
+    Returns:
+        Unit string.
+    """
+    numerator = "*".join(
+        name if power == 1 else f"{name}^{power}" for name, power in terms if power > 0
+    )
+    denominator = "".join(
+        f"/{name}" if power == -1 else f"/{name}^{-power}"
+        for name, power in terms
+        if power < 0
+    )
+    return numerator + denominator
+
+
+class _Registry:
+    """
+    Snapshot of the registered units and the units interned from them.
+
+    The definitions and names of a snapshot are never modified once it is
+    published: register_unit() builds a new one and swaps it in, so readers
+    need no lock, and caches keyed on the snapshot never mix results from
+    before and after a registration. The interning cache is the one part
+    that changes afterwards; it only grows, through dict.setdefault, so
+    concurrent readers still agree on one Unit per spelling.
+    """
+
+    __slots__ = ("definitions", "interned", "names")
+
+    def __init__(self, definitions: dict[str, tuple[dict[str, int], Decimal]]) -> None:
+        """
+        Build a snapshot.
+
+        Args:
+            definitions: Dimensions and scale of each registered name.
+        """
+        self.definitions = definitions
+        self.interned: dict[tuple[tuple[str, int], ...], Unit] = {}
+        # first name registered for each dimension key, used to name products
+        self.names: dict[tuple[tuple[tuple[str, int], ...], Decimal], str] = {}
+        for name in definitions:
+            self.names.setdefault(_build({name: 1}, self).key, name)
+
+    def definition(self, name: str) -> tuple[dict[str, int], Decimal]:
+        """
+        Look up the dimensions and scale of a single term.
+
+        A name that is not registered but is an SI prefix followed by a
+        registered name (for example, "kohm" or "mV") is scaled accordingly.
+
+        Args:
+            name: Term name.
+
+        Returns:
+            Tuple of the base powers and the scale to the coherent unit.
+        """
+        found = self.definitions.get(name)
+        if found is not None:
+            return found
+        if len(name) > 1 and name[0] in _prefix_scale:
+            found = self.definitions.get(name[1:])
+            if found is not None:
+                base, scale = found
+                return base, scale.scaleb(_prefix_scale[name[0]])
+        return {name: 1}, Decimal(1)
+
+    def intern(
+        self,
+        terms: tuple[tuple[str, int], ...],
+        dimensions: tuple[tuple[str, int], ...],
+        scale: Decimal,
+    ) -> Unit:
+        """
+        Return the single Unit instance for a tuple of terms.
+
+        Args:
+            terms: Named terms and their powers.
+            dimensions: Powers of each base, sorted by base name.
+            scale: Factor to the coherent SI unit.
+
+        Returns:
+            Interned unit.
+        """
+        found = self.interned.get(terms)
+        if found is None:
+            found = self.interned.setdefault(
+                terms, Unit(_render(terms), terms, dimensions, scale)
+            )
+        return found
+
+
+def _build(terms: dict[str, int], registry: _Registry) -> Unit:
+    """
+    Reduce terms to an interned unit.
+
+    Terms whose powers cancel are dropped; a unit that cancels to no
+    dimensions is dimensionless, and a product of several terms that
+    matches a named unit takes its name (for example, "V/A" is "ohm").
+
+    Args:
+        terms: Named terms and their powers.
+        registry: Registry snapshot to resolve the terms with.
+
+    Returns:
+        Interned unit.
+    """
+    dimensions: dict[str, int] = {}
+    scale = Decimal(1)
+    kept = []
+    for name, power in terms.items():
+        if not power:
+            continue
+        kept.append((name, power))
+        base, factor = registry.definition(name)
+        for dimension, exponent in base.items():
+            dimensions[dimension] = dimensions.get(dimension, 0) + exponent * power
+        scale *= factor**power
+
+    key = (tuple(sorted((d, e) for d, e in dimensions.items() if e)), scale)
+    if not key[0] and scale == 1:
+        kept = []
+    elif len(kept) > 1 and key in registry.names:
+        kept = [(registry.names[key], 1)]
+    return registry.intern(tuple(kept), *key)
+
+
+def _parse_unit(name: str | None, registry: _Registry) -> Unit:
+    """
+    Parse a unit string against a registry snapshot.
+
+    Args:
+        name: Unit string; None or "" for dimensionless values.
+        registry: Registry snapshot to resolve the terms with.
+
+    Returns:
+        Interned unit.
+    """
+    if not name:
+        return registry.intern((), (), Decimal(1))
+
+    terms: dict[str, int] = {}
+    term_re = _term_re()
+    position = 0
+    while position < len(name):
+        match = term_re.match(name, position)
+        if match is None:
+            # a stray operator, such as in "m//s", is part of the name
+            terms = {name: 1}
+            break
+        op, term, power = match.groups()
+        sign = -1 if op == "/" else 1
+        terms[term] = terms.get(term, 0) + sign * int(power or 1)
+        position = match.end()
+
+    return _build(terms, registry)
+
+
+def _compose_uncached(left: str, right: str, op: str, registry: _Registry) -> str:
+    """
+    Compose the unit string of a product or quotient.
+
+    Args:
+        left: Unit string of the left operand, or an empty string.
+        right: Unit string of the right operand, or an empty string.
+        op: Operation identifier ("mul" or "div").
+        registry: Registry snapshot to resolve the units with.
+
+    Returns:
+        Canonical unit string of the result, empty when dimensionless.
+
+    Raises:
+        ValueError: If the operation is unsupported.
+    """
+    if op == "mul":
+        sign = 1
+    elif op == "div":
+        sign = -1
+    else:
+        raise ValueError(f"Unsupported unit operation: {op}")
+    # scaling by a plain number keeps the unit as written
+    if not right:
+        return left
+    if not left and op == "mul":
+        return right
+
+    terms = dict(_unit(left, registry).terms)
+    for name, power in _unit(right, registry).terms:
+        terms[name] = terms.get(name, 0) + sign * power
+    return _build(terms, registry).name
+
+
+def _conversion_uncached(
+    source: str | None, target: str | None, registry: _Registry
+) -> Decimal:
+    """
+    Compute the factor converting values from one unit to another.
+
+    Args:
+        source: Unit string the values are in.
+        target: Unit string to convert to.
+        registry: Registry snapshot to resolve the units with.
+
+    Returns:
+        Factor to multiply values in source by.
+
+    Raises:
+        AttributeError: If the units measure different quantities.
+    """
+    source_unit = _unit(source, registry)
+    target_unit = _unit(target, registry)
+    if source_unit.dimensions != target_unit.dimensions:
+        raise AttributeError("units do not match")
+    return source_unit.scale / target_unit.scale
+
+
+_unit = lru_cache(maxsize=1024)(_parse_unit)
+_compose = lru_cache(maxsize=1024)(_compose_uncached)
+_conversion = lru_cache(maxsize=1024)(_conversion_uncached)
+
+_registry_lock = threading.Lock()
+# built on first use, as interning the SI units is a noticeable share of
+# the package's import time
+_registry: _Registry | None = None
+
+
+def _current() -> _Registry:
+    """
+    Return the current registry snapshot, building the SI one on first use.
+
+    Returns:
+        Registry snapshot.
+    """
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _Registry(_SI_UNITS)
+            registry = _registry
+    return registry
+
+
+def unit(name: str | None) -> Unit:
+    """
+    Parse a unit string into its interned unit.
+
+    Terms are separated by "*" or "/" and may carry an integer power, as in
+    "kg*m/s^2"; "/" applies to the term that follows it only. Registered
+    names may carry an SI prefix ("kohm", "mV"), and other names (for
+    example, "meter" or "dB") are kept as their own dimension.
+
+    Args:
+        name: Unit string; None or "" for dimensionless values.
+
+    Returns:
+        Interned unit; its name is the canonical spelling, so "V/A" parses
+        to the unit named "ohm".
+    """
+    return _unit(name, _current())
+
+
+def compose(left: str, right: str, op: str) -> str:
+    """
+    Compose the unit string of a product or quotient.
+
+    Args:
+        left: Unit string of the left operand, or an empty string.
+        right: Unit string of the right operand, or an empty string.
+        op: Operation identifier ("mul" or "div").
+
+    Returns:
+        Canonical unit string of the result, empty when dimensionless.
+
+    Raises:
+        ValueError: If the operation is unsupported.
+    """
+    return _compose(left, right, op, _current())
+
+
+def conversion_factor(source: str | None, target: str | None) -> Decimal:
+    """
+    Return the factor converting values from one unit to another.
+
+    Factors are computed once per pair of unit strings and cached.
+
+    Args:
+        source: Unit string the values are in (for example, "mV").
+        target: Unit string to convert to (for example, "V").
+
+    Returns:
+        Factor to multiply values in source by, such as Decimal("0.001").
+
+    Raises:
+        AttributeError: If the units measure different quantities.
+    """
+    return _conversion(source, target, _current())
+
+
+def same_unit(left: str | None, right: str | None) -> bool:
+    """
+    Check whether two unit strings measure the same quantity on one scale.
+
+    Args:
+        left: Unit string or None.
+        right: Unit string or None.
+
+    Returns:
+        True for identical strings and for spellings of the same unit,
+        such as "Hz" and "/s" or "V/A" and "ohm".
+    """
+    if (left or "") == (right or ""):
+        return True
+    return unit(left).key == unit(right).key
+
+
+def register_unit(
+    name: str,
+    definition: str | None = None,
+    scale: str | float | Decimal = 1,
+) -> Unit:
+    """
+    Register a unit, optionally defined in terms of known units.
+
+    Registration is thread-safe and may happen at any time; values already
+    computed keep their units, and later parsing, composition and
+    conversion see the new unit.
+
+    Args:
+        name: Unit name, without "*", "/" or "^" (for example, "mil").
+        definition: Unit string the new unit is a multiple of (for
+            example, "m"); None registers a new base dimension.
+        scale: Size of the new unit in units of the definition (for
+            example, "25.4e-6").
+
+    Returns:
+        The registered unit.
+
+    Raises:
+        ValueError: If the name is invalid, a scale is given without a
+            definition, or the name is already registered differently.
+    """
+    global _registry
+
+    if not name or any(c in name for c in "*/^"):
+        raise ValueError(f"Invalid unit name: {name!r}")
+    scale = Decimal(str(scale))
+    if definition is None and scale != 1:
+        raise ValueError("A scale requires a definition")
+
+    with _registry_lock:
+        registry = _registry
+        if registry is None:
+            registry = _registry = _Registry(_SI_UNITS)
+        if definition is None:
+            entry = ({name: 1}, Decimal(1))
+        else:
+            base = _unit(definition, registry)
+            entry = (dict(base.dimensions), base.scale * scale)
+
+        existing = registry.definitions.get(name)
+        if existing is None:
+            _registry = _Registry({**registry.definitions, name: entry})
+        elif existing != entry:
+            raise ValueError(f"Unit {name!r} is already registered")
+        return _unit(name, _registry)
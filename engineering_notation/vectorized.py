@@ -0,0 +1,580 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from string import ascii_letters
+from typing import Any
+
+from engineering_notation.eng_notation import (
+    _PREFIX_OFFSET,
+    _TIE_TOLERANCE,
+    EngNumber,
+    EngUnit,
+    _parse,
+    _prefix_scale,
+    _prefixes,
+    _suffix_keys,
+)
+from engineering_notation.units import compose, conversion_factor
+
+# characters which may appear in a plain numeric literal accepted by _NUM_RE
+_NUMERIC_CHARS = "0123456789.+-eE"
+
+# values whose scaled mantissa exceeds this are not exactly representable
+# as integers after rounding and are handed to the scalar formatter
+_MAX_FAST_MANTISSA = 1e15
+
+_pow10_cache: Any = None
+
+
+def _require_numpy() -> Any:
+    """
+    Import and return the numpy module or raise when it is not installed.
+
+    numpy is only imported on first use so that importing the package stays
+    cheap for code that never touches arrays.
+
+    Returns:
+        The imported numpy module.
+
+    Raises:
+        ImportError: If numpy is not available.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for vectorized engineering notation"
+        ) from None
+    return numpy
+
+
+def _pow10() -> Any:
+    """
+    Return a table of correctly rounded powers of ten.
+
+    Entry ``k + 400`` holds the double nearest to ``10**k``, which is what
+    the shortest repr of a float is compared against.
+
+    Returns:
+        Float64 array covering exponents -400 through 400.
+    """
+    global _pow10_cache
+    if _pow10_cache is None:
+        np = _require_numpy()
+        _pow10_cache = np.array(
+            [float(f"1e{exp}") for exp in range(-400, 401)], dtype=np.float64
+        )
+    return _pow10_cache
+
+
+def parse_array(strings: Iterable[str]) -> Any:
+    """
+    Parse engineering notation strings into a float64 array.
+
+    Produces the same values as ``float(EngNumber(s))`` for every element;
+    strings outside the plain ``<number><prefix><unit>`` form are handed to
+    the scalar parser.
+
+    Args:
+        strings: Iterable or array of strings (for example, "10k", "100nF").
+
+    Returns:
+        numpy.ndarray of float64 with the same shape as the input.
+
+    Raises:
+        ImportError: If numpy is not available.
+    """
+    np = _require_numpy()
+    arr = np.asarray(strings, dtype=np.str_)
+    shape = arr.shape
+    flat = arr.ravel()
+    result = np.empty(flat.shape, dtype=np.float64)
+    if flat.size == 0:
+        return result.reshape(shape)
+
+    numeric = np.strings.rstrip(flat, ascii_letters)
+    numeric_len = np.strings.str_len(numeric)
+    prefix = np.strings.slice(flat, numeric_len, numeric_len + 1)
+
+    exponent = np.zeros(flat.shape, dtype="U4")
+    has_prefix = np.zeros(flat.shape, dtype=bool)
+    for suffix in _suffix_keys:
+        mask = prefix == suffix
+        exponent[mask] = f"e{_prefix_scale[suffix]}"
+        has_prefix |= mask
+
+    has_exponent = np.strings.find(np.strings.lower(numeric), "e") >= 0
+    fast = (
+        (numeric_len > 0)
+        & (np.strings.strip(numeric, _NUMERIC_CHARS) == "")
+        & ~(has_exponent & has_prefix)
+    )
+
+    fast_idx = np.flatnonzero(fast)
+    try:
+        result[fast_idx] = np.strings.add(numeric[fast_idx], exponent[fast_idx]).astype(
+            np.float64
+        )
+    except ValueError:
+        # malformed literal somewhere in the batch; let the scalar parser
+        # decide what each of these strings means
+        fast[:] = False
+
+    for i in np.flatnonzero(~fast):
+        result[i] = float(EngNumber(str(flat[i]), backend="decimal"))
+
+    return result.reshape(shape)
+
+
+def format_array(
+    values: Iterable[float] | Any,
+    precision: int | None = None,
+    significant: int = 0,
+    separator: str = "",
+) -> Any:
+    """
+    Format numbers into engineering notation strings.
+
+    Exponent buckets, rounding and SI prefix lookup are computed over the
+    whole array. The output is identical to ``str(EngNumber(float(v), ...))``
+    for each element; values close to a rounding tie, or outside the SI
+    prefix range, are handed to the scalar formatter.
+
+    Args:
+        values: Iterable or array of numbers.
+        precision: Decimal places used when significant is 0.
+            Defaults to 2 when None.
+        significant: Significant digits; takes precedence over precision.
+        separator: String inserted between the numeric value and suffix.
+
+    Returns:
+        numpy.ndarray of str with the same shape as the input.
+
+    Raises:
+        ImportError: If numpy is not available.
+    """
+    np = _require_numpy()
+    arr = np.asarray(values, dtype=np.float64)
+    shape = arr.shape
+    flat = arr.ravel()
+    if flat.size == 0:
+        return np.empty(shape, dtype=np.str_)
+
+    explicit = precision is not None
+    precision = 2 if precision is None else precision
+    strip_zeros = precision == 2 and significant == 0 and not explicit
+    pow10 = _pow10()
+
+    magnitude = np.abs(flat)
+    finite = np.isfinite(flat)
+    zero = flat == 0
+    nonzero = finite & ~zero
+
+    # decimal exponent of the leading digit, matching Decimal.adjusted()
+    adjusted = np.zeros(flat.shape, dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adjusted[nonzero] = np.floor(np.log10(magnitude[nonzero]))
+    adjusted = np.clip(adjusted, -399, 399)
+    adjusted += magnitude >= pow10[adjusted + 401]
+    adjusted -= nonzero & (magnitude < pow10[adjusted + 400])
+    exponent = adjusted - adjusted % 3
+
+    prefix_index = exponent // 3 + _PREFIX_OFFSET
+    in_range = (prefix_index >= 0) & (prefix_index < len(_prefixes))
+    prefix_index = np.clip(prefix_index, 0, len(_prefixes) - 1)
+    prefix_table = np.array([p if p is not None else "" for p in _prefixes])
+    prefix_known = np.array([p is not None for p in _prefixes])
+    in_range &= prefix_known[prefix_index]
+
+    if significant > 0:
+        digits = significant - 1 - (adjusted - exponent)
+    else:
+        digits = np.full(flat.shape, precision, dtype=np.int64)
+
+    # mantissa scaled so that rounding to an integer applies the precision
+    scale = np.clip(digits - exponent, -400, 400)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        scaled = np.where(
+            scale >= 0,
+            magnitude * pow10[scale + 400],
+            magnitude / pow10[-scale + 400],
+        )
+        fraction = scaled - np.floor(scaled)
+        tie = np.abs(fraction - 0.5) <= scaled * _TIE_TOLERANCE
+    fast = nonzero & in_range & (scaled < _MAX_FAST_MANTISSA) & ~tie
+
+    rounded = np.zeros(flat.shape, dtype=np.int64)
+    rounded[fast] = np.floor(scaled[fast] + 0.5)
+
+    base = np.zeros(flat.shape, dtype="U64")
+    for places in np.unique(digits[fast]):
+        mask = fast & (digits == places)
+        if places <= 0:
+            # Decimal drops both the sign and the padding when rounding
+            # to tens or beyond leaves nothing
+            text = np.strings.add(rounded[mask].astype(np.str_), "0" * -places)
+            base[mask] = np.where(rounded[mask] == 0, "0", text)
+            continue
+        whole, part = np.divmod(rounded[mask], 10**places)
+        part_str = np.strings.zfill(part.astype(np.str_), places)
+        text = np.strings.add(np.strings.add(whole.astype(np.str_), "."), part_str)
+        if strip_zeros:
+            text = np.where(part == 0, whole.astype(np.str_), text)
+        base[mask] = text
+
+    # zero is never scaled; Decimal renders it without an exponent only
+    # for up to six decimal places
+    for places in np.unique(digits[zero]):
+        mask = zero & (digits == places)
+        if places <= 0 or places > 6 or (strip_zeros and places == 2):
+            base[mask] = "0"
+        else:
+            base[mask] = "0." + "0" * places
+
+    sign = np.where(fast & (flat < 0) & (rounded != 0), "-", "")
+    prefix = np.where(zero, "", prefix_table[prefix_index])
+    result = np.strings.add(np.strings.add(sign, base), separator)
+    result = np.strings.add(result, prefix)
+
+    slow = ~(fast | zero)
+    if slow.any():
+        result = result.astype(object)
+        for i in np.flatnonzero(slow):
+            result[i] = str(
+                EngNumber(
+                    float(flat[i]),
+                    precision if explicit else None,
+                    significant,
+                    separator,
+                    backend="decimal",
+                )
+            )
+        result = result.astype(np.str_)
+
+    width = max(int(np.strings.str_len(result).max()), 1)
+    return result.astype(f"U{width}").reshape(shape)
+
+
+# ufuncs whose operands must share a unit, which the result keeps
+_SAME_UNIT_UFUNCS = frozenset(
+    ("add", "subtract", "maximum", "minimum", "fmax", "fmin", "fmod", "remainder")
+)
+# ufuncs whose single operand's unit is kept
+_KEEP_UNIT_UFUNCS = frozenset(
+    ("negative", "positive", "absolute", "fabs", "rint", "floor", "ceil", "trunc")
+)
+# ufuncs whose operands must share a unit and which return booleans
+_COMPARISON_UFUNCS = frozenset(
+    ("less", "less_equal", "greater", "greater_equal", "equal", "not_equal")
+)
+_UNIT_OPS = {"multiply": "mul", "divide": "div", "true_divide": "div"}
+
+
+def _ufunc_method(name: str, reflected: bool = False) -> Any:
+    """
+    Build an operator method that calls a numpy ufunc.
+
+    Args:
+        name: Name of the ufunc in the numpy namespace.
+        reflected: Pass the operands in reverse order.
+
+    Returns:
+        Method taking the other operand.
+    """
+
+    def method(self: EngArray, other: Any) -> Any:
+        ufunc = getattr(_require_numpy(), name)
+        return ufunc(other, self) if reflected else ufunc(self, other)
+
+    return method
+
+
+class EngArray:
+    """
+    Array of engineering values held in a float64 numpy array.
+
+    Arithmetic and comparisons run as numpy ufuncs over the whole array,
+    with the same unit rules as EngUnit: addition, subtraction and
+    comparisons require matching units, while multiplication and division
+    compose them. The repr renders each element in engineering notation.
+    """
+
+    __slots__ = ("_data", "_precision", "_separator", "_significant", "_unit")
+
+    def __init__(
+        self,
+        values: Iterable[Any] | Any,
+        unit: str | None = None,
+        precision: int | None = None,
+        significant: int = 0,
+        separator: str = "",
+    ) -> None:
+        """
+        Initialize an array of engineering values.
+
+        Args:
+            values: Numbers, EngNumber/EngUnit values, engineering strings
+                or another EngArray.
+            unit: Unit shared by every element; units inside the values are
+                not kept.
+            precision: Decimal places used when significant is 0.
+                Defaults to 2 when None.
+            significant: Significant digits; takes precedence over precision.
+            separator: String inserted between the numeric value and suffix.
+
+        Raises:
+            ImportError: If numpy is not available.
+        """
+        np = _require_numpy()
+        if isinstance(values, EngArray):
+            data = values._data.copy()
+            if unit is None:
+                unit = values._unit
+        else:
+            data = np.asarray(values)
+            if data.dtype.kind in "US":
+                data = parse_array(data)
+            else:
+                data = data.astype(np.float64)
+
+        self._data: Any = data
+        self._unit: str | None = unit if unit else None
+        self._precision = precision
+        self._significant = significant
+        self._separator = separator
+
+    @property
+    def data(self) -> Any:
+        """
+        Underlying float64 numpy array.
+        """
+        return self._data
+
+    @property
+    def unit(self) -> str | None:
+        """
+        Unit shared by every element, or None when unitless.
+        """
+        return self._unit
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        Shape of the array.
+        """
+        return self._data.shape
+
+    def _wrap(self, data: Any, unit: str | None) -> EngArray:
+        """
+        Build an EngArray with the same formatting options.
+
+        Args:
+            data: float64 numpy array.
+            unit: Unit of the new array.
+
+        Returns:
+            New EngArray sharing the data.
+        """
+        result = object.__new__(EngArray)
+        result._data = data
+        result._unit = unit if unit else None
+        result._precision = self._precision
+        result._significant = self._significant
+        result._separator = self._separator
+        return result
+
+    def __array__(self, dtype: object = None, copy: bool | None = None) -> Any:
+        """
+        Return the values as a plain numpy array.
+
+        Args:
+            dtype: Requested numpy dtype; float64 when None.
+            copy: Copy the data when True.
+
+        Returns:
+            numpy.ndarray of the values, without the unit.
+        """
+        if dtype is None and not copy:
+            return self._data
+        return self._data.astype(dtype or self._data.dtype, copy=bool(copy))
+
+    def __array_ufunc__(
+        self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Apply a numpy ufunc to the values and work out the unit of the result.
+
+        Args:
+            ufunc: The numpy ufunc being applied.
+            method: Ufunc method; only direct calls are supported.
+            inputs: Operands, which may be EngArray, EngUnit, EngNumber,
+                engineering strings, numbers or numpy arrays.
+            kwargs: Keyword arguments for the ufunc.
+
+        Returns:
+            EngArray for numeric results, or a plain numpy array for
+            comparisons and non-numeric results.
+
+        Raises:
+            AttributeError: If units do not match.
+        """
+        if method != "__call__" or "out" in kwargs:
+            return NotImplemented
+
+        values = []
+        units = []
+        for item in inputs:
+            if isinstance(item, EngArray):
+                values.append(item._data)
+                units.append(item._unit or "")
+            elif isinstance(item, EngUnit):
+                values.append(float(item))
+                units.append(item.unit or "")
+            elif isinstance(item, str):
+                number, unit = _parse(item)
+                values.append(float(number))
+                units.append(unit or "")
+            else:
+                values.append(item)
+                units.append("")
+
+        name = ufunc.__name__
+        matching = name in _SAME_UNIT_UFUNCS or name in _COMPARISON_UFUNCS
+        if matching:
+            # operands in compatible units are scaled to the first one
+            for i in range(1, len(units)):
+                if units[i] != units[0]:
+                    factor = conversion_factor(units[i], units[0])
+                    if factor != 1:
+                        values[i] = values[i] * float(factor)
+
+        result = ufunc(*values, **kwargs)
+        if name in _COMPARISON_UFUNCS or isinstance(result, tuple):
+            return result
+        if getattr(result, "dtype", None) is None or result.dtype.kind not in "fiu":
+            return result
+
+        if name in _UNIT_OPS:
+            unit = compose(units[0], units[1], _UNIT_OPS[name])
+        elif name in _SAME_UNIT_UFUNCS or name in _KEEP_UNIT_UFUNCS:
+            unit = units[0]
+        else:
+            unit = None
+        return self._wrap(_require_numpy().asarray(result, dtype="float64"), unit)
+
+    __add__ = _ufunc_method("add")
+    __radd__ = _ufunc_method("add", reflected=True)
+    __sub__ = _ufunc_method("subtract")
+    __rsub__ = _ufunc_method("subtract", reflected=True)
+    __mul__ = _ufunc_method("multiply")
+    __rmul__ = _ufunc_method("multiply", reflected=True)
+    __truediv__ = _ufunc_method("true_divide")
+    __rtruediv__ = _ufunc_method("true_divide", reflected=True)
+    __lt__ = _ufunc_method("less")
+    __le__ = _ufunc_method("less_equal")
+    __gt__ = _ufunc_method("greater")
+    __ge__ = _ufunc_method("greater_equal")
+    __eq__ = _ufunc_method("equal")  # type: ignore[assignment]
+    __ne__ = _ufunc_method("not_equal")  # type: ignore[assignment]
+    __hash__ = None  # type: ignore[assignment]
+
+    def __neg__(self) -> EngArray:
+        """
+        Negate every element.
+
+        Returns:
+            EngArray with the same unit.
+        """
+        return _require_numpy().negative(self)
+
+    def __abs__(self) -> EngArray:
+        """
+        Absolute value of every element.
+
+        Returns:
+            EngArray with the same unit.
+        """
+        return _require_numpy().absolute(self)
+
+    def __len__(self) -> int:
+        """
+        Return the length of the first dimension.
+
+        Returns:
+            Number of elements along the first axis.
+        """
+        return len(self._data)
+
+    def __getitem__(self, key: Any) -> EngArray | EngNumber | EngUnit:
+        """
+        Index or slice the array.
+
+        Args:
+            key: Any numpy index.
+
+        Returns:
+            EngUnit (or EngNumber when unitless) for a single element,
+            otherwise an EngArray.
+        """
+        item = self._data[key]
+        if getattr(item, "ndim", 0):
+            return self._wrap(item, self._unit)
+        if self._unit:
+            return EngUnit(
+                float(item),
+                self._precision,
+                self._significant,
+                self._unit,
+                self._separator,
+            )
+        return EngNumber(
+            float(item), self._precision, self._significant, self._separator
+        )
+
+    def __iter__(self) -> Iterator[EngArray | EngNumber | EngUnit]:
+        """
+        Iterate over the first dimension.
+
+        Returns:
+            Iterator over elements or sub-arrays.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def _text(self) -> Any:
+        """
+        Format every element with its SI prefix and unit.
+
+        Returns:
+            numpy.ndarray of str with the same shape as the array.
+        """
+        np = _require_numpy()
+        text = format_array(
+            self._data, self._precision, self._significant, self._separator
+        )
+        if self._unit:
+            text = np.strings.add(text, self._unit)
+        return text
+
+    def __str__(self) -> str:
+        """
+        Return the elements in engineering notation, numpy style.
+
+        Returns:
+            String such as "[1k 2.20k]".
+        """
+        np = _require_numpy()
+        return np.array2string(self._text(), formatter={"all": str})
+
+    def __repr__(self) -> str:
+        """
+        Return the elements in engineering notation.
+
+        Returns:
+            String such as "EngArray([1kohm, 2.20kohm])".
+        """
+        np = _require_numpy()
+        body = np.array2string(
+            self._text(), separator=", ", prefix="EngArray(", formatter={"all": str}
+        )
+        return f"EngArray({body})"
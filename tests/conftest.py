@@ -0,0 +1,13 @@
+import pytest
+
+from engineering_notation import units
+
+
+@pytest.fixture
+def unit_registry():
+    # registered units are process-wide; restore the snapshot afterwards so
+    # they do not leak into tests that run later
+    registry = units._registry
+    yield
+    with units._registry_lock:
+        units._registry = registry
@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from engineering_notation import EngUnit
+from engineering_notation.aio import iter_stream
+from engineering_notation.io import ParseStats
+
+FEED = b"VOLT 3.300V\nCURR 12.5mA\n\n  FREQ 1.000kHz\r\n-1.5\n"
+
+
+async def _collect(data: bytes, **kwargs) -> list[list]:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return [batch async for batch in iter_stream(reader, **kwargs)]
+
+
+def test_iter_stream_objects():
+    batches = asyncio.run(_collect(FEED))
+
+    assert batches == [
+        [EngUnit("3.3V"), EngUnit("12.5mA"), EngUnit("1kHz"), EngUnit("-1.5")]
+    ]
+    assert [str(v) for v in batches[0]] == ["3.30V", "12.50mA", "1kHz", "-1.50"]
+
+
+def test_iter_stream_floats_and_batches():
+    stats = ParseStats()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        batches = asyncio.run(
+            _collect(
+                FEED * 3,
+                as_float=True,
+                batch_size=5,
+                executor=executor,
+                stats=stats,
+            )
+        )
+
+    values = [3.3, 12.5e-3, 1e3, -1.5]
+    assert batches == [values, values, values]
+    assert stats.rows == 12
+
+
+def test_iter_stream_max_delay():
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"VOLT 1V\nVOLT 2V\n")
+        batches = []
+
+        async def consume():
+            async for batch in iter_stream(reader, batch_size=100, max_delay=0.01):
+                batches.append(batch)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        # the partial batch arrives while the feed is still open
+        assert batches == [[EngUnit("1V"), EngUnit("2V")]]
+        reader.feed_data(b"VOLT 3V\n")
+        reader.feed_eof()
+        await task
+        return batches
+
+    assert asyncio.run(main())[-1] == [EngUnit("3V")]
+
+
+def test_iter_stream_errors():
+    with pytest.raises(ValueError, match="line 2: cannot parse 'OVER'"):
+        asyncio.run(_collect(b"VOLT 1V\nVOLT OVER\n"))
+
+    assert asyncio.run(_collect(b"")) == []
+
+
+def test_iter_stream_server():
+    async def instrument(reader, writer):
+        for i in range(1000):
+            writer.write(f"VOLT {i}m\n".encode())
+            await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(instrument, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            values = [
+                v async for batch in iter_stream(reader, as_float=True) for v in batch
+            ]
+            writer.close()
+        return values
+
+    assert asyncio.run(main()) == [float(f"{i}e-3") for i in range(1000)]
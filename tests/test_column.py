@@ -0,0 +1,69 @@
+import sys
+from decimal import Decimal
+
+import pytest
+
+from engineering_notation import EngNumber, EngUnit
+from engineering_notation.column import EngColumn
+
+
+@pytest.fixture
+def column():
+    return EngColumn(["4.7kohm", EngUnit("100nF"), EngNumber("2.2k"), 5, "10kohm"])
+
+
+def test_values_and_units(column):
+    assert len(column) == 5
+    assert column.values.format == "d"
+    assert column.values.tolist() == [4700.0, 1e-7, 2200.0, 5.0, 10000.0]
+    assert column.units == ("ohm", "F", None)
+    assert column.codes.tolist() == [0, 1, 2, 2, 0]
+    assert [str(v) for v in column] == ["4.70kohm", "100nF", "2.20k", "5", "10kohm"]
+    assert isinstance(column[2], EngNumber)
+    assert column[-1] == EngUnit("10kohm")
+
+    column.append(Decimal("0.5"))
+    assert column.values[-1] == 0.5
+    assert column.values.readonly
+
+
+def test_exported_buffer_is_pinned(column):
+    view = column.values
+    with pytest.raises(BufferError):
+        column.append("1k")
+    view.release()
+    column.append("1k")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 688 needs 3.12")
+def test_buffer_protocol(column):
+    with memoryview(column) as view:
+        assert view.format == "d"
+        assert view.tolist()[:2] == [4700.0, 1e-7]
+
+
+def test_to_numpy(column):
+    np = pytest.importorskip("numpy")
+
+    values = column.to_numpy()
+    assert values.dtype == np.float64
+    assert values.tolist() == column.values.tolist()
+    assert not values.flags.writeable
+    with pytest.raises(BufferError):
+        column.append("1k")
+
+
+def test_to_arrow(column):
+    pa = pytest.importorskip("pyarrow")
+
+    exported = column.to_arrow()
+    assert exported.field("value").to_pylist() == column.values.tolist()
+    assert exported.field("unit").to_pylist() == ["ohm", "F", "", "", "ohm"]
+    assert exported.field("unit").type == pa.dictionary(pa.int32(), pa.string())
+
+    # zero copy: the Arrow buffer is the column's own memory
+    address = exported.field("value").buffers()[1].address
+    assert address == column.to_numpy().ctypes.data
+
+    imported = pa.array(column)
+    assert imported.equals(exported)
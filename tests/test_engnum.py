@@ -1,6 +1,13 @@
+from decimal import Decimal
+
 import pytest
 from engineering_notation import EngNumber, EngUnit, __version__
-from engineering_notation.eng_notation import _split_value_and_unit
+from engineering_notation.eng_notation import (
+    _prefix,
+    _prefix_scale,
+    _split_value_and_unit,
+    _tokenize,
+)
 
 
 def test_import_version():
@@ -90,6 +97,21 @@ def test_engnum_separator():
     assert str(EngNumber("1.23k", separator=" ").to_pn()) == "1k23"
 
 
+def test_engnum_repr_cache():
+    num = EngNumber("1.234k")
+    assert str(num) == "1.23k"
+    assert str(num) is str(num)
+
+    num.precision = 1
+    assert str(num) == "1.2k"
+    num.significant = 4
+    assert str(num) == "1.234k"
+    num.separator = " "
+    assert str(num) == "1.234 k"
+    num.number = EngNumber("220m").number
+    assert str(num) == "220.0 m"
+
+
 def test_new_units():
     """
     any new units - such as femto, atto, zepto, etc. should have
@@ -275,6 +297,42 @@ def test_enum_le():
     assert EngNumber("-220k") >= -220000
 
 
+def test_enum_compare_without_temporaries(monkeypatch):
+    values = [EngNumber("220k"), EngUnit("220k"), EngUnit("220kohm")]
+
+    def no_temporaries(*args, **kwargs):
+        raise AssertionError("comparison constructed a temporary value")
+
+    monkeypatch.setattr(EngNumber, "__init__", no_temporaries)
+    monkeypatch.setattr(EngUnit, "__init__", no_temporaries)
+
+    number, unitless, unit = values
+    assert number == Decimal("220000")
+    assert number < 221000.5
+    assert number >= "220k"
+    assert unitless == Decimal("220000")
+    assert unitless > 219999.5
+    assert unit <= "220kohm"
+    assert EngNumber._from_number(Decimal("0.1")) == 0.1
+    with pytest.raises(AttributeError):
+        unit < 221000
+
+
+def test_enum_compare_float_keeps_decimal_digits():
+    close = EngNumber("0.10000000000000000001", backend="decimal")
+    assert close != 0.1
+    assert close > 0.1
+    assert not close <= 0.1
+    large = EngNumber("123456789012345678901", backend="decimal")
+    assert large != 123456789012345678900.0
+    # the float's shortest repr is 1.2345678901234568e+20
+    assert large < 123456789012345678900.0
+    assert EngUnit("0.10000000000000000001", backend="decimal") != 0.1
+    assert EngNumber("0.1", backend="decimal") == 0.1
+    assert EngNumber("0.1", backend="decimal") == EngNumber(0.1, backend="float")
+    assert EngNumber(0.1, backend="float") < close
+
+
 def test_enum_to_int():
     # positive_numbers
     assert int(EngNumber("220k")) == 220000
@@ -345,6 +403,49 @@ def test_enum_to_enum():
     assert str(EngNumber(enum)) == "-1.20"
 
 
+def test_engnum_frozen():
+    num = EngNumber("1k", frozen=True)
+
+    assert num.frozen
+    assert hash(num) == hash(EngNumber(1000, frozen=True)) == hash(1000)
+    assert {num, EngNumber("1000", frozen=True), EngNumber("2k", frozen=True)} == {
+        EngNumber(1000, frozen=True),
+        EngNumber(2000, frozen=True),
+    }
+    assert {num: "a"}[EngNumber(1e3, frozen=True)] == "a"
+    assert str(num + 1) == "1k"
+
+    with pytest.raises(AttributeError):
+        num.number = EngNumber("2k").number
+    with pytest.raises(AttributeError):
+        num.precision = 3
+    with pytest.raises(AttributeError):
+        num.separator = " "
+    with pytest.raises(TypeError):
+        hash(EngNumber("1k"))
+
+
+def test_engnum_frozen_float_hash():
+    num = EngNumber(0.1, frozen=True)
+
+    assert num == 0.1
+    assert 0.1 in {num}
+    assert {0.1: "a"}[num] == "a"
+    assert {num: "a"}[0.1] == "a"
+    assert len({EngNumber("0.1", frozen=True, backend="decimal"), num}) == 1
+    assert (
+        len(
+            {
+                EngNumber("0.1", frozen=True, backend="decimal"),
+                EngNumber(0.1, frozen=True, backend="float"),
+                EngNumber("2.2u", frozen=True),
+            }
+        )
+        == 2
+    )
+    assert 2.2e-6 in {EngNumber("2.2u", frozen=True)}
+
+
 def test_engnum_invalid_type():
     with pytest.raises(TypeError):
         EngNumber(None)
@@ -359,6 +460,33 @@ def test_split_value_and_unit():
     assert _split_value_and_unit("Hz") == ("", "Hz")
 
 
+def test_prefix_table():
+    for prefix, scale in _prefix_scale.items():
+        assert _prefix(scale) == prefix
+        assert str(EngNumber(f"1{prefix}")) == f"1{prefix}"
+
+    # no prefix is defined for 1e24, nor beyond quetta/quecto
+    for exp in (24, 33, -33):
+        with pytest.raises(KeyError):
+            _prefix(exp)
+
+
+def test_tokenize():
+    assert _tokenize("220kHz") == ("220", 3, "Hz")
+    assert _tokenize("1.2M") == ("1.2", 6, None)
+    assert _tokenize("-0.22ohm") == ("-0.22", 0, "ohm")
+    assert _tokenize("1e-27Hz") == ("1", -27, "Hz")
+    assert _tokenize("+.5E+3") == ("+.5", 3, None)
+    assert _tokenize("1EHz") == ("1", 18, "Hz")
+    assert _tokenize("1eV") == ("1", 0, "eV")
+
+    for malformed in ("", "Hz", "1e3k", "1e3kHz", ".e3"):
+        with pytest.raises(ArithmeticError):
+            _tokenize(malformed)
+        with pytest.raises(ArithmeticError):
+            EngNumber(malformed)
+
+
 """ tests for EngUnit()"""
 
 
@@ -480,7 +608,7 @@ def test_sub():
 
 def test_mul():
     # positive_numbers
-    assert str(EngUnit("220ms") * EngUnit("2Hz")) == "440msHz"
+    assert str(EngUnit("220ms") * EngUnit("2Hz")) == "440m"
     assert str(EngUnit("220ms") * EngUnit("2")) == "440ms"
     assert str(EngUnit("220m") * EngUnit("2s")) == "440ms"
     assert str(EngUnit("220m") * EngNumber("2")) == "440m"
@@ -492,7 +620,7 @@ def test_mul():
     assert str(2.0 * EngUnit("220ms")) == "440ms"
 
     # negative_numbers
-    assert str(EngUnit("-220ms") * EngUnit("-2Hz")) == "440msHz"
+    assert str(EngUnit("-220ms") * EngUnit("-2Hz")) == "440m"
     assert str(EngUnit("-220ms") * EngUnit("-2")) == "440ms"
     assert str(EngUnit("-220m") * EngUnit("-2s")) == "440ms"
 
@@ -505,7 +633,7 @@ def test_mul():
 
 def test_div():
     # positive_numbers
-    assert str(EngUnit("220ms") / EngUnit("2s")) == "110ms/s"
+    assert str(EngUnit("220ms") / EngUnit("2s")) == "110m"
     assert str(EngUnit("220ms") / EngUnit("2")) == "110ms"
     assert str(EngUnit("220m") / EngUnit("2s")) == "110m/s"
     assert str(EngUnit("220m") / EngNumber("2")) == "110m"
@@ -517,7 +645,7 @@ def test_div():
     assert str(2.0 / EngUnit("220ms")) == "9.09/s"
 
     # negative_numbers
-    assert str(EngUnit("-220ms") / EngUnit("-2s")) == "110ms/s"
+    assert str(EngUnit("-220ms") / EngUnit("-2s")) == "110m"
     assert str(EngUnit("-220ms") / EngUnit("-2")) == "110ms"
     assert str(EngUnit("-220m") / EngUnit("-2s")) == "110m/s"
 
@@ -528,6 +656,15 @@ def test_div():
     assert str(-2.0 / EngUnit("-220ms")) == "9.09/s"
 
 
+def test_arithmetic_keeps_unit():
+    # units beginning with an SI prefix letter survive arithmetic
+    assert str(EngUnit("2", unit="meter") + EngUnit("3", unit="meter")) == "5meter"
+    assert (EngUnit("2", unit="meter") * 2).unit == "meter"
+    assert (EngUnit("2", unit="meter") - EngUnit("3", unit="meter")).unit == "meter"
+    assert (EngUnit("2ohm") + EngUnit("3ohm")).eng_num.number == 5
+    assert (EngUnit("2") * EngUnit("3")).unit is None
+
+
 def test_eq():
     # positive_numbers
     assert EngUnit("220k") == EngUnit(220000)
@@ -628,6 +765,59 @@ def test_le():
         -219000 <= EngUnit("-220kohm")
 
 
+def test_frozen():
+    ohms = EngUnit("1kohm", frozen=True)
+
+    assert ohms.frozen
+    assert ohms.eng_num.frozen
+    assert hash(ohms) == hash(EngUnit(1000, unit="ohm", frozen=True))
+    assert hash(ohms) != hash(EngUnit("1kHz", frozen=True))
+    assert hash(EngUnit("1k", frozen=True)) == hash(EngNumber(1000, frozen=True))
+    assert hash(EngUnit("1k", frozen=True)) == hash(1000)
+    assert len({ohms, EngUnit("1000ohm", frozen=True)}) == 1
+
+    with pytest.raises(AttributeError):
+        ohms.unit = "Hz"
+    with pytest.raises(AttributeError):
+        ohms.eng_num = EngNumber("2k")
+    with pytest.raises(TypeError):
+        hash(EngUnit("1kohm"))
+
+
+def test_frozen_float_hash():
+    assert 0.1 in {EngUnit("0.1", frozen=True)}
+    assert (
+        len(
+            {
+                EngUnit("4.7kohm", frozen=True, backend="decimal"),
+                EngUnit(4.7, unit="kohm", frozen=True, backend="float"),
+                EngUnit(4700.0, unit="ohm", frozen=True, backend="float"),
+                EngUnit("0.0047Mohm", frozen=True, backend="decimal"),
+            }
+        )
+        == 1
+    )
+    assert {EngUnit("0.1mV", frozen=True): "a"}[
+        EngUnit(0.1, unit="mV", frozen=True, backend="float")
+    ] == "a"
+
+
+def test_frozen_integral_hash():
+    assert hash(EngNumber(10**23, frozen=True, backend="decimal")) == hash(10**23)
+    assert 10**30 in {EngNumber("1Q", frozen=True, backend="decimal")}
+    assert 10**23 in {EngUnit(10**23, frozen=True, backend="decimal")}
+
+
+def test_frozen_dimensionless_hash():
+    gain = EngUnit(1, unit="V/V", frozen=True)
+    assert gain == 1
+    assert hash(gain) == hash(1)
+    assert 1 in {gain}
+    assert {EngUnit("2.5", frozen=True): "a"}[
+        EngUnit(2.5, unit="A/A", frozen=True)
+    ] == "a"
+
+
 def test_to_int():
     # positive_numbers
     assert int(EngUnit("220k")) == 220000
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from engineering_notation import EngNumber, EngUnit
+from engineering_notation.eseries import (
+    SERIES,
+    nearest_preferred,
+    nearest_preferred_array,
+)
+
+
+def test_series_tables():
+    assert {name: len(values) for name, values in SERIES.items()} == {
+        "E3": 3,
+        "E6": 6,
+        "E12": 12,
+        "E24": 24,
+        "E48": 48,
+        "E96": 96,
+        "E192": 192,
+    }
+    assert [str(v) for v in SERIES["E6"]] == ["1.0", "1.5", "2.2", "3.3", "4.7", "6.8"]
+    assert [str(v) for v in SERIES["E96"][:6]] == [
+        "1.00",
+        "1.02",
+        "1.05",
+        "1.07",
+        "1.10",
+        "1.13",
+    ]
+    assert str(SERIES["E192"][185]) == "9.20"
+    for name, values in SERIES.items():
+        assert list(values) == sorted(values), name
+
+
+def test_nearest_preferred():
+    assert nearest_preferred("4.8k", "E12") == EngNumber("4.7k")
+    assert nearest_preferred("4.8k", "E24") == EngNumber("4.7k")
+    assert nearest_preferred("4.9k", "E24") == EngNumber("5.1k")
+    assert nearest_preferred(EngNumber("1.234k")) == EngNumber("1.24k")
+    assert nearest_preferred(0.000121, "E6") == EngNumber("100u")
+    assert nearest_preferred(-4.8e3, "E12") == EngNumber("-4.7k")
+    assert nearest_preferred(0) == 0
+
+    # the boundary between neighbours is their geometric mean
+    assert nearest_preferred("3.2k", "E3") == EngNumber("2.2k")
+    assert nearest_preferred("3.3k", "E3") == EngNumber("4.7k")
+
+    assert nearest_preferred("9.9", "E24") == EngNumber("10")
+    assert nearest_preferred("1e40", "E3") == EngNumber("470Q")
+
+
+def test_nearest_preferred_keeps_unit():
+    result = nearest_preferred(EngUnit("4.8kohm"), "E12")
+    assert isinstance(result, EngUnit)
+    assert str(result) == "4.70kohm"
+    assert str(nearest_preferred("97nF", "E6")) == "100nF"
+    assert isinstance(nearest_preferred("4.8k"), EngNumber)
+
+
+def test_unknown_series():
+    with pytest.raises(ValueError):
+        nearest_preferred("1k", "E7")
+    with pytest.raises(ValueError):
+        nearest_preferred_array([1.0], "E7")
+
+
+def test_nearest_preferred_array():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(14)
+    values = [
+        rng.choice((-1, 1)) * rng.uniform(1, 10) * 10 ** rng.randint(-15, 12)
+        for _ in range(2000)
+    ] + [0.0, 1e-40, 1e40]
+
+    for series in SERIES:
+        result = nearest_preferred_array(values, series)
+        assert result.dtype == np.float64
+        assert list(result) == [float(nearest_preferred(v, series)) for v in values]
+
+    assert nearest_preferred_array(np.array([[4.8e3]]), "E12").shape == (1, 1)
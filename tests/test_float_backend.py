@@ -0,0 +1,85 @@
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from engineering_notation import EngNumber, EngUnit
+from engineering_notation.eng_notation import (
+    get_default_backend,
+    set_default_backend,
+)
+
+# re-run the round-trip cases of the Decimal backend against the float backend
+from test_engnum import *  # noqa: E402, F403
+
+
+@pytest.fixture(autouse=True)
+def float_backend():
+    set_default_backend("float")
+    yield
+    set_default_backend("decimal")
+
+
+def test_default_backend():
+    assert get_default_backend() == "float"
+    assert type(EngNumber("1k").number) is float
+    assert type(EngNumber(1000).number) is float
+    assert type(EngUnit("1kohm").eng_num.number) is float
+    assert type(EngNumber("1k", backend="decimal").number) is Decimal
+
+    with pytest.raises(ValueError):
+        set_default_backend("binary")
+    with pytest.raises(ValueError):
+        EngNumber("1k", backend="binary")
+
+
+def test_mixed_backends():
+    total = EngNumber("1k", backend="decimal") + EngNumber("220", backend="float")
+
+    assert type(total.number) is float
+    assert str(total) == "1.22k"
+    assert EngNumber("1k", backend="decimal") == EngNumber("1k", backend="float")
+    assert hash(EngNumber("1k", frozen=True, backend="float")) == hash(
+        EngNumber("1k", frozen=True, backend="decimal")
+    )
+
+
+def test_rounding_ties_match_decimal():
+    # near-ties round half-even on the decimal value: 2.675 is 2.67499999...
+    # as a float
+    cases = [
+        (2.675, None),
+        (5055, None),
+        (-9005000.0, None),
+        (-4800500000.0, 3),
+        (0.125, 1),
+        (2.5, 0),
+    ]
+    for value, precision in cases:
+        assert str(EngNumber(value, precision, backend="float")) == str(
+            EngNumber(value, precision, backend="decimal")
+        )
+    assert str(EngNumber(5055, backend="float")) == "5.06k"
+    assert str(EngNumber(-9005000.0, backend="float")) == "-9M"
+    assert str(EngNumber(-4800500000.0, 3, backend="float")) == "-4.800G"
+    assert str(EngNumber(2.675, backend="float")) == "2.68"
+
+
+def test_documented_divergences():
+    # float arithmetic carries binary representation error
+    decimal_sum = EngNumber("0.1", backend="decimal") + EngNumber(
+        "0.2", backend="decimal"
+    )
+    float_sum = EngNumber("0.1", backend="float") + EngNumber("0.2", backend="float")
+    assert decimal_sum.number == Decimal("0.3")
+    assert float_sum.number == 0.30000000000000004
+    assert str(decimal_sum) == str(float_sum) == "300m"
+
+
+def test_non_finite():
+    for backend in ("decimal", "float"):
+        assert str(EngNumber(float("nan"), backend=backend)) == "NaN"
+        assert str(EngNumber(float("nan"), separator=" ", backend=backend)) == "NaN "
+        assert str(EngUnit(float("nan"), unit="V", backend=backend)) == "NaNV"
+        for value in (float("inf"), float("-inf")):
+            with pytest.raises(InvalidOperation):
+                str(EngNumber(value, backend=backend))
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+# microseconds for `import engineering_notation`, as reported by -X importtime;
+# generous enough for slow CI machines, but far below the cost of numpy
+IMPORT_BUDGET_US = 60_000
+
+
+def _import(code="import engineering_notation"):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(stderr, module):
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (
+            part.strip() for part in line.replace(":", "|", 1).split("|")
+        )
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_numpy_not_imported():
+    result = _import(
+        "import sys, engineering_notation, engineering_notation.eseries; "
+        "engineering_notation.EngNumber('1k'); "
+        "print('numpy' in sys.modules)"
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_tables_built_on_first_use():
+    result = _import(
+        "from engineering_notation import eng_notation as e, units as u; "
+        "print(e._token_re_cache, e._pow10_cache, u._term_re_cache, u._registry); "
+        "str(e.EngUnit('2kohm') + e.EngUnit(1, unit='Mohm', backend='float')); "
+        "print(all([e._token_re_cache, e._pow10_cache, u._registry]))"
+    )
+    assert result.stdout.split("\n")[:2] == ["None None None None", "True"]
+
+
+def test_import_time_budget():
+    cost = min(
+        _cumulative_us(_import().stderr, "engineering_notation") for _ in range(3)
+    )
+    assert cost < IMPORT_BUDGET_US
@@ -0,0 +1,78 @@
+import pytest
+
+from engineering_notation import EngIndex, EngNumber, EngUnit
+
+
+@pytest.fixture
+def capacitors():
+    return EngIndex(
+        EngUnit(value)
+        for value in ["120nF", "82nF", "100nF", "1uF", "90nF", "110nF", "10pF"]
+    )
+
+
+def test_len_and_units():
+    index = EngIndex(["10kohm", "4.7kohm", "100nF", EngNumber("1k"), 5])
+
+    assert len(index) == 5
+    assert set(index.units) == {"ohm", "F", None}
+    assert [str(v) for v in EngIndex(["1k", "10", "220"])] == ["10", "220", "1k"]
+
+
+def test_range(capacitors):
+    result = capacitors.range("90n", "110n")
+    assert [str(v) for v in result] == ["90nF", "100nF", "110nF"]
+
+    assert capacitors.range("90nF", "110nF") == result
+    assert capacitors.range(EngNumber("90n"), 110e-9, unit="F") == result
+    assert capacitors.range("111n", "119n") == []
+    assert capacitors.range("90nohm", "110nohm") == []
+
+    with pytest.raises(AttributeError):
+        capacitors.range("90nF", "110nohm")
+
+
+def test_range_selects_unit():
+    index = EngIndex(["10kohm", "10kHz", "10k"])
+
+    assert [str(v) for v in index.range("1k", "100k")] == ["10k"]
+    assert [str(v) for v in index.range("1k", "100k", unit="Hz")] == ["10kHz"]
+    assert [str(v) for v in index.range("1kohm", "100kohm")] == ["10kohm"]
+
+
+def test_units_grouped_as_written():
+    index = EngIndex(["10Hz", "20/s", EngUnit(1, unit="kohm"), "2kohm"])
+
+    assert set(index.units) == {"Hz", "/s", "kohm", "ohm"}
+    assert [str(v) for v in index.range("1", "100", unit="Hz")] == ["10Hz"]
+    assert [str(v) for v in index.range("1k", "5k", unit="ohm")] == ["2kohm"]
+
+
+def test_within(capacitors):
+    assert [str(v) for v in capacitors.within("100n", "10%")] == [
+        "90nF",
+        "100nF",
+        "110nF",
+    ]
+    assert [str(v) for v in capacitors.within("100nF", "5%")] == ["100nF"]
+    assert [str(v) for v in capacitors.within("100n", "20n")] == [
+        "82nF",
+        "90nF",
+        "100nF",
+        "110nF",
+        "120nF",
+    ]
+    assert capacitors.within("-100n", "10%") == []
+
+
+def test_nearest(capacitors):
+    assert [str(v) for v in capacitors.nearest("94n")] == ["90nF"]
+    assert [str(v) for v in capacitors.nearest("104n", k=3)] == [
+        "100nF",
+        "110nF",
+        "90nF",
+    ]
+    assert [str(v) for v in capacitors.nearest("1", k=2)] == ["1uF", "120nF"]
+    assert [str(v) for v in capacitors.nearest("0", k=1)] == ["10pF"]
+    assert len(capacitors.nearest("100n", k=100)) == 7
+    assert EngIndex([]).nearest("1k") == []
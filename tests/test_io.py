@@ -0,0 +1,108 @@
+import io
+from array import array
+
+import pytest
+
+from engineering_notation import EngNumber, EngUnit
+from engineering_notation.io import ParseStats, iter_parse, parse_mmap
+
+CSV = """time,voltage,current,label
+0,3.3V,12.5mA,a
+1m,3.31V,12.6mA,b
+
+2m,,12.7mA,"c, quoted"
+"""
+
+
+def test_iter_parse_objects():
+    batches = list(iter_parse(io.StringIO(CSV), ["voltage", "current"]))
+
+    assert len(batches) == 1
+    assert batches[0]["voltage"] == [EngUnit("3.3V"), EngUnit("3.31V"), None]
+    assert [str(v) for v in batches[0]["current"]] == ["12.50mA", "12.60mA", "12.70mA"]
+
+
+def test_iter_parse_floats_and_batches():
+    batches = list(
+        iter_parse(
+            io.StringIO(CSV), ["time", 2], as_float=True, batch_size=2, chunk_size=7
+        )
+    )
+
+    assert batches == [
+        {"time": [0.0, 1e-3], 2: [12.5e-3, 12.6e-3]},
+        {"time": [2e-3], 2: [12.7e-3]},
+    ]
+
+
+def test_iter_parse_path_tsv(tmp_path):
+    path = tmp_path / "log.tsv"
+    path.write_text("a\tb\n1k\t2u\n3M\t4n\n")
+    stats = ParseStats()
+
+    batches = list(iter_parse(path, ["b"], delimiter="\t", as_float=True, stats=stats))
+
+    assert batches == [{"b": [2e-6, 4e-9]}]
+    assert stats.rows == 2
+    assert stats.seconds > 0
+    assert stats.rows_per_second > 0
+
+
+def test_iter_parse_errors():
+    with pytest.raises(KeyError):
+        list(iter_parse(io.StringIO(CSV), ["power"]))
+
+    with pytest.raises(ValueError, match="line 2, column 'label'"):
+        list(iter_parse(io.StringIO(CSV), ["label"]))
+
+    assert list(iter_parse(io.StringIO(""), ["a"])) == []
+
+
+def test_parse_mmap(tmp_path):
+    path = tmp_path / "values.txt"
+    path.write_bytes(b"10k\n100nF\n\n  4.7uH\r\n-1.5\n1e-27Hz\n2meter\n.5k")
+
+    values = parse_mmap(path)
+
+    assert isinstance(values, array)
+    assert values.tolist() == [1e4, 100e-9, 4.7e-6, -1.5, 1e-27, 2e-3, 500.0]
+    assert values.tolist() == [
+        float(EngNumber(s)) for s in ["10k", "100nF", "4.7uH", "-1.5", "1e-27Hz"]
+    ] + [2e-3, 500.0]
+
+
+def test_parse_mmap_out(tmp_path):
+    path = tmp_path / "values.txt"
+    path.write_bytes(b"1k\n2M\n")
+    out = array("d", [0.0] * 4)
+
+    assert parse_mmap(path, out).tolist() == [1e3, 2e6]
+    assert out.tolist() == [1e3, 2e6, 0.0, 0.0]
+
+    with pytest.raises(ValueError, match="too small"):
+        parse_mmap(path, array("d", [0.0]))
+    with pytest.raises(TypeError):
+        parse_mmap(path, array("i", [0, 0, 0]))
+
+
+def test_parse_mmap_numpy(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "values.txt"
+    path.write_bytes(b"1k\n2M\n3u\n")
+    out = np.zeros(8)
+
+    assert parse_mmap(path, out).tolist() == [1e3, 2e6, 3e-6]
+
+
+def test_parse_mmap_errors(tmp_path):
+    path = tmp_path / "values.txt"
+    path.write_bytes(b"1k\n2M\nbad\n")
+    with pytest.raises(ValueError, match="line 3"):
+        parse_mmap(path)
+
+    path.write_bytes(b"1e3k\n")
+    with pytest.raises(ValueError, match="line 1"):
+        parse_mmap(path)
+
+    path.write_bytes(b"")
+    assert parse_mmap(path).tolist() == []
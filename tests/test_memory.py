@@ -0,0 +1,62 @@
+import gc
+import tracemalloc
+from decimal import Decimal
+
+from engineering_notation import EngNumber, EngUnit
+
+COUNT = 1_000_000
+
+# bytes per instance, excluding the shared Decimal value
+ENG_NUMBER_BUDGET = 56
+ENG_UNIT_BUDGET = 112
+
+
+def _bytes_per_instance(factory):
+    instances = [None] * COUNT
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(COUNT):
+            instances[i] = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return round((after - before) / COUNT)
+
+
+def test_engnumber_memory():
+    number = Decimal("4.7E+3")
+    per_instance = _bytes_per_instance(lambda: EngNumber._from_number(number))
+
+    assert per_instance <= ENG_NUMBER_BUDGET
+
+
+def test_engunit_memory():
+    number = Decimal("4.7E+3")
+    per_instance = _bytes_per_instance(lambda: EngUnit._from_parts(number, "ohm"))
+
+    assert per_instance <= ENG_UNIT_BUDGET
+
+
+def test_options_are_shared():
+    a = EngNumber("1k", precision=3, separator=" ")
+    b = EngNumber("2k", precision=3, separator=" ")
+
+    assert a._options is b._options
+    assert not hasattr(a, "__dict__")
+    assert not hasattr(EngUnit("1kohm"), "__dict__")
+
+
+def test_options_mutation():
+    a = EngNumber("1.234k")
+    b = EngNumber("5.678k")
+    a.precision = 1
+    a.separator = " "
+
+    assert str(a) == "1.2 k"
+    assert str(b) == "5.68k"
+    assert b.precision == 2
+
+    a.significant = 3
+    assert str(a) == "1.23 k"
@@ -0,0 +1,58 @@
+import multiprocessing
+import random
+
+from engineering_notation import EngNumber, EngUnit
+from engineering_notation.eng_notation import set_default_backend
+from engineering_notation.parallel import format_many, parse_many
+
+
+def _values():
+    rng = random.Random(7)
+    return [rng.uniform(-1, 1) * 10 ** rng.randint(-12, 12) for _ in range(500)]
+
+
+def test_format_many_matches_repr():
+    values = _values()
+    expected = [str(EngNumber(v)) for v in values]
+
+    assert format_many(values, workers=1) == expected
+    assert format_many(values, workers=2, chunksize=64) == expected
+
+
+def test_format_many_options():
+    values = iter([1234.5, "4.7k", 0.00022])
+
+    assert format_many(values, workers=1, significant=2, separator=" ") == [
+        "1.2 k",
+        "4.7 k",
+        "220 u",
+    ]
+
+
+def test_parse_many():
+    strings = [str(EngUnit(v, unit="V")) for v in _values()]
+
+    assert parse_many(strings, workers=2, chunksize=100) == [
+        EngUnit(s) for s in strings
+    ]
+    assert parse_many(strings, workers=2, chunksize=100, as_float=True) == [
+        float(EngUnit(s)) for s in strings
+    ]
+    assert parse_many([], workers=2) == []
+
+
+def test_workers_use_caller_backend():
+    values = [2.675, 0.0012345, 1.005] * 4
+    spawn = multiprocessing.get_context("spawn")
+
+    set_default_backend("float")
+    try:
+        expected = [str(EngNumber(v)) for v in values]
+        formatted = format_many(values, workers=2, chunksize=4, mp_context=spawn)
+        parsed = parse_many(["2.675k"] * 4, workers=2, chunksize=2, mp_context=spawn)
+    finally:
+        set_default_backend("decimal")
+
+    assert formatted == expected
+    assert formatted[0] == "2.68"
+    assert all(type(value.eng_num.number) is float for value in parsed)
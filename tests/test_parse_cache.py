@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+import pytest
+
+from engineering_notation import (
+    EngIndex,
+    EngNumber,
+    EngUnit,
+    clear_parse_cache,
+    parse_cache_info,
+    set_parse_cache_size,
+)
+from engineering_notation.eng_notation import PARSE_CACHE_SIZE, _parse
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    set_parse_cache_size(PARSE_CACHE_SIZE)
+    yield
+    set_parse_cache_size(PARSE_CACHE_SIZE)
+
+
+def test_cache_hits():
+    for _ in range(3):
+        EngNumber("10k")
+        EngUnit("100nF")
+
+    info = parse_cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+    assert info.currsize == 2
+    assert info.maxsize == PARSE_CACHE_SIZE
+
+
+def test_cached_values():
+    assert _parse("4.7uH") == (Decimal("4.7e-6"), "H")
+    assert _parse("4.7uH") is _parse("4.7uH")
+    assert str(EngUnit("4.7uH")) == "4.70uH"
+    assert str(EngUnit("4.7uH", unit="F")) == "4.70uF"
+
+
+def test_cache_eviction():
+    set_parse_cache_size(2)
+    EngNumber("1k")
+    EngNumber("2k")
+    EngNumber("3k")
+    EngNumber("1k")
+
+    info = parse_cache_info()
+    assert info.currsize == 2
+    assert info.misses == 4
+    assert info.hits == 0
+
+
+def test_cache_disabled():
+    set_parse_cache_size(0)
+    EngNumber("1k")
+    EngNumber("1k")
+
+    info = parse_cache_info()
+    assert info.hits == 0
+    assert info.misses == 2
+    assert info.currsize == 0
+    assert str(EngNumber("1k")) == "1k"
+
+
+def test_cache_clear():
+    EngNumber("1k")
+    clear_parse_cache()
+
+    assert parse_cache_info().currsize == 0
+
+
+def test_invalid_not_cached():
+    with pytest.raises(ArithmeticError):
+        EngNumber("1e3k")
+
+    assert parse_cache_info().currsize == 0
+
+
+def test_resize_reaches_other_modules():
+    set_parse_cache_size(8)
+    EngIndex(["10k", "4.7k"]).range("1k", "10k")
+
+    info = parse_cache_info()
+    assert info.misses == 3
+    assert info.hits == 1
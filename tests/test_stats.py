@@ -0,0 +1,130 @@
+import math
+import statistics
+import tracemalloc
+from decimal import Decimal
+
+import pytest
+
+from engineering_notation import EngNumber, EngUnit, set_default_backend
+from engineering_notation.stats import (
+    RunningStats,
+    maximum,
+    mean,
+    minimum,
+    stddev,
+    total,
+)
+
+VOLTS = [EngUnit("1V"), "500mV", EngUnit(250, unit="mV"), "2V"]
+
+
+def test_reductions():
+    assert str(total(VOLTS)) == "3.75V"
+    assert str(mean(VOLTS)) == "937.50mV"
+    assert str(minimum(VOLTS)) == "250mV"
+    assert str(maximum(VOLTS)) == "2V"
+    assert str(stddev(VOLTS)) == "773.92mV"
+    assert str(stddev(VOLTS, sample=False)) == "670.24mV"
+
+    # iterators are consumed in one pass
+    assert str(total(EngUnit(f"{i}mA") for i in range(101))) == "5.05A"
+
+
+def test_matches_builtin_sum():
+    values = [EngUnit(f"{i}.5kohm") for i in range(50)]
+
+    assert total(values) == sum(values[1:], values[0])
+    assert total(values).unit == "ohm"
+    assert total([EngNumber("1k"), 2, Decimal("0.5")]) == EngNumber("1002.5")
+    assert isinstance(total([1, 2]), EngNumber)
+    assert total([]) == 0
+
+
+def test_exact_accumulation():
+    assert total(["0.1", "0.2", "0.3"]).number == Decimal("0.6")
+    # plain floats are taken at their shortest repr, as EngNumber stores them
+    assert total([0.1, 0.2]).number == Decimal("0.3")
+    assert total([0.1] * 10).number == Decimal("1.0")
+    assert mean([0.1, 0.2, 0.3, 0.4]).number == Decimal("0.25")
+
+    set_default_backend("float")
+    try:
+        assert total([0.1] * 10).number == 1.0
+        assert total(iter([1e100, 1.0, -1e100, Decimal("0.5")])).number == 1.5
+        assert total([0.1, float("inf")]).number == float("inf")
+        with pytest.raises(OverflowError):
+            total([1e308, 1e308, -1e308])
+    finally:
+        set_default_backend("decimal")
+
+
+def test_numpy_scalars():
+    np = pytest.importorskip("numpy")
+    assert total([np.int64(2), np.int64(3)]).number == Decimal(5)
+    assert total([np.float32(0.1), np.float64(0.2)]).number == Decimal("0.3")
+
+
+def test_total_constant_memory():
+    values = (float(i % 1000) * 0.1 for i in range(20_000))
+
+    set_default_backend("float")
+    tracemalloc.start()
+    try:
+        result = total(values)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        set_default_backend("decimal")
+
+    assert result.number == math.fsum(float(i % 1000) * 0.1 for i in range(20_000))
+    assert peak < 50_000
+
+
+def test_unit_mismatch():
+    with pytest.raises(AttributeError):
+        total([EngUnit("1V"), EngUnit("1A")])
+    with pytest.raises(AttributeError):
+        mean(["1V", 1])
+    with pytest.raises(AttributeError):
+        RunningStats(["1V", "1A"])
+
+
+def test_empty():
+    for reduction in (mean, minimum, maximum, stddev):
+        with pytest.raises(ValueError):
+            reduction([])
+    with pytest.raises(ValueError):
+        stddev(["1V"])
+
+
+def test_running_stats():
+    data = [4.7e3, 4.68e3, 4.73e3, 4.71e3, 4.69e3]
+    stats = RunningStats()
+    for value in data:
+        stats.add(EngUnit(value, unit="ohm"))
+
+    assert stats.count == 5
+    assert stats.unit == "ohm"
+    assert float(stats.mean) == pytest.approx(statistics.mean(data))
+    assert float(stats.stddev) == pytest.approx(statistics.stdev(data))
+    assert float(stats.pstddev) == pytest.approx(statistics.pstdev(data))
+    assert float(stats.variance) == pytest.approx(statistics.variance(data))
+    assert str(stats.minimum) == "4.68kohm"
+    assert str(stats.maximum) == "4.73kohm"
+
+    stats.update(["4.7kohm", EngUnit(4.7, unit="kohm")])
+    assert stats.count == 7
+    assert str(stats.maximum) == "4.73kohm"
+
+
+def test_running_stats_decimal():
+    stats = RunningStats(["1k", "2k", "3k", "4k"])
+
+    assert stats.mean.number == Decimal(2500)
+    assert stats.variance == Decimal(5e6) / 3
+    assert isinstance(stats.stddev.number, Decimal)
+    assert stats.unit is None
+    assert isinstance(stats.mean, EngNumber)
+
+    with pytest.raises(ValueError):
+        RunningStats().mean
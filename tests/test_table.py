@@ -0,0 +1,89 @@
+import io
+from decimal import Decimal
+
+import pytest
+
+from engineering_notation import EngNumber, EngUnit, format_table
+from engineering_notation.eng_notation import set_default_backend
+
+
+@pytest.mark.parametrize(
+    "value",
+    [1000, 0.0047, 123456, -5, 0, 1e-15, Decimal("2.2e3"), "4.7k", "220.5"],
+)
+def test_cell_matches_str(value):
+    assert format_table([[value]]) == f"{EngNumber(value)}\n"
+    assert format_table([[value]], precision=3) == (
+        f"{EngNumber(value, precision=3)}\n"
+    )
+    assert format_table([[value]], significant=3) == (
+        f"{EngNumber(value, significant=3)}\n"
+    )
+
+
+def test_units_and_empty_cells():
+    table = format_table(
+        [["2.2kohm", EngUnit("47ohm")], [EngNumber("1k"), None]],
+        separator=" ",
+    )
+    assert table.splitlines() == ["2.20 kohm  47 ohm", "1 k"]
+
+
+def test_align_decimal():
+    table = format_table([[1000], [0.0047], [123456], [-5]], header=["value"])
+    assert table.splitlines() == [
+        "  value",
+        "  1k",
+        "  4.70m",
+        "123.46k",
+        " -5",
+    ]
+
+
+def test_align_prefix():
+    table = format_table([["1kohm"], ["4.7mohm"], ["123456ohm"]], align="prefix")
+    assert table.splitlines() == [
+        "     1kohm",
+        "  4.70mohm",
+        "123.46kohm",
+    ]
+
+    with pytest.raises(ValueError):
+        format_table([[1]], align="left")
+
+
+def test_common_prefix():
+    table = format_table(
+        [[1000, "2.2u"], [47, "330n"], [123456, "10n"]], common_prefix=True
+    )
+    assert table.splitlines() == [
+        "  1k     2.20u",
+        "  0.05k  0.33u",
+        "123.46k  0.01u",
+    ]
+
+    assert format_table([[0], [0]], common_prefix=True) == "0\n0\n"
+    assert format_table([[0.000123, 0]], common_prefix=True, significant=2) == (
+        "120u  0.0\n"
+    )
+
+
+def test_common_prefix_float_backend():
+    cells = [[EngNumber(1e-6, backend="float")], [EngNumber(2e-7, backend="float")]]
+    assert format_table(cells, common_prefix=True) == "1u\n0.20u\n"
+
+    set_default_backend("float")
+    try:
+        table = format_table([[1e-6], [2e-7], [999e-9]], common_prefix=True)
+    finally:
+        set_default_backend("decimal")
+    assert table == "1u\n0.20u\n1u\n"
+
+
+def test_stream_to_file():
+    rows = [["1k", "2k"], ["3k"]]
+    buffer = io.StringIO()
+    assert format_table(rows, header=["a", "b"], file=buffer) is None
+    assert buffer.getvalue() == format_table(rows, header=["a", "b"])
+    assert buffer.getvalue().splitlines() == [" a   b", "1k  2k", "3k"]
+    assert format_table([]) == ""
@@ -0,0 +1,132 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from engineering_notation import (
+    EngNumber,
+    EngUnit,
+    conversion_factor,
+    format_table,
+    register_unit,
+    set_parse_cache_size,
+)
+from engineering_notation.eng_notation import PARSE_CACHE_SIZE
+
+THREADS = 8
+ROUNDS = 300
+
+STRINGS = ["4.7k", "100nF", "220kHz", "-1.5mV", "33ohm", "1e-12F", "10MHz"]
+
+
+def _work(seed: int) -> list[str]:
+    results = []
+    for i in range(ROUNDS):
+        # each round mixes shared literals, which hit the parse cache, with
+        # values unique to the round, which miss it
+        text = STRINGS[(seed + i) % len(STRINGS)]
+        value = EngUnit(text)
+        fresh = EngNumber(f"{seed}.{i}k")
+        results.append(str(value))
+        results.append(str(value * 2 + value))
+        results.append(str(fresh / EngNumber("3", significant=4)))
+        results.append(str(EngUnit(i, unit="mV") + EngUnit("1V")))
+        results.append(str(EngUnit("3V") / EngUnit(f"{i + 1}A")))
+        results.append(value.eng_num.to_pn("R"))
+    return results
+
+
+def _run(threads: int, work=_work) -> list[list[str]]:
+    barrier = threading.Barrier(threads)
+
+    def start(seed: int) -> list[str]:
+        barrier.wait()
+        return work(seed)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(start, range(threads)))
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    # on builds with a GIL, switching threads often interleaves them more
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.fixture
+def small_cache():
+    # a small cache keeps entries being evicted while threads read it
+    set_parse_cache_size(16)
+    yield
+    set_parse_cache_size(PARSE_CACHE_SIZE)
+
+
+def test_concurrent_results_match(small_cache):
+    expected = [_work(seed) for seed in range(THREADS)]
+
+    assert _run(THREADS) == expected
+
+
+def test_shared_frozen_values():
+    values = [EngUnit(s, frozen=True) for s in STRINGS]
+    expected = [str(v) for v in values]
+
+    def work(seed: int) -> list[str]:
+        out = []
+        for _ in range(ROUNDS):
+            out.append([str(v) for v in values] == expected)
+            out.append(len(set(values)) == len(values))
+        return out
+
+    assert all(all(result) for result in _run(THREADS, work))
+
+
+def test_registration_while_formatting(unit_registry):
+    names = [f"unit{i}" for i in range(40)]
+
+    def work(seed: int) -> list[str]:
+        if seed == 0:
+            for name in names:
+                register_unit(name, "m", 2)
+            return []
+        rows = [[EngUnit("1kohm"), "2.2mV"]] * 20
+        out = []
+        for _ in range(ROUNDS // 10):
+            out.append(format_table(rows))
+            out.append(str(conversion_factor("kohm", "ohm")))
+        return out
+
+    results = _run(THREADS, work)
+    assert {text for result in results[1:] for text in result} == {
+        format_table([[EngUnit("1kohm"), "2.2mV"]] * 20),
+        "1E+3",
+    }
+    assert all(conversion_factor(name, "mm") == 2000 for name in names)
+
+
+@pytest.mark.skipif(
+    getattr(sys, "_is_gil_enabled", lambda: True)(),
+    reason="scaling is only expected on a free-threaded build",
+)
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 CPUs")
+def test_free_threaded_scaling():
+    threads = 4
+    _run(threads)
+
+    start = time.perf_counter()
+    _run(1)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _run(threads)
+    parallel = time.perf_counter() - start
+
+    # each thread does the work the single thread did, so linear scaling
+    # keeps the elapsed time flat; require at least half of that
+    assert parallel < 2 * single
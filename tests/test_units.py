@@ -0,0 +1,151 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from engineering_notation import EngArray, EngUnit, conversion_factor, register_unit
+from engineering_notation.units import compose, same_unit, unit
+
+
+def test_parse_unit():
+    assert unit("m/s^2").terms == (("m", 1), ("s", -2))
+    assert unit("m/s^2") is unit("m*s^-2")
+    assert unit("kg*m/s^2").name == "N"
+    assert unit("V/A").name == "ohm"
+    assert unit("Hz").name == "Hz"
+    assert unit("/s").name == "/s"
+    assert unit("meter").dimensions == (("meter", 1),)
+    assert unit("") is unit(None)
+    assert unit("").name == ""
+
+
+def test_compose():
+    assert compose("V", "A", "div") == "ohm"
+    assert compose("ohm", "A", "mul") == "V"
+    assert compose("ohm", "F", "mul") == "s"
+    assert compose("s", "Hz", "mul") == ""
+    assert compose("m", "s", "div") == "m/s"
+    assert compose("m/s", "s", "div") == "m/s^2"
+    assert compose("", "s", "div") == "/s"
+    assert compose("meter", "meter", "mul") == "meter^2"
+    assert compose("meter", "meter", "div") == ""
+    # a scaled dimensionless ratio keeps its terms
+    assert compose("g", "kg", "div") == "g/kg"
+    # plain numbers keep the unit as written
+    assert compose("V/div", "", "mul") == "V/div"
+
+    with pytest.raises(ValueError):
+        compose("V", "A", "pow")
+
+
+def test_units_stay_bounded():
+    value = EngUnit("1V")
+    for _ in range(100):
+        value = value * EngUnit("2A") / EngUnit("2A")
+    assert value.unit == "V"
+    assert str(EngUnit("3V") / EngUnit("2A")) == "1.50ohm"
+    assert str(EngUnit("220ms") * EngUnit("2Hz")) == "440m"
+
+
+def test_same_unit():
+    assert same_unit("Hz", "/s")
+    assert same_unit("ohm", "Ω")
+    assert same_unit(None, "")
+    assert not same_unit("g", "kg")
+    assert not same_unit("V", "A")
+
+    assert str(EngUnit("1Hz") + EngUnit("2/s")) == "3Hz"
+    assert EngUnit("1V/A") == EngUnit("1ohm")
+    assert hash(EngUnit("1Hz", frozen=True)) == hash(EngUnit("1/s", frozen=True))
+    with pytest.raises(AttributeError):
+        EngUnit("1V") + EngUnit("1A")
+
+
+def test_eng_array_units():
+    np = pytest.importorskip("numpy")
+
+    amps = EngArray([1.0, 2.0], unit="A")
+    assert (amps * EngUnit("2ohm")).unit == "V"
+    assert (EngArray([1.0], unit="Hz") + EngArray([1.0], unit="/s")).unit == "Hz"
+    assert np.array_equal(amps / amps, [1.0, 1.0])
+    assert (amps / amps).unit is None
+
+
+def test_conversion_factor():
+    assert conversion_factor("mV", "V") == Decimal("0.001")
+    assert conversion_factor("kohm", "Ω") == 1000
+    assert conversion_factor("mg", "kg") == Decimal("1E-6")
+    assert conversion_factor("Hz", "/s") == 1
+    assert conversion_factor("mV/mA", "ohm") == 1
+    with pytest.raises(AttributeError):
+        conversion_factor("mV", "A")
+
+
+def test_mixed_scale_arithmetic():
+    assert str(EngUnit(1, unit="kohm") + EngUnit("500ohm")) == "1.50kohm"
+    assert str(EngUnit("1V") - EngUnit(250, unit="mV")) == "750mV"
+    assert EngUnit("1V") > EngUnit(999, unit="mV")
+    assert EngUnit(1, unit="kohm") == "1000ohm"
+    assert hash(EngUnit(1, unit="kohm", frozen=True)) == hash(
+        EngUnit("1kohm", frozen=True)
+    )
+    with pytest.raises(AttributeError):
+        EngUnit("1V") + EngUnit(1, unit="mA")
+
+
+def test_mixed_backend_comparisons_symmetric():
+    pairs = [
+        (EngUnit(1.005, unit="kV", backend="float"), EngUnit("1005V")),
+        (EngUnit(0.1, unit="mV", backend="float"), EngUnit("0.0001V")),
+        (EngUnit(4.7, unit="kohm", backend="float"), EngUnit(4700.0, unit="ohm")),
+        (EngUnit(1.005, unit="kV", backend="float"), EngUnit("1004V")),
+        (EngUnit(2.2, unit="uF", backend="float"), EngUnit("2200.0001nF")),
+    ]
+    for a, b in pairs:
+        assert (a == b) == (b == a)
+        assert (a < b) == (b > a)
+        assert (a > b) == (b < a)
+        assert (a <= b) == (b >= a)
+
+    a = EngUnit(1.005, unit="kV", frozen=True, backend="float")
+    b = EngUnit("1005V", frozen=True)
+    assert a == b and b == a
+    assert {a: "x"}[b] == {b: "x"}[a] == "x"
+    assert str(a + b) == "2.01kV"
+    assert type((b + a).eng_num.number) is float
+
+
+def test_register_unit(unit_registry):
+    mil = register_unit("mil", "m", "25.4e-6")
+    assert mil is unit("mil")
+    assert register_unit("mil", "m", "25.4e-6") is mil
+    assert conversion_factor("mil", "um") == Decimal("25.4")
+    assert str(EngUnit(1000, unit="mil") + EngUnit(0, unit="m")) == "1kmil"
+
+    assert register_unit("dB").dimensions == (("dB", 1),)
+    assert compose("dB", "dB", "div") == ""
+
+    with pytest.raises(ValueError):
+        register_unit("mil", "m", "25e-6")
+    with pytest.raises(ValueError):
+        register_unit("V/div", "V")
+    with pytest.raises(ValueError):
+        register_unit("furlong", scale=201)
+
+
+def test_register_while_reading(unit_registry):
+    names = [f"widget{i}" for i in range(50)]
+
+    def read():
+        for _ in range(200):
+            assert conversion_factor("kohm", "ohm") == 1000
+            assert compose("V", "A", "div") == "ohm"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        readers = [pool.submit(read) for _ in range(3)]
+        for name in names:
+            register_unit(name, "s", 60)
+        for reader in readers:
+            reader.result()
+
+    assert all(conversion_factor(name, "s") == 60 for name in names)
@@ -0,0 +1,206 @@
+import random
+import warnings
+
+import pytest
+
+from engineering_notation import (
+    EngArray,
+    EngNumber,
+    EngUnit,
+    format_array,
+    parse_array,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _values():
+    rng = random.Random(1234)
+    values = [0.0, -0.0, 2.675, 1.005e3, 0.125, 2.5, 999.999, 9.995, 220001.25]
+    values += [1e-30, 1e-15, 1e15, 999.9999e27, 0.1, -4.7e-9]
+    for _ in range(2000):
+        values.append(
+            rng.choice([1, -1]) * (1 + 9 * rng.random()) * 10 ** rng.randint(-29, 20)
+        )
+    for _ in range(2000):
+        digits = rng.randint(0, 4)
+        values.append(round(rng.random() * 1000, digits) * 10 ** rng.randint(-9, 9))
+    return values
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"precision": 0},
+        {"precision": 3},
+        {"precision": 7},
+        {"precision": -1},
+        {"significant": 1},
+        {"significant": 2},
+        {"significant": 3},
+        {"significant": 5},
+        {"separator": " "},
+    ],
+)
+def test_format_array_matches_repr(kwargs):
+    values = _values()
+    expected = [
+        str(
+            EngNumber(
+                v,
+                kwargs.get("precision"),
+                kwargs.get("significant", 0),
+                kwargs.get("separator", ""),
+            )
+        )
+        for v in values
+    ]
+
+    assert format_array(values, **kwargs).tolist() == expected
+
+
+def test_format_array_shape():
+    result = format_array(np.array([[220e3, 0.22], [1e-12, -4.9e3]]))
+
+    assert result.shape == (2, 2)
+    assert result.tolist() == [["220k", "220m"], ["1p", "-4.90k"]]
+    assert format_array([]).shape == (0,)
+
+
+def test_format_array_out_of_range():
+    with pytest.raises(KeyError):
+        format_array([1.0, 1e33])
+
+
+def test_format_array_subnormal_no_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert format_array([0.0, 1e-30, -4.9e3]).tolist() == ["0", "1q", "-4.90k"]
+        # subnormals have no SI prefix, like any other out-of-range value
+        with pytest.raises(KeyError):
+            format_array([1.0, 5e-324])
+        with pytest.raises(KeyError):
+            format_array([1e-310])
+
+
+def test_parse_array_matches_engnumber():
+    strings = [
+        "10k",
+        "100nF",
+        "4.7uH",
+        "-1.5",
+        "1e-27Hz",
+        "220",
+        "2meter",
+        ".5k",
+        "+3.3V",
+        "1.2.3k",
+        "1e3",
+        "1.5E",
+        "5 V",
+        "-220mohm",
+        "0.1",
+    ]
+
+    result = parse_array(strings)
+
+    assert result.dtype == np.float64
+    assert result.tolist() == [float(EngNumber(s)) for s in strings]
+
+
+def test_parse_array_shape():
+    result = parse_array(np.array([["1k", "2k"], ["3m", "4"]]))
+
+    assert result.shape == (2, 2)
+    assert result.tolist() == [[1e3, 2e3], [3e-3, 4.0]]
+    assert parse_array([]).shape == (0,)
+
+
+def test_parse_format_round_trip():
+    strings = ["220k", "4.70u", "1p", "-330m", "12.50G"]
+
+    assert format_array(parse_array(strings)).tolist() == [
+        "220k",
+        "4.70u",
+        "1p",
+        "-330m",
+        "12.50G",
+    ]
+
+
+def test_numpy_scalars():
+    assert EngNumber(np.float64(4700.0)) == EngNumber("4.7k")
+    assert str(EngNumber(np.float32(0.1))) == "100m"
+    assert str(EngNumber(np.float16(2.5))) == "2.50"
+    assert str(EngNumber(np.int32(220000))) == "220k"
+    assert str(EngUnit(np.float32(4.7e3), unit="ohm")) == "4.70kohm"
+
+
+def test_array_protocol():
+    values = np.array([EngNumber("4.7k"), EngNumber("100n"), EngUnit("2.2kohm")])
+    assert values.dtype == np.float64
+    assert values.tolist() == [4700.0, 1e-7, 2200.0]
+    assert np.asarray(EngNumber("1k"), dtype=np.float32).dtype == np.float32
+
+    # operators defer to numpy instead of failing on the array
+    assert (EngNumber("1k") + np.arange(3)).tolist() == [1000.0, 1001.0, 1002.0]
+    assert (EngNumber("1k") < np.array([500, 1500])).tolist() == [False, True]
+
+
+def test_eng_array_repr():
+    values = EngArray(["1k", "2.2k", "4.7k"], unit="ohm")
+    assert repr(values) == "EngArray([1kohm, 2.20kohm, 4.70kohm])"
+    assert str(values) == "[1kohm 2.20kohm 4.70kohm]"
+    assert str(EngArray([[0.0, 1e3], [1.5e-9, 2e6]])) == "[[0 1k]\n [1.50n 2M]]"
+    assert repr(EngArray([1234.5], precision=1)) == "EngArray([1.2k])"
+
+
+def test_eng_array_arithmetic():
+    ohms = EngArray([1e3, 2.2e3, 4.7e3], unit="ohm")
+
+    total = ohms + ohms
+    assert isinstance(total, EngArray)
+    assert total.unit == "ohm"
+    assert total.data.tolist() == [2e3, 4.4e3, 9.4e3]
+    assert (ohms - EngUnit("1kohm")).data.tolist() == [0.0, 1.2e3, 3.7e3]
+    assert (EngUnit("1kohm") + ohms).unit == "ohm"
+    assert (ohms * 2).unit == "ohm"
+    assert (2 * ohms).data.tolist() == [2e3, 4.4e3, 9.4e3]
+
+    volts = ohms * EngUnit("2mA")
+    assert volts.unit == "V"
+    assert np.allclose(volts.data, [2.0, 4.4, 9.4])
+    assert (ohms / EngUnit("2s")).unit == "ohm/s"
+    assert (-ohms).unit == "ohm"
+    assert np.sqrt(ohms).unit is None
+
+    with pytest.raises(AttributeError):
+        ohms + 1
+    with pytest.raises(AttributeError):
+        ohms + EngArray([1.0], unit="F")
+
+
+def test_eng_array_comparisons():
+    ohms = EngArray([1e3, 2.2e3, 4.7e3], unit="ohm")
+
+    assert (ohms < "3kohm").tolist() == [True, True, False]
+    assert (ohms >= EngUnit("2.2kohm")).tolist() == [False, True, True]
+    assert (ohms == ohms).tolist() == [True, True, True]
+    assert (EngUnit("2kohm") < ohms).tolist() == [False, True, True]
+    assert ohms[np.asarray(ohms < "3kohm")].data.tolist() == [1e3, 2.2e3]
+
+    with pytest.raises(AttributeError):
+        ohms < 3000
+
+
+def test_eng_array_indexing():
+    ohms = EngArray(np.array([1e3, 2.2e3, 4.7e3]), unit="ohm", precision=3)
+
+    assert isinstance(ohms[0], EngUnit)
+    assert str(ohms[1]) == "2.200kohm"
+    assert isinstance(ohms[1:], EngArray)
+    assert len(ohms[1:]) == 2
+    assert [str(v) for v in EngArray([1e3, 2e3])] == ["1k", "2k"]
+    assert EngArray(ohms).unit == "ohm"
+    assert np.asarray(ohms).tolist() == [1e3, 2.2e3, 4.7e3]